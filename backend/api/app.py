@@ -1,32 +1,10 @@
-from matplotlib import pyplot as plt
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-
-# tu módulo (asumo que cada hex tiene .vertices con .x .y .z)
-from logica.objetos.hexagono import piso
+import sys
 
-def extruir_prisma(vertices_xyz, alto):
-    """
-    Recibe: lista [(x,y,z), ...] del polígono base (en orden CCW).
-    Devuelve: lista de caras (cada cara es lista de vértices 3D).
-    Caras = [tapa_superior, tapa_inferior, caras_laterales...]
-    """
-    # base inferior (z original)
-    base = [(x, y, z) for (x, y, z) in vertices_xyz]
-    # base superior (z + alto)
-    top  = [(x, y, z + alto) for (x, y, z) in vertices_xyz]
-
-    # tapa superior (mismo orden), tapa inferior (orden inverso para normales)
-    faces = [top, base[::-1]]
+from matplotlib import pyplot as plt
 
-    # caras laterales
-    n = len(vertices_xyz)
-    for i in range(n):
-        j = (i + 1) % n
-        v0b, v1b = base[i], base[j]
-        v1t, v0t = top[j], top[i]
-        faces.append([v0b, v1b, v1t, v0t])
+from logica.libreria.malla import extruir
+from logica.objetos.hexagono import grilla_anillos
 
-    return faces
 
 def set_axes_equal(ax):
     """Ajusta las escalas para que x, y, z usen la misma métrica (aspect 'equal' real en 3D)."""
@@ -50,35 +28,28 @@ if __name__ == "__main__":
     radio = 1.0         # controla "ancho/largo" (circunradio del hex)
     separacion = 0.25   # separación entre celdas en tu 'piso'
     alto = 0.4          # <<--- AHORA el alto del prisma (Z)
+    anillos = 1         # anillos de celdas alrededor de la central
 
-    # Genera hexágonos (en XY, z≈0 si así los entrega tu clase)
-    hexagonos = piso(radio, separacion)
+    # Genera la grilla de hexágonos y extruye todas las celdas de una vez
+    grilla = grilla_anillos(radio, anillos, separacion)
+    malla = extruir(grilla.vertices(), alto)
+
+    # Con una ruta: .stl/.obj/.gltf/.glb exporta la malla, .png/.svg guarda la vista
+    ruta = sys.argv[1] if len(sys.argv) > 1 else None
+    if ruta is not None and not ruta.endswith((".png", ".svg")):
+        malla.exportar(ruta)
 
     # Prepara figura 3D
     fig = plt.figure()
     ax = fig.add_subplot(111, projection="3d")
 
-    # Dibuja cada hex como prisma 3D
-    for h in hexagonos:
-        # Si tus objetos tienen método de rotación propio y lo quieres usar en 3D:
-        # h_rot = h.rotar_z(0).rotar_x(0)  # puedes ajustar si quieres, o dejar 0
-        h_rot = h  # sin rotación geométrica; la vista la controlamos con la cámara
-
-        # Lista (x,y,z) del polígono base
-        base_xyz = [(v.x, v.y, v.z) for v in h_rot.vertices]
-
-        # Construye caras del prisma
-        caras = extruir_prisma(base_xyz, alto)
-
-        # Crea la colección y añádela
-        poly = Poly3DCollection(
-            caras,
-            facecolors="lightblue",
-            edgecolors="black",
-            linewidths=0.8,
-            alpha=0.75
-        )
-        ax.add_collection3d(poly)
+    # Todo el piso en una sola colección
+    ax.add_collection3d(malla.coleccion(
+        facecolors="lightblue",
+        edgecolors="black",
+        linewidths=0.8,
+        alpha=0.75
+    ))
 
     # Límites de escena (ajústalo a tu grid)
     ax.set_xlim(-3, 3)
@@ -88,4 +59,7 @@ if __name__ == "__main__":
     set_axes_equal(ax)         # aspecto uniforme
     ax.view_init(elev=30, azim=35)  # “cámara” (ángulos de vista)
     ax.set_axis_off()          # sin ejes
-    plt.show()
+    if ruta is not None and ruta.endswith((".png", ".svg")):
+        fig.savefig(ruta)      # sin ventana (sirve con MPLBACKEND=Agg)
+    else:
+        plt.show()
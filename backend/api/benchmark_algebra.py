@@ -0,0 +1,54 @@
+import time
+
+import numpy as np
+
+from logica.libreria.algebra_vectorial import cruz_lote, matmul_lote
+
+# Cantidades de vectores a comparar
+TAMANOS = [1_000, 10_000, 100_000, 1_000_000]
+
+
+# Versiones originales (listas anidadas, un vector a la vez) como referencia
+def producto_punto_py(m1, m2):
+    resultado = [[0 for _ in range(len(m2[0]))] for _ in range(len(m1))]
+    for i in range(len(m1)):
+        for j in range(len(m2[0])):
+            for k in range(len(m1[0])):
+                resultado[i][j] += m1[i][k] * m2[k][j]
+    return resultado
+
+
+def producto_cruz_py(v1, v2):
+    x1, y1, z1 = v1[0][0], v1[1][0], v1[2][0]
+    x2, y2, z2 = v2[0][0], v2[1][0], v2[2][0]
+    return [[y1*z2 - z1*y2], [z1*x2 - x1*z2], [x1*y2 - y1*x2]]
+
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    theta = np.radians(30)
+    R = np.array([[np.cos(theta), -np.sin(theta), 0],
+                  [np.sin(theta), np.cos(theta), 0],
+                  [0, 0, 1]])
+    R_lista = R.tolist()
+
+    print(f"{'op':>8} {'N':>10} {'python (s)':>11} {'numpy (s)':>10} {'speedup':>9}")
+    for n in TAMANOS:
+        V = rng.random((n, 3))
+        W = rng.random((n, 3))
+        columnas = V[:, :, None].tolist()
+        columnas_w = W[:, :, None].tolist()
+
+        t_py = medir(lambda: [producto_punto_py(R_lista, v) for v in columnas])
+        t_np = medir(matmul_lote, R, V)
+        print(f"{'matmul':>8} {n:>10,} {t_py:>11.4f} {t_np:>10.5f} {t_py / t_np:>8.0f}x")
+
+        t_py = medir(lambda: [producto_cruz_py(a, b) for a, b in zip(columnas, columnas_w)])
+        t_np = medir(cruz_lote, V, W)
+        print(f"{'cruz':>8} {n:>10,} {t_py:>11.4f} {t_np:>10.5f} {t_py / t_np:>8.0f}x")
@@ -0,0 +1,31 @@
+import time
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.solver import matriz_aleatoria
+
+# Instancias fijas (n, semilla): mismas para ambos modos
+INSTANCIAS = [(9, 0), (10, 1), (11, 2)]
+
+
+def medir(rooms, A, modo, acotar):
+    inicio = time.perf_counter()
+    perm, score, stats = solve_backtracking(rooms, A, acotar=acotar, modo=modo)
+    dt = time.perf_counter() - inicio
+    return score, stats.nodes_expanded, dt
+
+
+if __name__ == "__main__":
+    print(f"{'n':>3} {'cota':>5} {'modo':>10} {'score':>6} {'nodos':>9} {'seg':>8} {'nodos/s':>11}")
+    for n, semilla in INSTANCIAS:
+        rooms = [f"R{i}" for i in range(n)]
+        A = matriz_aleatoria(n, semilla)
+        for acotar in (False, True):
+            base = None
+            for modo in ("recursivo", "pila"):
+                score, nodos, dt = medir(rooms, A, modo, acotar)
+                print(f"{n:>3} {str(acotar):>5} {modo:>10} {score:>6} {nodos:>9} "
+                      f"{dt:>8.3f} {nodos / dt:>11,.0f}")
+                if base is None:
+                    base = dt
+                else:
+                    print(f"{'':>3} {'':>5} {'speedup':>10} {base / dt:>6.2f}x")
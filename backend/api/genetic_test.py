@@ -1,47 +1,13 @@
-import json
-
 # Usa tus funciones
 from logica.algoritmo.genetico.backtracking import solve_backtracking
-from logica.objetos.nodo import Nodo, matriz_adyacencia
+from logica.libreria.restricciones import GrafoRestricciones
+from logica.objetos.nodo import matriz_adyacencia
 
 if __name__ == "__main__":
-    with open("restricciones.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    grafo = GrafoRestricciones.desde_json("restricciones.json")
     floor = 1
 
-    rooms = []
-
-    zero_pairs_all = data["zero_pairs"]
-
-    for a, b in zero_pairs_all:
-        n1 = next((n for n in rooms if n == a), None)
-        if not n1:
-            n1 = Nodo(a)
-            rooms.append(n1)
-
-        n2 = next((n for n in rooms if n == b), None)
-        if not n2:
-            n2 = Nodo(b)
-            rooms.append(n2)
-
-        n1.add_restriccion(n2)
-
-    prefs_all = data["preferences"]
-
-    for pref in prefs_all:
-        a, b = pref["pair"]
-
-        n1 = next((n for n in rooms if n == a), None)
-        if not n1:
-            n1 = Nodo(a)
-            rooms.append(n1)
-
-        n2 = next((n for n in rooms if n == b), None)
-        if not n2:
-            n2 = Nodo(b)
-            rooms.append(n2)
-
-        n1.add_preferencia(n2)
+    rooms = grafo.nodos
 
     for nodo in rooms:
         print(f"\nNodo: {nodo}")
@@ -75,6 +41,7 @@ if __name__ == "__main__":
     # print("Hijos lógicos generados:", stats.children_generated)
     # print("Hijos válidos (explorados):", stats.children_valid)
     # print("Hijos podados por A=0:", stats.children_pruned_zero)
+    # print("Hijos podados por cota:", stats.children_pruned_bound)
     # print("Layouts completos válidos:", stats.leaves_feasible)
     # print("Layouts completos inválidos (cierre anillo):", stats.leaves_infeasible)
     # print("Expansiones por profundidad (slot):", dict(
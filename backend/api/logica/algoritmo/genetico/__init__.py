@@ -1,8 +1,11 @@
 # ----------------------------
 # Instrumentación de búsqueda
 # ----------------------------
-from dataclasses import dataclass, field
-from typing import Dict
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
 
 
 @dataclass
@@ -11,6 +14,177 @@ class Stats:
     children_generated: int = 0        # hijos "lógicos" (antes de podar por A=0)
     children_valid: int = 0            # hijos que pasan filtros y se exploran
     children_pruned_zero: int = 0      # hijos descartados por A=0 (prohibidos)
+    children_pruned_bound: int = 0     # hijos descartados por cota (no pueden superar al mejor)
     leaves_feasible: int = 0           # layouts completos válidos
     leaves_infeasible: int = 0         # layouts completos inválidos (cierre anillo)
     depth_expansions: Dict[int, int] = field(default_factory=dict)  # expansiones por profundidad
+    generations: int = 0               # generaciones completadas (algoritmo genético)
+    evaluations: int = 0               # individuos evaluados (algoritmo genético)
+    proven_optimal: bool = False       # la búsqueda terminó y el resultado es el óptimo
+    stopped_by: Optional[str] = None   # "tiempo" | "nodos" | "cancelado" si se cortó antes
+    reduccion: Optional[dict] = None   # resumen del preproceso (ver preproceso.py)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, datos: dict) -> "Stats":
+        """Inverso de to_dict (acepta las claves de profundidad como texto, vía JSON)."""
+        datos = dict(datos)
+        datos["depth_expansions"] = {int(k): v for k, v in datos.get("depth_expansions", {}).items()}
+        return cls(**datos)
+
+    def exportar_json(self, ruta: Optional[str] = None, **extra) -> str:
+        """
+        Serializa las estadísticas (más los campos de 'extra', p. ej. el
+        puntaje final) a JSON. Si se indica 'ruta', además lo escribe ahí.
+        """
+        datos = self.to_dict()
+        datos["depth_expansions"] = {str(k): v for k, v in sorted(self.depth_expansions.items())}
+        datos.update(extra)
+        texto = json.dumps(datos, ensure_ascii=False, indent=2)
+        if ruta is not None:
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(texto)
+        return texto
+
+
+class Cancelacion:
+    """
+    Token de cancelación cooperativa. Por defecto envuelve un threading.Event;
+    para cancelar desde otro proceso basta pasar un evento compartido
+    (multiprocessing.Event() o Manager().Event()).
+    """
+
+    def __init__(self, evento=None) -> None:
+        self.evento = evento if evento is not None else threading.Event()
+
+    def cancelar(self) -> None:
+        self.evento.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self.evento.is_set()
+
+
+class Presupuesto:
+    """
+    Límites de una búsqueda: tiempo de reloj (segundos), nodos expandidos y
+    un token de Cancelacion opcional. Los solvers llaman iniciar() al empezar
+    y verificar(stats) en cada nodo; al agotarse, verificar() anota el motivo
+    en stats.stopped_by y devuelve True. El reloj y el token se consultan
+    cada 'cada' llamadas para que el chequeo cueste casi nada.
+    """
+
+    def __init__(self,
+                 tiempo_max: Optional[float] = None,
+                 nodos_max: Optional[int] = None,
+                 cancelacion: Optional[Cancelacion] = None,
+                 cada: int = 256) -> None:
+        self.tiempo_max = tiempo_max
+        self.nodos_max = nodos_max
+        self.cancelacion = cancelacion
+        self.cada = cada
+        self.iniciar()
+
+    def iniciar(self) -> None:
+        self._limite = None if self.tiempo_max is None else time.perf_counter() + self.tiempo_max
+        self._llamadas = 0
+
+    def motivo(self, stats: Stats) -> Optional[str]:
+        """Chequeo completo (sin muestreo): motivo de corte o None."""
+        if self.nodos_max is not None and stats.nodes_expanded >= self.nodos_max:
+            return "nodos"
+        if self.cancelacion is not None and self.cancelacion.cancelado:
+            return "cancelado"
+        if self._limite is not None and time.perf_counter() >= self._limite:
+            return "tiempo"
+        return None
+
+    def verificar(self, stats: Stats, completo: bool = False) -> bool:
+        """
+        completo=True consulta reloj y token siempre (para solvers que llaman
+        una vez por generación o por bloque en vez de por nodo).
+        """
+        if stats.stopped_by is not None:
+            return True
+        self._llamadas += 1
+        if self.nodos_max is not None and stats.nodes_expanded >= self.nodos_max:
+            stats.stopped_by = "nodos"
+            return True
+        if not completo and self._llamadas % self.cada:
+            return False
+        stats.stopped_by = self.motivo(stats)
+        return stats.stopped_by is not None
+
+
+@dataclass
+class Progreso:
+    """Foto del estado de una búsqueda en curso (ver Observador)."""
+    elapsed: float                     # segundos desde el inicio
+    nodes_expanded: int
+    nodes_per_sec: float
+    depth_histogram: Dict[int, int]
+    best_score: Optional[int]          # None mientras no haya incumbente
+    best_perm: Optional[List[int]]
+    prune_rate_zero: float             # children_pruned_zero / children_generated
+    prune_rate_bound: float            # children_pruned_bound / children_generated
+    final: bool = False                # True en la última notificación
+
+
+class Observador:
+    """
+    Notifica el avance de una búsqueda a 'callback(Progreso)' cada
+    'cada_nodos' nodos expandidos y/o cada 'cada_ms' milisegundos.
+    Los solvers llaman nodo() al expandir (barato: solo cuenta y, cada 64
+    nodos, mira el reloj) y finalizar() al terminar.
+    """
+
+    def __init__(self,
+                 callback: Callable[[Progreso], None],
+                 cada_nodos: Optional[int] = 10_000,
+                 cada_ms: Optional[float] = None) -> None:
+        self.callback = callback
+        self.cada_nodos = cada_nodos
+        self.cada_ms = cada_ms
+        self.ultimo: Optional[Progreso] = None
+        self.iniciar()
+
+    def iniciar(self) -> None:
+        self._inicio = self._ultima_vez = time.perf_counter()
+        self._pendientes = 0
+
+    def nodo(self, stats: Stats, best_score: int, best_perm: Optional[List[int]],
+             cantidad: int = 1) -> None:
+        self._pendientes += cantidad
+        if self.cada_nodos is not None and self._pendientes >= self.cada_nodos:
+            self.notificar(stats, best_score, best_perm)
+        elif self.cada_ms is not None and (cantidad > 1 or self._pendientes & 63 == 0) \
+                and (time.perf_counter() - self._ultima_vez) * 1000 >= self.cada_ms:
+            self.notificar(stats, best_score, best_perm)
+
+    def notificar(self, stats: Stats, best_score: int, best_perm: Optional[List[int]],
+                  final: bool = False) -> Progreso:
+        ahora = time.perf_counter()
+        elapsed = ahora - self._inicio
+        generados = stats.children_generated or 1
+        progreso = Progreso(
+            elapsed=elapsed,
+            nodes_expanded=stats.nodes_expanded,
+            nodes_per_sec=stats.nodes_expanded / elapsed if elapsed > 0 else 0.0,
+            depth_histogram=dict(stats.depth_expansions),
+            best_score=best_score if best_perm is not None else None,
+            best_perm=list(best_perm) if best_perm is not None else None,
+            prune_rate_zero=stats.children_pruned_zero / generados,
+            prune_rate_bound=stats.children_pruned_bound / generados,
+            final=final,
+        )
+        self._ultima_vez = ahora
+        self._pendientes = 0
+        self.ultimo = progreso
+        self.callback(progreso)
+        return progreso
+
+    def finalizar(self, stats: Stats, best_score: int,
+                  best_perm: Optional[List[int]]) -> Progreso:
+        return self.notificar(stats, best_score, best_perm, final=True)
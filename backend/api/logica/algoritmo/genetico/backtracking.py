@@ -1,8 +1,13 @@
 # ----------------------------
 # Backtracking con poda (DFS)
 # ----------------------------
-from typing import List, Optional
-from logica.algoritmo.genetico import Stats
+from typing import Callable, List, Optional
+from logica.algoritmo.genetico import Observador, Presupuesto, Stats
+from logica.algoritmo.genetico.evaluacion import matriz_listas
+from logica.objetos.grafo import bits
+
+# hook(pos, slots, score) opcional, llamado en cada nodo expandido (logging/debug)
+Hook = Callable[[int, list[int], int], None]
 
 
 def backtrack(stats: Stats,
@@ -13,11 +18,23 @@ def backtrack(stats: Stats,
               A: list[list[int]],
               n: int,
               zeros_count: list[int],
-              best: dict):
+              best: dict,
+              cota: Optional[dict] = None,
+              hook: Optional[Hook] = None,
+              observador: Optional[Observador] = None,
+              presupuesto: Optional[Presupuesto] = None,
+              simetria: Optional[list[int]] = None):
     # pos = índice de slot a llenar (1..N-1). Slot 0 ya está fijo (anchor).
+    # cota = None desactiva el branch-and-bound (ver cotas_optimistas).
+    # simetria[r] = gemelos que deben ir antes que r (ver preproceso.py).
+    if presupuesto is not None and presupuesto.verificar(stats):
+        return
     stats.nodes_expanded += 1
-    print("ejecutando back")
+    if hook is not None:
+        hook(pos, slots, current_score)
     stats.depth_expansions[pos] = stats.depth_expansions.get(pos, 0) + 1
+    if observador is not None:
+        observador.nodo(stats, best["score"], best["perm"])
 
     # ¿completamos todos los slots?
     if pos == n:
@@ -46,48 +63,304 @@ def backtrack(stats: Stats,
     # 1) mayor A[prev][r] (más score inmediato)
     # 2) más 'ceros' (r es más restrictiva ⇒ la atendemos antes)
     candidates.sort(key=lambda r: (-A[prev][r], -zeros_count[r]))
+    if simetria is not None:
+        # igual que backtrack_pila: r solo si ya se colocaron sus gemelos previos
+        rem = 0
+        for x in remaining:
+            rem |= 1 << x
+        candidates = [r for r in candidates if not rem & simetria[r]]
 
     for r in candidates:
         # Poda de cierre: si es el último slot, checa también con el anchor (slot 0)
         if pos == n-1 and A[r][slots[0]] == 0:
             continue
 
+        child_score = current_score + A[prev][r]
+        if cota is not None:
+            # Cota optimista de lo que falta tras colocar r: cada arista
+            # restante (r -> ... -> anchor) toca dos extremos, así que basta
+            # la mitad de las mejores aristas de cada extremo.
+            top2_resto = cota["resto_top2"] - cota["top2"][r]
+            optimista = child_score + \
+                (top2_resto + cota["top1"][r] + cota["top1"][slots[0]]) // 2
+            if optimista <= best["score"]:
+                stats.children_pruned_bound += 1
+                continue
+
         stats.children_valid += 1
         # Colocar r y continuar
         slots[pos] = r
         # sin mutar la lista original
         new_remaining = [x for x in remaining if x != r]
+        if cota is not None:
+            cota["resto_top2"] -= cota["top2"][r]
         backtrack(stats, slots, pos+1, new_remaining,
-                  current_score + A[prev][r],
-                  A, n, zeros_count, best)
+                  child_score,
+                  A, n, zeros_count, best, cota, hook, observador, presupuesto, simetria)
+        if cota is not None:
+            cota["resto_top2"] += cota["top2"][r]
         slots[pos] = -1
+        if stats.stopped_by is not None:
+            return
+
+
+def contar_prohibidos(A, n: int) -> list[int]:
+    """
+    MRV-ish: cuántos vecinos prohibidos (A=0, diagonal incluida) tiene cada
+    sala. Con un Grafo sale del bitset sin recorrer la fila.
+    """
+    if hasattr(A, "permitidos"):
+        return [n - m.bit_count() for m in A.permitidos]
+    return [sum(1 for j in range(n) if A[i][j] == 0) for i in range(n)]
+
+
+def ordenar_candidatos(A: list[list[int]], n: int,
+                       zeros_count: list[int]) -> tuple[list[list[int]], list[int]]:
+    """
+    Precalcula, una sola vez, para cada sala 'prev':
+    - orden[prev]: salas r con A[prev][r] != 0 ya ordenadas por
+      (-A[prev][r], -zeros_count[r], r), el mismo orden que usa backtrack().
+    - permitidos[prev]: las mismas salas como bitmask.
+    Con un Grafo los candidatos salen de su bitset (O(grado) por sala).
+    """
+    orden = []
+    permitidos = []
+    bitsets = A.permitidos if hasattr(A, "permitidos") else None
+    for prev in range(n):
+        fila = A[prev]
+        if bitsets is not None:
+            candidatos = bits(bitsets[prev])
+        else:
+            candidatos = (r for r in range(n) if r != prev and fila[r] != 0)
+        lista = sorted(candidatos, key=lambda r: (-fila[r], -zeros_count[r], r))
+        orden.append(lista)
+        mask = 0
+        for r in lista:
+            mask |= 1 << r
+        permitidos.append(mask)
+    return orden, permitidos
+
+
+def backtrack_pila(stats: Stats,
+                   slots: list[int],
+                   pos0: int,
+                   restantes: int,
+                   score0: int,
+                   A: list[list[int]],
+                   n: int,
+                   orden: list[list[int]],
+                   permitidos: list[int],
+                   top1: Optional[list[int]] = None,
+                   top2: Optional[list[int]] = None,
+                   compartido=None,
+                   lock=None,
+                   hook: Optional[Hook] = None,
+                   observador: Optional[Observador] = None,
+                   presupuesto: Optional[Presupuesto] = None,
+                   simetria: Optional[list[int]] = None):
+    """
+    Misma búsqueda que backtrack() (mismo orden, mismas podas, mismas Stats)
+    pero sin recursión ni listas nuevas por nodo:
+    - 'restantes' es un bitmask de salas por colocar.
+    - Los candidatos salen de orden[prev] (ordenados una sola vez).
+    - Una pila explícita por profundidad guarda el puntaje, el bitmask, la
+      suma de top2 pendiente y por dónde va cada lista de candidatos.
+    top1/top2 = None desactiva el branch-and-bound. compartido/lock son el
+    incumbente entre procesos (ver paralelo.py). 'observador' recibe cada
+    nodo expandido (ver Observador). Si 'presupuesto' se agota, corta y
+    devuelve el mejor incumbente hasta ese momento (stats.stopped_by dice por qué).
+    'simetria[r]' (opcional, ver preproceso.py) es el bitmask de gemelos que
+    deben colocarse antes que r: r se salta mientras alguno siga pendiente.
+    Devuelve (perm, score) del mejor layout encontrado.
+    """
+    anchor = slots[0]
+    acotar = top1 is not None
+    cota_anchor = top1[anchor] if acotar else 0
+    depth = stats.depth_expansions
+
+    best_score, best_perm = -10**9, None
+    score = [0]*(n+1)
+    resto = [0]*(n+1)
+    resto_top2 = [0]*(n+1)
+    cursor = [0]*(n+1)
+    score[pos0] = score0
+    resto[pos0] = restantes
+    if acotar:
+        resto_top2[pos0] = sum(top2[r] for r in range(n) if (restantes >> r) & 1)
+
+    pos = pos0
+    entrando = True
+    while True:
+        if entrando:
+            entrando = False
+            if presupuesto is not None and presupuesto.verificar(stats):
+                break
+            stats.nodes_expanded += 1
+            if hook is not None:
+                hook(pos, slots, score[pos])
+            depth[pos] = depth.get(pos, 0) + 1
+            if observador is not None:
+                observador.nodo(stats, best_score, best_perm)
+
+            if pos == n:
+                # Validar cierre del anillo (último con primero)
+                last = slots[n-1]
+                if A[last][anchor] == 0:
+                    stats.leaves_infeasible += 1
+                else:
+                    total = score[pos] + A[last][anchor]
+                    stats.leaves_feasible += 1
+                    if total > best_score:
+                        best_score, best_perm = total, slots.copy()
+                        if compartido is not None:
+                            with lock:
+                                if total > compartido.value:
+                                    compartido.value = total
+                pos -= 1
+                if pos < pos0:
+                    break
+                continue
+
+            rem = resto[pos]
+            k = rem.bit_count()
+            stats.children_generated += k
+            stats.children_pruned_zero += k - (permitidos[slots[pos-1]] & rem).bit_count()
+            cursor[pos] = 0
+
+        prev = slots[pos-1]
+        lista = orden[prev]
+        rem = resto[pos]
+        i = cursor[pos]
+        while i < len(lista):
+            r = lista[i]
+            i += 1
+            if not (rem >> r) & 1:
+                continue
+            # Gemelos: solo se explora el orden canónico
+            if simetria is not None and rem & simetria[r]:
+                continue
+            # Poda de cierre en el último slot
+            if pos == n-1 and A[r][anchor] == 0:
+                continue
+            child_score = score[pos] + A[prev][r]
+            if acotar:
+                optimista = child_score + \
+                    (resto_top2[pos] - top2[r] + top1[r] + cota_anchor) // 2
+                # Contra el incumbente de otro proceso la poda es estricta: un
+                # empate ahí todavía puede ser el layout que elegiría la versión serial.
+                if optimista <= best_score or \
+                        (compartido is not None and optimista < compartido.value):
+                    stats.children_pruned_bound += 1
+                    continue
+                resto_top2[pos+1] = resto_top2[pos] - top2[r]
+            stats.children_valid += 1
+            cursor[pos] = i
+            slots[pos] = r
+            score[pos+1] = child_score
+            resto[pos+1] = rem & ~(1 << r)
+            pos += 1
+            entrando = True
+            break
+        else:
+            # sin más hijos: volver al padre
+            slots[pos] = -1
+            pos -= 1
+            if pos < pos0:
+                break
+
+    return best_perm, best_score
+
+
+def cotas_optimistas(A: list[list[int]], n: int) -> tuple[list[int], list[int]]:
+    """
+    Para cada sala i: top1[i] = su mejor arista y top2[i] = la suma de sus dos
+    mejores aristas (usando max(A[i][j], A[j][i]) por si A no es simétrica).
+    En un anillo cada sala pendiente aporta exactamente dos aristas y los
+    extremos del camino parcial una, de ahí la cota (sum top2 + top1 + top1) / 2.
+    """
+    top1 = [0]*n
+    top2 = [0]*n
+    for i in range(n):
+        pesos = sorted((max(A[i][j], A[j][i]) for j in range(n) if j != i),
+                       reverse=True)
+        top1[i] = pesos[0] if pesos else 0
+        top2[i] = sum(pesos[:2])
+    return top1, top2
 
 
 def solve_backtracking(rooms: List[str],
                        A: List[List[int]],
-                       anchor_room: Optional[str] = None):
+                       anchor_room: Optional[str] = None,
+                       acotar: bool = True,
+                       modo: str = "pila",
+                       hook: Optional[Hook] = None,
+                       observador: Optional[Observador] = None,
+                       presupuesto: Optional[Presupuesto] = None,
+                       simetria: Optional[list[int]] = None):
     """
     - Fija anchor_room en slot 0 para romper simetría.
     - Coloca el resto sala a sala (slots 1..N-1), podando si A=0 con el vecino ya colocado.
     - Heurística:
         * Ordena candidatos por A[prev][r] (ganancia inmediata) y, de tie-breaker,
           por cuántos 'ceros' tiene r (más restrictiva primero).
+    - Branch-and-bound (acotar=True): descarta hijos cuyo puntaje más una cota
+      optimista admisible no supera al mejor encontrado. Sigue siendo exacto y
+      devuelve el mismo layout que sin cota.
+    - modo="pila" (por defecto) usa backtrack_pila (bitmask, candidatos
+      preordenados, sin recursión); modo="recursivo" usa backtrack().
+    - hook(pos, slots, score) opcional en cada nodo, para logging.
+    - observador (opcional) recibe el progreso cada K nodos / T ms.
+    - presupuesto (opcional) corta por tiempo, nodos o cancelación y devuelve
+      el mejor incumbente; stats.proven_optimal indica si se probó el óptimo.
+    - simetria (opcional) fija el orden de salas gemelas, en ambos modos.
     """
+    if modo not in ("pila", "recursivo"):
+        raise ValueError(f"Modo desconocido: {modo!r} (opciones: pila, recursivo)")
     n = len(rooms)
     idx = {r: i for i, r in enumerate(rooms)}
     if anchor_room is None:
         anchor_room = rooms[0]
     anchor = idx[anchor_room]
 
+    A = matriz_listas(A)
     slots = [-1]*n
     slots[0] = anchor
     remaining = [i for i in range(n) if i != anchor]
 
     stats = Stats()
+    if observador is not None:
+        observador.iniciar()
+    if presupuesto is not None:
+        presupuesto.iniciar()
 
     # MRV-ish: cuántos vecinos prohibidos tiene cada sala
-    zeros_count = [sum(1 for j in range(n) if A[i][j] == 0) for i in range(n)]
+    zeros_count = contar_prohibidos(A, n)
+
+    top1 = top2 = None
+    if acotar:
+        top1, top2 = cotas_optimistas(A, n)
+
+    if modo == "pila":
+        orden, permitidos = ordenar_candidatos(A, n, zeros_count)
+        restantes = 0
+        for i in remaining:
+            restantes |= 1 << i
+        perm, score = backtrack_pila(stats, slots, 1, restantes, 0, A, n,
+                                     orden, permitidos, top1, top2,
+                                     hook=hook, observador=observador,
+                                     presupuesto=presupuesto, simetria=simetria)
+    else:
+        cota = None
+        if acotar:
+            cota = {"top1": top1, "top2": top2,
+                    "resto_top2": sum(top2[i] for i in remaining)}
+
+        best = {"score": -10**9, "perm": None}
+        backtrack(stats, slots, 1, remaining, 0, A, n, zeros_count, best,
+                  cota, hook, observador, presupuesto, simetria)
+        perm, score = best["perm"], best["score"]
 
-    best = {"score": -10**9, "perm": None}
-    backtrack(stats, slots, 1, remaining, 0, A, n, zeros_count, best)
-    return best["perm"], best["score"], stats
+    stats.proven_optimal = stats.stopped_by is None
+    if observador is not None:
+        observador.finalizar(stats, score, perm)
+    return perm, score, stats
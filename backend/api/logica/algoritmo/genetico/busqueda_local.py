@@ -0,0 +1,200 @@
+# ----------------------------------------
+# Búsqueda local (2-opt / Or-opt / swap)
+# ----------------------------------------
+import random
+import time
+from typing import List, Optional
+
+from logica.algoritmo.genetico import Observador, Presupuesto, Stats
+from logica.algoritmo.genetico.evaluacion import (delta_2opt, delta_or_opt,
+                                                  delta_swap, es_simetrica,
+                                                  evaluate_perm, matriz_listas)
+from logica.objetos.grafo import bits
+
+
+def anillo_greedy(A: list[list[int]], n: int, anchor: int,
+                  rng: Optional[random.Random] = None) -> Optional[list[int]]:
+    """
+    Construye un anillo desde el anchor eligiendo siempre el vecino permitido
+    de mayor A (con rng, al azar entre los permitidos, ponderado por A).
+    Devuelve None si se queda sin vecinos permitidos o el cierre es A=0.
+    Con un Grafo las opciones salen de su bitset (sin recorrer las libres).
+    """
+    perm = [anchor]
+    libres = set(range(n)) - {anchor}
+    bitsets = A.permitidos if hasattr(A, "permitidos") else None
+    mascara = ((1 << n) - 1) & ~(1 << anchor)
+    while libres:
+        prev = perm[-1]
+        if bitsets is not None:
+            opciones = list(bits(bitsets[prev] & mascara))
+        else:
+            opciones = [r for r in libres if A[prev][r] != 0]
+        if not opciones:
+            return None
+        if rng is None:
+            r = max(opciones, key=lambda r: (A[prev][r], -r))
+        else:
+            r = rng.choices(opciones, weights=[max(1, A[prev][r]) for r in opciones])[0]
+        perm.append(r)
+        libres.discard(r)
+        mascara &= ~(1 << r)
+    # con una sola sala el cierre es A[anchor][anchor], como en los exactos
+    if A[perm[-1]][anchor] == 0:
+        return None
+    return perm
+
+
+def _aplicar_or_opt(perm: list[int], i: int, largo: int, k: int, invertir: bool) -> None:
+    tramo = perm[i:i+largo]
+    if invertir:
+        tramo.reverse()
+    del perm[i:i+largo]
+    destino = k + 1 if k < i else k + 1 - largo
+    perm[destino:destino] = tramo
+
+
+def mejorar(perm: list[int], A: list[list[int]], stats: Stats,
+            limite: Optional[float] = None,
+            presupuesto: Optional[Presupuesto] = None,
+            simetrica: Optional[bool] = None) -> int:
+    """
+    Mejora 'perm' in-place con primer-mejor sobre los vecindarios swap, 2-opt y
+    Or-opt (tramos de 1 a 3, en ambos sentidos) hasta un óptimo local o hasta
+    'limite' (time.perf_counter()) o hasta agotar 'presupuesto'. El slot 0 nunca se mueve. Solo se aceptan
+    movimientos que mejoran y dejan todas las aristas nuevas con A != 0.
+    Los deltas de 2-opt y de Or-opt invertido suponen A simétrica: si no
+    lo es ('simetrica', o es_simetrica(A) si no se pasa) esos movimientos
+    no se prueban. Devuelve el puntaje final.
+    """
+    n = len(perm)
+    score = evaluate_perm(perm, A)
+    if simetrica is None:
+        simetrica = es_simetrica(A)
+    sentidos = (False, True) if simetrica else (False,)
+
+    def agotado() -> bool:
+        if presupuesto is not None and presupuesto.verificar(stats):
+            return True
+        return limite is not None and time.perf_counter() >= limite
+
+    mejoro = True
+    while mejoro:
+        mejoro = False
+
+        # 2-opt: invertir perm[i..j] (el delta supone A simétrica)
+        if simetrica:
+            for i in range(1, n - 1):
+                if agotado():
+                    return score
+                for j in range(i + 1, n):
+                    stats.nodes_expanded += 1
+                    d, ok = delta_2opt(perm, A, i, j)
+                    if ok and d > 0:
+                        perm[i:j+1] = perm[i:j+1][::-1]
+                        score += d
+                        stats.children_valid += 1
+                        mejoro = True
+
+        # Or-opt: mover el tramo perm[i..i+largo-1] a continuación de perm[k]
+        # (flag propio: que 2-opt ya haya mejorado no debe cortar este bloque)
+        movio = False
+        for largo in (1, 2, 3):
+            for i in range(1, n - largo + 1):
+                if agotado():
+                    return score
+                for k in range(n):
+                    if i - 1 <= k < i + largo:
+                        continue
+                    for invertir in sentidos:
+                        stats.nodes_expanded += 1
+                        d, ok = delta_or_opt(perm, A, i, largo, k, invertir)
+                        if ok and d > 0:
+                            _aplicar_or_opt(perm, i, largo, k, invertir)
+                            score += d
+                            stats.children_valid += 1
+                            movio = True
+                            break
+                    if movio:
+                        break
+                if movio:
+                    break
+            if movio:
+                break
+        mejoro |= movio
+
+        # swap de dos salas
+        for i in range(1, n - 1):
+            if agotado():
+                return score
+            for j in range(i + 1, n):
+                stats.nodes_expanded += 1
+                d, ok = delta_swap(perm, A, i, j)
+                if ok and d > 0:
+                    perm[i], perm[j] = perm[j], perm[i]
+                    score += d
+                    stats.children_valid += 1
+                    mejoro = True
+    return score
+
+
+def solve_busqueda_local(rooms: List[str],
+                         A: List[List[int]],
+                         anchor_room: Optional[str] = None,
+                         tiempo_max: float = 0.05,
+                         reinicios: int = 50,
+                         semilla: Optional[int] = 0,
+                         observador: Optional[Observador] = None,
+                         presupuesto: Optional[Presupuesto] = None):
+    """
+    Optimizador "anytime" para pisos grandes:
+    - Arranca del anillo greedy y luego de anillos greedy aleatorizados
+      (hasta 'reinicios' veces), siempre con el anchor en slot 0.
+    - Cada arranque se lleva a un óptimo local con swap, 2-opt y Or-opt
+      usando deltas O(1) (ver evaluacion.py); con A no simétrica, sin los
+      movimientos que invierten tramos.
+    - Se detiene al agotar 'tiempo_max' (segundos) y devuelve el mejor.
+    - 'observador' recibe el avance al terminar cada arranque.
+    - 'presupuesto' (tiempo, nodos = movimientos evaluados, cancelación)
+      corta antes que 'tiempo_max' si se agota primero.
+    Devuelve (perm, score, Stats) como solve_backtracking. No garantiza el
+    óptimo; perm es None si ningún arranque fue factible.
+    """
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    A = matriz_listas(A)
+    simetrica = es_simetrica(A)
+    rng = random.Random(semilla)
+    stats = Stats()
+    limite = time.perf_counter() + tiempo_max
+    if observador is not None:
+        observador.iniciar()
+    if presupuesto is not None:
+        presupuesto.iniciar()
+
+    best_perm, best_score = None, -10**9
+    for intento in range(reinicios + 1):
+        if intento > 0 and time.perf_counter() >= limite:
+            break
+        if presupuesto is not None and presupuesto.verificar(stats, completo=True):
+            break
+        perm = anillo_greedy(A, n, anchor, None if intento == 0 else rng)
+        if perm is None:
+            stats.leaves_infeasible += 1
+            continue
+        stats.leaves_feasible += 1
+        antes = stats.nodes_expanded
+        score = mejorar(perm, A, stats, limite, presupuesto, simetrica)
+        if score > best_score:
+            best_perm, best_score = perm, score
+        if observador is not None:
+            observador.nodo(stats, best_score, best_perm,
+                            cantidad=max(1, stats.nodes_expanded - antes))
+
+    if observador is not None:
+        observador.finalizar(stats, best_score, best_perm)
+    return best_perm, best_score, stats
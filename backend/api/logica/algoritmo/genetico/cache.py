@@ -0,0 +1,183 @@
+# ----------------------------------------
+# Cache de soluciones por instancia
+# ----------------------------------------
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.evaluacion import matriz_densa
+
+
+def clave_canonica(rooms: List[str], A, anchor_room: Optional[str] = None) -> str:
+    """
+    Hash de la instancia (salas, anchor, A) que no depende del orden en que
+    vienen las salas: se ordenan por nombre y A se permuta igual.
+    """
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    orden = sorted(range(len(rooms)), key=lambda i: rooms[i])
+    A = matriz_densa(A)
+    A_canonica = A[np.ix_(orden, orden)].tolist()
+    texto = json.dumps({"rooms": [rooms[i] for i in orden],
+                        "anchor": anchor_room,
+                        "A": A_canonica},
+                       ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheSoluciones:
+    """
+    Cache LRU de resultados óptimos, indexado por clave_canonica().
+    - Solo guarda resultados con stats.proven_optimal: una búsqueda cortada
+      por presupuesto no es reutilizable.
+    - El layout se guarda por nombre de sala, así un hit sirve aunque las
+      salas lleguen en otro orden (la perm se traduce a los índices del que
+      pregunta).
+    - 'directorio' activa un segundo nivel en disco (un JSON por clave) que
+      sobrevive reinicios; 'max_disco' limita cuántos archivos se conservan.
+    - hits/misses cuentan las consultas (ver estadisticas()).
+    """
+
+    def __init__(self,
+                 max_entradas: int = 256,
+                 directorio: Optional[str] = None,
+                 max_disco: Optional[int] = 10_000) -> None:
+        self.max_entradas = max_entradas
+        self.directorio = directorio
+        self.max_disco = max_disco
+        self.hits = 0
+        self.misses = 0
+        self.hits_disco = 0
+        self._memoria: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+
+    # ---------- niveles ----------
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, f"{clave}.json")
+
+    def _recordar(self, clave: str, entrada: dict) -> None:
+        self._memoria[clave] = entrada
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_entradas:
+            self._memoria.popitem(last=False)
+
+    def _leer_disco(self, clave: str) -> Optional[dict]:
+        if self.directorio is None:
+            return None
+        try:
+            with open(self._ruta(clave), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _escribir_disco(self, clave: str, entrada: dict) -> None:
+        if self.directorio is None:
+            return
+        ruta = self._ruta(clave)
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(entrada, f, ensure_ascii=False)
+        os.replace(temporal, ruta)  # atómico: otro proceso nunca lee a medias
+        if self.max_disco is not None:
+            archivos = [os.path.join(self.directorio, a) for a in os.listdir(self.directorio)
+                        if a.endswith(".json")]
+            if len(archivos) > self.max_disco:
+                archivos.sort(key=os.path.getmtime)
+                for viejo in archivos[:len(archivos) - self.max_disco]:
+                    try:
+                        os.remove(viejo)
+                    except OSError:
+                        pass
+
+    # ---------- API ----------
+    def obtener(self, rooms: List[str], A, anchor_room: Optional[str] = None,
+                clave: Optional[str] = None) -> Optional[Tuple[Optional[List[int]], int, Stats]]:
+        """(perm, score, Stats) guardados para la instancia, o None (miss)."""
+        clave = clave or clave_canonica(rooms, A, anchor_room)
+        with self._lock:
+            entrada = self._memoria.get(clave)
+            if entrada is not None:
+                self._memoria.move_to_end(clave)
+            else:
+                entrada = self._leer_disco(clave)
+                if entrada is not None:
+                    self.hits_disco += 1
+                    self._recordar(clave, entrada)
+            if entrada is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        idx = {r: i for i, r in enumerate(rooms)}
+        perm = [idx[r] for r in entrada["layout"]] if entrada["layout"] is not None else None
+        return perm, entrada["score"], Stats.from_dict(entrada["stats"])
+
+    def guardar(self, rooms: List[str], A, anchor_room: Optional[str],
+                perm: Optional[List[int]], score: int, stats: Stats,
+                clave: Optional[str] = None) -> bool:
+        """Guarda el resultado si es óptimo probado. Devuelve si se guardó."""
+        if not stats.proven_optimal:
+            return False
+        clave = clave or clave_canonica(rooms, A, anchor_room)
+        entrada = {
+            "layout": [rooms[i] for i in perm] if perm is not None else None,
+            "score": score,
+            "stats": json.loads(stats.exportar_json()),
+        }
+        with self._lock:
+            self._recordar(clave, entrada)
+            self._escribir_disco(clave, entrada)
+        return True
+
+    def resolver(self, solver: Callable, rooms: List[str], A,
+                 anchor_room: Optional[str] = None, **opciones):
+        """
+        Igual que solver(rooms, A, anchor_room, **opciones) pero consultando
+        antes el cache. En un hit el observador (si hay) recibe solo la
+        notificación final.
+        """
+        clave = clave_canonica(rooms, A, anchor_room)
+        guardado = self.obtener(rooms, A, anchor_room, clave=clave)
+        if guardado is not None:
+            observador = opciones.get("observador")
+            if observador is not None:
+                observador.iniciar()
+                observador.finalizar(guardado[2], guardado[1], guardado[0])
+            return guardado
+        perm, score, stats = solver(rooms, A, anchor_room, **opciones)
+        self.guardar(rooms, A, anchor_room, perm, score, stats, clave=clave)
+        return perm, score, stats
+
+    @property
+    def hit_rate(self) -> float:
+        consultas = self.hits + self.misses
+        return self.hits / consultas if consultas else 0.0
+
+    def estadisticas(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hits_disco": self.hits_disco,
+            "hit_rate": self.hit_rate,
+            "entradas": len(self._memoria),
+            "max_entradas": self.max_entradas,
+            "directorio": self.directorio,
+        }
+
+    def limpiar(self, disco: bool = False) -> None:
+        """Vacía la memoria (y el directorio si disco=True) y reinicia contadores."""
+        with self._lock:
+            self._memoria.clear()
+            self.hits = self.misses = self.hits_disco = 0
+            if disco and self.directorio is not None:
+                for a in os.listdir(self.directorio):
+                    if a.endswith(".json"):
+                        os.remove(os.path.join(self.directorio, a))
@@ -0,0 +1,181 @@
+# ----------------------------
+# Evaluación de anillos
+# ----------------------------
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from logica.objetos.grafo import bits
+
+
+def matriz_densa(A, dtype=np.int64) -> np.ndarray:
+    """A como ndarray (listas, ndarray o MatrizCSR; sin copia si ya lo es)."""
+    return np.asarray(A, dtype=dtype)
+
+
+def matriz_listas(A) -> List[List[int]]:
+    """
+    A como listas de int de Python, que es lo más rápido para los solvers
+    que recorren A[i][j] escalar por escalar. Acepta listas, ndarray o
+    MatrizCSR; una lista de listas se devuelve tal cual. Un Grafo también
+    se devuelve tal cual: ya indexa en O(1) sin densificar (N grande).
+    """
+    if hasattr(A, "permitidos"):
+        return A
+    if isinstance(A, list) and all(isinstance(f, list) for f in A):
+        return A
+    if isinstance(A, (list, tuple)):
+        return [list(f) for f in A]
+    return np.asarray(A).tolist()
+
+
+def evaluate_perm(perm: List[int], A: List[List[int]]) -> int:
+    """Suma de compatibilidades entre vecinos del anillo (circular)."""
+    n = len(perm)
+    s = 0
+    for i in range(n):
+        j = (i+1) % n
+        s += A[perm[i]][perm[j]]
+    return s
+
+
+def puntaje_factible(perm: Optional[List[int]], A) -> Optional[int]:
+    """
+    evaluate_perm(perm, A) si perm es una permutación de las N salas sin
+    aristas A=0 (cierre incluido); None si no lo es.
+    """
+    n = len(A)
+    if perm is None or sorted(perm) != list(range(n)):
+        return None
+    aristas = [A[perm[k]][perm[(k+1) % n]] for k in range(n)]
+    return sum(aristas) if all(aristas) else None
+
+
+def es_simetrica(A) -> bool:
+    """
+    A[i][j] == A[j][i] para todo par. Con un Grafo se recorren solo las
+    aristas permitidas (sin densificar).
+    """
+    if hasattr(A, "permitidos"):
+        mascaras = A.permitidos
+        return all((mascaras[j] >> i) & 1 and A[j][i] == A[i][j]
+                   for i, m in enumerate(mascaras) for j in bits(m))
+    M = matriz_densa(A)
+    return bool(np.array_equal(M, M.T))
+
+
+def pesos_anillo(perms: np.ndarray, A) -> np.ndarray:
+    """
+    Pesos de todas las aristas de un lote de anillos.
+    perms: (M x N) enteros, una permutación por fila.
+    Devuelve (M x N) con A[perm[k], perm[k+1]] (la última columna es el cierre).
+    """
+    A = np.asarray(A)
+    perms = np.asarray(perms, dtype=np.intp)
+    if perms.ndim == 1:
+        perms = perms[None, :]
+    n = A.shape[0]
+    sig = np.arange(1, perms.shape[1] + 1) % perms.shape[1]
+    # Un solo gather sobre A aplanada: evita el costo de la indexación 2D
+    return A.ravel()[perms * n + perms[:, sig]]
+
+
+def evaluar_lote(perms: np.ndarray, A) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa M anillos en una sola llamada vectorizada.
+    Devuelve (scores, factible): scores[k] es la suma del anillo k (cierre
+    incluido) y factible[k] es False si alguna de sus aristas tiene A=0.
+    """
+    pesos = pesos_anillo(perms, A)
+    return pesos.sum(axis=1), (pesos != 0).all(axis=1)
+
+
+# -------------------------------------------------
+# Deltas O(1) para movimientos locales sobre un anillo
+# -------------------------------------------------
+# Cada función devuelve (delta, factible): cuánto cambia el puntaje si se
+# aplica el movimiento y si todas las aristas nuevas tienen A != 0. No
+# modifican 'perm'. Para N <= 3 todos los vecinos se solapan y se recurre a
+# evaluar el anillo completo (que igual es O(1)).
+
+def _delta_completo(perm: List[int], A, nuevo: List[int]) -> Tuple[int, bool]:
+    n = len(nuevo)
+    aristas = [A[nuevo[k]][nuevo[(k+1) % n]] for k in range(n)]
+    return sum(aristas) - evaluate_perm(perm, A), all(aristas)
+
+
+def delta_swap(perm: List[int], A, i: int, j: int) -> Tuple[int, bool]:
+    """Intercambia las salas de las posiciones i y j."""
+    n = len(perm)
+    if i == j:
+        return 0, True
+    if i > j:
+        i, j = j, i
+    if n <= 3:
+        nuevo = list(perm)
+        nuevo[i], nuevo[j] = nuevo[j], nuevo[i]
+        return _delta_completo(perm, A, nuevo)
+
+    b, e = perm[i], perm[j]
+    if j == i + 1:
+        # ... a b e f ...  ->  ... a e b f ...
+        a, f = perm[i-1], perm[(j+1) % n]
+        quitadas = (A[a][b], A[b][e], A[e][f])
+        nuevas = (A[a][e], A[e][b], A[b][f])
+    elif i == 0 and j == n - 1:
+        # ... d e | b c ...  ->  ... d b | e c ...  (vecinos por el cierre)
+        d, c = perm[j-1], perm[i+1]
+        quitadas = (A[d][e], A[e][b], A[b][c])
+        nuevas = (A[d][b], A[b][e], A[e][c])
+    else:
+        a, c = perm[i-1], perm[i+1]
+        d, f = perm[j-1], perm[(j+1) % n]
+        quitadas = (A[a][b], A[b][c], A[d][e], A[e][f])
+        nuevas = (A[a][e], A[e][c], A[d][b], A[b][f])
+    return sum(nuevas) - sum(quitadas), all(nuevas)
+
+
+def delta_2opt(perm: List[int], A, i: int, j: int) -> Tuple[int, bool]:
+    """
+    Invierte el tramo perm[i..j] (i <= j). Solo cambian las dos aristas de los
+    bordes, por eso asume A simétrica (las aristas internas solo cambian de
+    sentido).
+    """
+    n = len(perm)
+    if i > j:
+        i, j = j, i
+    if j - i + 1 >= n - 1:
+        # invertir todo (o todo menos una sala) es el mismo anillo al revés
+        return 0, all(A[perm[k]][perm[(k+1) % n]] for k in range(n))
+    a, b = perm[i-1], perm[i]
+    c, d = perm[j], perm[(j+1) % n]
+    nueva1, nueva2 = A[a][c], A[b][d]
+    return nueva1 + nueva2 - A[a][b] - A[c][d], nueva1 != 0 and nueva2 != 0
+
+
+def delta_or_opt(perm: List[int], A, i: int, largo: int, k: int,
+                 invertir: bool = False) -> Tuple[int, bool]:
+    """
+    Mueve el tramo perm[i..i+largo-1] para que quede a continuación de perm[k]
+    (k fuera del tramo y distinto de i-1), opcionalmente invertido. Con
+    invertir=True asume A simétrica.
+    """
+    n = len(perm)
+    if n <= 3:
+        nuevo = list(perm)
+        tramo = nuevo[i:i+largo]
+        if invertir:
+            tramo.reverse()
+        del nuevo[i:i+largo]
+        destino = k + 1 if k < i else k + 1 - largo
+        nuevo[destino:destino] = tramo
+        return _delta_completo(perm, A, nuevo)
+
+    p, q = perm[i-1], perm[(i+largo) % n]
+    s0, s1 = perm[i], perm[i+largo-1]
+    if invertir:
+        s0, s1 = s1, s0
+    x, y = perm[k], perm[(k+1) % n]
+    nuevas = (A[p][q], A[x][s0], A[s1][y])
+    quitadas = A[p][perm[i]] + A[perm[i+largo-1]][q] + A[x][y]
+    return sum(nuevas) - quitadas, all(nuevas)
@@ -0,0 +1,240 @@
+# ----------------------------
+# Algoritmo genético
+# ----------------------------
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from logica.algoritmo.genetico import Observador, Presupuesto, Stats
+from logica.algoritmo.genetico.evaluacion import matriz_densa, pesos_anillo
+
+
+def _evaluar_poblacion(perms: np.ndarray, A: np.ndarray):
+    """
+    Evalúa toda la población de una vez.
+    perms: (P x N) con el anchor en la columna 0.
+    Devuelve (scores, ceros): suma de aristas del anillo y cuántas de ellas
+    son A=0 (incluida la de cierre).
+    """
+    pesos = pesos_anillo(perms, A)
+    return pesos.sum(axis=1), (pesos == 0).sum(axis=1)
+
+
+def _reparar(perm: np.ndarray, Z: np.ndarray, intentos: int) -> None:
+    """
+    Reparación in-place de aristas prohibidas (Z = A != 0) con movimientos 2-opt
+    que nunca mueven el slot 0: para la primera arista mala (i, i+1) busca un
+    segmento [a..b] que la contenga en un extremo y cuya inversión deje ambas
+    aristas nuevas permitidas. Asume A simétrica.
+    """
+    n = len(perm)
+    sig = np.arange(1, n + 1) % n
+    for _ in range(intentos):
+        malos = np.flatnonzero(~Z[perm, perm[sig]])
+        if len(malos) == 0:
+            return
+        i = int(malos[0])
+        # segmentos [i+1..b] (la arista mala queda a la izquierda)
+        if i + 1 <= n - 1:
+            a = i + 1
+            bs = np.arange(a + 1, n)
+            ok = Z[perm[i], perm[bs]] & Z[perm[a], perm[sig[bs]]]
+            if ok.any():
+                b = int(bs[np.argmax(ok)])
+                perm[a:b + 1] = perm[a:b + 1][::-1]
+                continue
+        # segmentos [a..i] (la arista mala queda a la derecha)
+        if i >= 1:
+            b = i
+            as_ = np.arange(1, b)
+            ok = Z[perm[as_ - 1], perm[b]] & Z[perm[as_], perm[sig[b]]]
+            if ok.any():
+                a = int(as_[np.argmax(ok)])
+                perm[a:b + 1] = perm[a:b + 1][::-1]
+                continue
+        return  # sin movimiento que arregle esta arista
+
+
+def _corte(m: int, rng: np.random.Generator) -> tuple[int, int]:
+    """Dos puntos de corte 0 <= a < b <= m (más barato que rng.choice)."""
+    a, b = sorted(rng.integers(m + 1, size=2))
+    if a == b:
+        b = a + 1 if b < m else b
+        a = b - 1
+    return int(a), int(b)
+
+
+def _cruce_ox(p1: np.ndarray, p2: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Order crossover (OX): copia un tramo de p1 y completa en el orden de p2."""
+    m = len(p1)
+    a, b = _corte(m, rng)
+    hijo = np.empty_like(p1)
+    hijo[a:b] = p1[a:b]
+    en_tramo = np.zeros(max(p1.max(), p2.max()) + 1, dtype=bool)
+    en_tramo[p1[a:b]] = True
+    resto = np.concatenate((p2[b:], p2[:b]))
+    resto = resto[~en_tramo[resto]]
+    hijo[b:] = resto[:m - b]
+    hijo[:a] = resto[m - b:]
+    return hijo
+
+
+def _cruce_pmx(p1: np.ndarray, p2: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Partially mapped crossover (PMX)."""
+    m = len(p1)
+    a, b = _corte(m, rng)
+    hijo = p2.copy()
+    hijo[a:b] = p1[a:b]
+    pos_p1 = {int(g): k for k, g in enumerate(p1)}
+    tramo = set(int(g) for g in p1[a:b])
+    for k in (*range(a), *range(b, m)):
+        g = int(p2[k])
+        while g in tramo:
+            g = int(p2[pos_p1[g]])
+        hijo[k] = g
+    return hijo
+
+
+CRUCES = {"ox": _cruce_ox, "pmx": _cruce_pmx}
+
+
+def _mutar(genoma: np.ndarray, rng: np.random.Generator,
+           p_swap: float, p_inversion: float) -> None:
+    """Mutación in-place: intercambio de dos genes y/o inversión de un tramo."""
+    m = len(genoma)
+    if m < 2:
+        return
+    if rng.random() < p_swap:
+        i, j = _corte(m - 1, rng)
+        genoma[i], genoma[j] = genoma[j], genoma[i]
+    if rng.random() < p_inversion:
+        i, j = _corte(m, rng)
+        genoma[i:j] = genoma[i:j][::-1]
+
+
+def _torneo(fitness: np.ndarray, k: int, cuantos: int, rng: np.random.Generator) -> np.ndarray:
+    """Selección por torneo: índices de los ganadores de 'cuantos' torneos de tamaño k."""
+    retadores = rng.integers(len(fitness), size=(cuantos, k))
+    return retadores[np.arange(cuantos), np.argmax(fitness[retadores], axis=1)]
+
+
+def solve_genetico(rooms: List[str],
+                   A: List[List[int]],
+                   anchor_room: Optional[str] = None,
+                   poblacion: int = 200,
+                   generaciones: int = 500,
+                   tiempo_max: Optional[float] = None,
+                   elite: int = 4,
+                   torneo: int = 3,
+                   cruce: str = "ox",
+                   p_cruce: float = 0.9,
+                   p_swap: float = 0.3,
+                   p_inversion: float = 0.3,
+                   intentos_reparacion: int = 10,
+                   penalizacion: Optional[int] = None,
+                   semilla: Optional[int] = 0,
+                   observador: Optional[Observador] = None,
+                   presupuesto: Optional[Presupuesto] = None):
+    """
+    Algoritmo genético para pisos demasiado grandes para la búsqueda exacta.
+    - Individuo = orden de las salas no-anchor (el anchor queda fijo en slot 0).
+    - Cruce OX o PMX, mutación swap + inversión, selección por torneo y elitismo.
+    - Reparación 2-opt de aristas A=0 (incluido el cierre del anillo); lo que no
+      se logre reparar se penaliza en el fitness.
+    - Fitness evaluado en lote sobre toda la población (NumPy).
+    - Presupuesto: 'generaciones' y, opcionalmente, 'tiempo_max' en segundos.
+    - 'semilla' fija el RNG para que las corridas sean reproducibles.
+    - 'observador' recibe el avance una vez por generación.
+    - 'presupuesto' (tiempo, nodos = individuos evaluados, cancelación) se
+      revisa por generación; al agotarse devuelve el mejor hasta ese momento.
+    Devuelve (perm, score, Stats) como solve_backtracking; perm es None si no
+    se encontró ningún layout factible.
+    """
+    if cruce not in CRUCES:
+        raise ValueError(f"Cruce desconocido: {cruce!r} (opciones: {', '.join(CRUCES)})")
+    cruzar = CRUCES[cruce]
+
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    M = matriz_densa(A)
+    Z = M != 0
+    if penalizacion is None:
+        # una arista prohibida siempre pesa más que el mejor anillo posible
+        penalizacion = int(np.abs(M).max(initial=0)) * n + 1
+
+    rng = np.random.default_rng(semilla)
+    stats = Stats()
+    inicio = time.perf_counter()
+    if observador is not None:
+        observador.iniciar()
+    if presupuesto is not None:
+        presupuesto.iniciar()
+
+    otros = np.array([i for i in range(n) if i != anchor], dtype=np.int64)
+    P = max(2, poblacion)
+    elite = min(elite, P)
+
+    def completar(genomas: np.ndarray) -> np.ndarray:
+        return np.hstack([np.full((len(genomas), 1), anchor), genomas])
+
+    def evaluar(perms: np.ndarray):
+        scores, ceros = _evaluar_poblacion(perms, M)
+        malos = np.flatnonzero(ceros)
+        if len(malos) and intentos_reparacion > 0:
+            # solo se reparan (y re-evalúan) los individuos infactibles
+            for k in malos:
+                _reparar(perms[k], Z, intentos_reparacion)
+            scores[malos], ceros[malos] = _evaluar_poblacion(perms[malos], M)
+        stats.evaluations += len(perms)
+        stats.nodes_expanded += len(perms)
+        stats.leaves_feasible += int((ceros == 0).sum())
+        stats.leaves_infeasible += int((ceros != 0).sum())
+        return scores, ceros, scores - penalizacion * ceros
+
+    perms = completar(rng.permuted(np.tile(otros, (P, 1)), axis=1))
+    scores, ceros, fitness = evaluar(perms)
+
+    best_perm, best_score = None, -10**9
+
+    def actualizar_mejor():
+        nonlocal best_perm, best_score
+        factibles = np.flatnonzero(ceros == 0)
+        if len(factibles):
+            k = factibles[np.argmax(scores[factibles])]
+            if scores[k] > best_score:
+                best_score = int(scores[k])
+                best_perm = [int(x) for x in perms[k]]
+
+    actualizar_mejor()
+
+    for _ in range(generaciones):
+        if tiempo_max is not None and time.perf_counter() - inicio >= tiempo_max:
+            break
+        if presupuesto is not None and presupuesto.verificar(stats, completo=True):
+            break
+
+        orden = np.argsort(-fitness, kind="stable")
+        hijos = [perms[k, 1:].copy() for k in orden[:elite]]
+        padres = _torneo(fitness, torneo, 2 * (P - elite), rng)
+        for k in range(P - elite):
+            g1 = perms[padres[2 * k], 1:]
+            g2 = perms[padres[2 * k + 1], 1:]
+            hijo = cruzar(g1, g2, rng) if len(g1) > 1 and rng.random() < p_cruce else g1.copy()
+            _mutar(hijo, rng, p_swap, p_inversion)
+            hijos.append(hijo)
+
+        perms = completar(np.array(hijos, dtype=np.int64).reshape(P, len(otros)))
+        scores, ceros, fitness = evaluar(perms)
+        stats.generations += 1
+        actualizar_mejor()
+        if observador is not None:
+            observador.nodo(stats, best_score, best_perm, cantidad=P)
+
+    if observador is not None:
+        observador.finalizar(stats, best_score, best_perm)
+    return best_perm, best_score, stats
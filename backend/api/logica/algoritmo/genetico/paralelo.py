@@ -0,0 +1,240 @@
+# ----------------------------------------
+# Backtracking paralelo por subárboles
+# ----------------------------------------
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Optional
+
+from logica.algoritmo.genetico import Observador, Presupuesto, Stats
+from logica.algoritmo.genetico.backtracking import (backtrack_pila, contar_prohibidos,
+                                                    cotas_optimistas, ordenar_candidatos)
+from logica.algoritmo.genetico.evaluacion import matriz_listas
+
+# Estado de cada proceso trabajador (lo fija _inicializar_worker)
+_WORKER: dict = {}
+
+
+class _PresupuestoCompartido(Presupuesto):
+    """
+    Presupuesto de un worker: el reloj es absoluto (time.time, comparable
+    entre procesos), los nodos se suman en un contador compartido por todos
+    y el padre puede pedir parar con el evento 'detener'.
+    """
+
+    def __init__(self, fin, nodos_max, nodos_globales, detener, lock) -> None:
+        super().__init__(nodos_max=nodos_max)
+        self.fin = fin
+        self.nodos_globales = nodos_globales
+        self.detener = detener
+        self.lock = lock
+        self._contados = 0
+
+    def motivo(self, stats: Stats) -> Optional[str]:
+        with self.lock:
+            self.nodos_globales.value += stats.nodes_expanded - self._contados
+            total = self.nodos_globales.value
+        self._contados = stats.nodes_expanded
+        if self.nodos_max is not None and total >= self.nodos_max:
+            return "nodos"
+        if self.detener.is_set():
+            return "cancelado"
+        if self.fin is not None and time.time() >= self.fin:
+            return "tiempo"
+        return None
+
+
+def _inicializar_worker(A, n, zeros_count, top1, top2, compartido, lock,
+                        fin, nodos_max, nodos_globales, detener, simetria=None):
+    orden, permitidos = ordenar_candidatos(A, n, zeros_count)
+    _WORKER.update(A=A, n=n, orden=orden, permitidos=permitidos,
+                   top1=top1, top2=top2, compartido=compartido, lock=lock,
+                   fin=fin, nodos_max=nodos_max, nodos_globales=nodos_globales,
+                   detener=detener, simetria=simetria)
+
+
+def _resolver_subarbol(prefijo: List[int], score: int):
+    """Explora el subárbol que cuelga de 'prefijo' (slots 0..k-1 ya fijos)."""
+    w = _WORKER
+    n = w["n"]
+    slots = prefijo + [-1]*(n - len(prefijo))
+    restantes = (1 << n) - 1
+    for i in prefijo:
+        restantes &= ~(1 << i)
+
+    stats = Stats()
+    if w["detener"].is_set():
+        stats.stopped_by = "cancelado"
+        return None, -10**9, stats
+
+    presupuesto = _PresupuestoCompartido(w["fin"], w["nodos_max"], w["nodos_globales"],
+                                         w["detener"], w["lock"])
+    compartido = w["compartido"] if w["top1"] is not None else None
+    perm, score = backtrack_pila(stats, slots, len(prefijo), restantes, score,
+                                 w["A"], n, w["orden"], w["permitidos"],
+                                 w["top1"], w["top2"], compartido, w["lock"],
+                                 presupuesto=presupuesto, simetria=w["simetria"])
+    return perm, score, stats
+
+
+def _prefijos(stats: Stats, slots: list[int], pos: int, remaining: list[int],
+              score: int, A: list[list[int]], n: int, zeros_count: list[int],
+              profundidad: int, tareas: list,
+              simetria: Optional[List[int]] = None):
+    """
+    Expande los primeros niveles igual que backtrack_pila() (mismos filtros
+    A=0 y de gemelos, mismo orden de candidatos) y deja cada nodo de
+    'profundidad' como tarea, en el orden en que la versión serial los
+    visitaría. Con 'simetria' no se generan prefijos fuera del orden
+    canónico de los gemelos.
+    """
+    if pos == profundidad + 1:
+        tareas.append((slots[:pos], score))
+        return
+    stats.nodes_expanded += 1
+    stats.depth_expansions[pos] = stats.depth_expansions.get(pos, 0) + 1
+
+    prev = slots[pos-1]
+    stats.children_generated += len(remaining)
+    candidates = [r for r in remaining if A[prev][r] != 0]
+    stats.children_pruned_zero += (len(remaining) - len(candidates))
+    candidates.sort(key=lambda r: (-A[prev][r], -zeros_count[r]))
+    if simetria is not None:
+        rem = 0
+        for x in remaining:
+            rem |= 1 << x
+        candidates = [r for r in candidates if not rem & simetria[r]]
+
+    for r in candidates:
+        stats.children_valid += 1
+        slots[pos] = r
+        new_remaining = [x for x in remaining if x != r]
+        _prefijos(stats, slots, pos+1, new_remaining, score + A[prev][r],
+                  A, n, zeros_count, profundidad, tareas, simetria)
+        slots[pos] = -1
+
+
+def fusionar_stats(total: Stats, parcial: Stats) -> Stats:
+    """
+    Suma los contadores de 'parcial' sobre 'total' (in-place). stopped_by
+    conserva el primer motivo de corte; proven_optimal y reduccion los decide
+    quien fusiona.
+    """
+    for campo, valor in vars(parcial).items():
+        if campo == "depth_expansions":
+            for d, c in valor.items():
+                total.depth_expansions[d] = total.depth_expansions.get(d, 0) + c
+        elif campo == "stopped_by":
+            total.stopped_by = total.stopped_by or valor
+        elif campo in ("proven_optimal", "reduccion"):
+            continue
+        else:
+            setattr(total, campo, getattr(total, campo) + valor)
+    return total
+
+
+def solve_backtracking_paralelo(rooms: List[str],
+                                A: List[List[int]],
+                                anchor_room: Optional[str] = None,
+                                workers: Optional[int] = None,
+                                profundidad: int = 1,
+                                acotar: bool = True,
+                                observador: Optional[Observador] = None,
+                                presupuesto: Optional[Presupuesto] = None,
+                                simetria: Optional[List[int]] = None):
+    """
+    Igual que solve_backtracking pero repartiendo la búsqueda entre procesos:
+    - Cada candidato para los slots 1..profundidad (1 o 2) es una tarea.
+    - Las tareas corren en un ProcessPoolExecutor y comparten el mejor puntaje
+      encontrado, así la poda por cota sigue siendo efectiva entre procesos.
+    - Las Stats de cada tarea se suman en una sola.
+    - Resultado idéntico al serial: ante empates gana la tarea que la versión
+      serial habría visitado primero.
+    - 'observador' recibe el avance cada vez que termina una tarea (los
+      workers corren en otros procesos).
+    - 'presupuesto': el tiempo y los nodos (sumados entre workers) se revisan
+      en cada worker; la cancelación la vigila este proceso y se propaga a los
+      workers. Al cortar se devuelve el mejor incumbente encontrado.
+    - 'simetria' (ver preproceso.py) filtra los prefijos y se aplica dentro
+      de cada worker.
+    """
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    A = matriz_listas(A)
+    zeros_count = contar_prohibidos(A, n)
+    top1 = top2 = None
+    if acotar:
+        top1, top2 = cotas_optimistas(A, n)
+
+    stats = Stats()
+    if observador is not None:
+        observador.iniciar()
+    if presupuesto is not None:
+        presupuesto.iniciar()
+    slots = [-1]*n
+    slots[0] = anchor
+    remaining = [i for i in range(n) if i != anchor]
+
+    # Con tan pocas salas no hay nada que repartir: el último slot también
+    # valida el cierre del anillo, así que lo dejamos siempre en el worker.
+    profundidad = max(1, min(profundidad, n - 2))
+    tareas: list = []
+    if n >= 3:
+        _prefijos(stats, slots, 1, remaining, 0, A, n, zeros_count,
+                  profundidad, tareas, simetria)
+    else:
+        tareas.append(([anchor], 0))
+
+    compartido = mp.RawValue("q", -10**9)
+    nodos_globales = mp.RawValue("q", stats.nodes_expanded)
+    detener = mp.Event()
+    lock = mp.Lock()
+    workers = workers or os.cpu_count() or 1
+    fin = nodos_max = None
+    if presupuesto is not None:
+        nodos_max = presupuesto.nodos_max
+        if presupuesto.tiempo_max is not None:
+            fin = time.time() + presupuesto.tiempo_max
+
+    resultados: list = [None]*len(tareas)
+    best_perm, best_score = None, -10**9
+    with ProcessPoolExecutor(max_workers=min(workers, max(1, len(tareas))),
+                             initializer=_inicializar_worker,
+                             initargs=(A, n, zeros_count, top1, top2, compartido, lock,
+                                       fin, nodos_max, nodos_globales, detener,
+                                       simetria)) as pool:
+        indice = {pool.submit(_resolver_subarbol, prefijo, score): k
+                  for k, (prefijo, score) in enumerate(tareas)}
+        pendientes = set(indice)
+        while pendientes:
+            hechos, pendientes = wait(pendientes, timeout=0.05,
+                                      return_when=FIRST_COMPLETED)
+            for futuro in hechos:
+                perm, score, parcial = resultados[indice[futuro]] = futuro.result()
+                fusionar_stats(stats, parcial)
+                if perm is not None and score > best_score:
+                    best_perm, best_score = perm, score
+                if observador is not None:
+                    observador.nodo(stats, best_score, best_perm,
+                                    cantidad=max(1, parcial.nodes_expanded))
+            if presupuesto is not None and not detener.is_set():
+                motivo = presupuesto.motivo(stats)
+                if motivo is not None:
+                    stats.stopped_by = motivo
+                    detener.set()
+
+    # Fusión en el orden de las tareas: eso da el desempate determinista
+    best_perm, best_score = None, -10**9
+    for perm, score, _ in resultados:
+        if perm is not None and score > best_score:
+            best_perm, best_score = perm, score
+
+    stats.proven_optimal = stats.stopped_by is None
+    if observador is not None:
+        observador.finalizar(stats, best_score, best_perm)
+    return best_perm, best_score, stats
@@ -0,0 +1,222 @@
+# ----------------------------------------
+# Preproceso de la instancia antes de buscar
+# ----------------------------------------
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.evaluacion import matriz_densa
+from logica.objetos.grafo import bits
+
+
+@dataclass
+class Reduccion:
+    """Resultado de preprocesar(): qué se dedujo de A antes de buscar."""
+    factible: bool = True
+    motivo: Optional[str] = None                  # por qué no hay anillo posible
+    A: Optional[List[List[int]]] = None           # A reducida (mismas salas, mismos índices)
+    forzadas: List[Tuple[int, int]] = field(default_factory=list)   # aristas obligatorias
+    eliminadas: int = 0                           # aristas anuladas por propagación
+    gemelos: List[List[int]] = field(default_factory=list)          # salas intercambiables
+    simetria: Optional[List[int]] = None          # simetria[r]: gemelos que deben ir antes que r
+    componentes: List[List[int]] = field(default_factory=list)
+
+    def reporte(self, rooms: List[str]) -> dict:
+        """Resumen por nombre de sala (va a Stats.reduccion)."""
+        return {
+            "factible": self.factible,
+            "motivo": self.motivo,
+            "forzadas": [[rooms[i], rooms[j]] for i, j in self.forzadas],
+            "eliminadas": self.eliminadas,
+            "gemelos": [[rooms[i] for i in clase] for clase in self.gemelos],
+            "componentes": len(self.componentes),
+        }
+
+
+def componentes(vecinos: List[int]) -> List[List[int]]:
+    """Componentes conexas del grafo de aristas permitidas (bitsets)."""
+    n = len(vecinos)
+    sin_visitar = (1 << n) - 1
+    resultado = []
+    while sin_visitar:
+        frontera = sin_visitar & -sin_visitar
+        comp = 0
+        while frontera:
+            comp |= frontera
+            nueva = 0
+            for v in bits(frontera):
+                nueva |= vecinos[v]
+            frontera = nueva & ~comp
+        sin_visitar &= ~comp
+        resultado.append(list(bits(comp)))
+    return resultado
+
+
+def _articulacion(vecinos: List[int]) -> Optional[int]:
+    """
+    Una sala cuya eliminación desconecta el grafo (Tarjan iterativo), o
+    None. Un anillo que pase por todas las salas no puede tener ninguna.
+    """
+    n = len(vecinos)
+    disc = [-1]*n
+    low = [0]*n
+    disc[0] = low[0] = 0
+    tiempo = 1
+    hijos_raiz = 0
+    pila = [(0, -1, list(bits(vecinos[0])))]
+    while pila:
+        v, padre, pendientes = pila[-1]
+        if pendientes:
+            w = pendientes.pop()
+            if disc[w] == -1:
+                disc[w] = low[w] = tiempo
+                tiempo += 1
+                if v == 0:
+                    hijos_raiz += 1
+                pila.append((w, v, list(bits(vecinos[w]))))
+            elif w != padre:
+                low[v] = min(low[v], disc[w])
+            continue
+        pila.pop()
+        if padre >= 0:
+            low[padre] = min(low[padre], low[v])
+            if padre != 0 and low[v] >= disc[padre]:
+                return padre
+    return 0 if hijos_raiz > 1 else None
+
+
+def preprocesar(A, anchor: int = 0) -> Reduccion:
+    """
+    Deducciones baratas sobre A (simétrica) antes de la búsqueda exacta:
+    1. Factibilidad: toda sala necesita al menos 2 vecinos permitidos y el
+       grafo de aristas permitidas debe ser conexo y sin puntos de
+       articulación; si no, no existe anillo y ni se busca.
+    2. Aristas forzadas: una sala con exactamente 2 vecinos usa ambas
+       aristas; una sala con 2 aristas forzadas pierde todas las demás (se
+       anulan en A), lo que puede forzar otras. Más de 2 forzadas en una
+       sala o un ciclo forzado que no cubre todas las salas es infactible.
+    3. Gemelos: salas con filas idénticas (salvo entre ellas) son
+       intercambiables en cualquier layout; 'simetria' fija su orden
+       relativo para que la búsqueda explore una sola de las permutaciones.
+    A no simétrica se devuelve sin reducir (las deducciones lo suponen).
+    """
+    M = matriz_densa(A)
+    n = len(M)
+    red = Reduccion(A=M.tolist())
+    if n < 3 or not (M == M.T).all():
+        return red
+
+    W = red.A
+    vecinos = [0]*n
+    for i in range(n):
+        for j in range(n):
+            if i != j and W[i][j] != 0:
+                vecinos[i] |= 1 << j
+
+    def infactible(motivo: str) -> Reduccion:
+        red.factible, red.motivo = False, motivo
+        return red
+
+    for i in range(n):
+        if vecinos[i].bit_count() < 2:
+            return infactible(f"sala {i} con menos de 2 vecinos permitidos")
+    red.componentes = componentes(vecinos)
+    if len(red.componentes) > 1:
+        return infactible(f"aristas permitidas en {len(red.componentes)} componentes")
+    corte = _articulacion(vecinos)
+    if corte is not None:
+        return infactible(f"sala {corte} es punto de articulación")
+
+    # --- propagación de aristas forzadas ---
+    forzadas = [0]*n                       # bitset de aristas forzadas por sala
+    raiz = list(range(n))                  # union-find de caminos forzados
+
+    def buscar(x: int) -> int:
+        while raiz[x] != x:
+            raiz[x] = raiz[raiz[x]]
+            x = raiz[x]
+        return x
+
+    cola = [i for i in range(n) if vecinos[i].bit_count() == 2]
+    while cola:
+        i = cola.pop()
+        if forzadas[i].bit_count() < 2 and vecinos[i].bit_count() == 2:
+            for j in bits(vecinos[i] & ~forzadas[i]):
+                forzadas[i] |= 1 << j
+                forzadas[j] |= 1 << i
+                red.forzadas.append((min(i, j), max(i, j)))
+                ri, rj = buscar(i), buscar(j)
+                if ri == rj and len(red.forzadas) < n:
+                    return infactible(f"ciclo forzado que no cubre las {n} salas")
+                raiz[ri] = rj
+                if forzadas[j].bit_count() > 2:
+                    return infactible(f"sala {j} con más de 2 aristas forzadas")
+                cola.append(j)
+        if forzadas[i].bit_count() == 2:
+            # i ya tiene sus dos vecinos: el resto de sus aristas sobra
+            for j in bits(vecinos[i] & ~forzadas[i]):
+                vecinos[i] &= ~(1 << j)
+                vecinos[j] &= ~(1 << i)
+                W[i][j] = W[j][i] = 0
+                red.eliminadas += 1
+                if vecinos[j].bit_count() < 2:
+                    return infactible(f"sala {j} con menos de 2 vecinos permitidos")
+                if vecinos[j].bit_count() == 2:
+                    cola.append(j)
+
+    # --- gemelos (sobre la A ya reducida) ---
+    # Dos gemelos tienen el mismo multiconjunto de pesos en su fila: se
+    # agrupa por eso y se confirma fila contra fila dentro de cada grupo.
+    grupos: dict = {}
+    for i in range(n):
+        if i != anchor:
+            grupos.setdefault(tuple(sorted(W[i])), []).append(i)
+    for grupo in grupos.values():
+        clases: List[List[int]] = []
+        for i in grupo:
+            for clase in clases:
+                j = clase[0]
+                if all(W[i][k] == W[j][k] for k in range(n) if k != i and k != j):
+                    clase.append(i)
+                    break
+            else:
+                clases.append([i])
+        red.gemelos.extend(c for c in clases if len(c) > 1)
+    if red.gemelos:
+        red.simetria = [0]*n
+        for clase in red.gemelos:
+            previos = 0
+            for r in clase:                # 'clase' sale ordenada por índice
+                red.simetria[r] = previos
+                previos |= 1 << r
+    return red
+
+
+def solve_preprocesado(solver: Callable,
+                       rooms: List[str],
+                       A,
+                       anchor_room: Optional[str] = None,
+                       simetria: bool = False,
+                       **opciones):
+    """
+    Preprocesa A y corre 'solver' sobre la instancia reducida. Las salas no
+    cambian de índice, así que el layout ya está en términos de 'rooms'.
+    Si el preproceso prueba que no hay anillo, no se busca. El resumen de lo
+    reducido queda en stats.reduccion. simetria=True pasa el orden de los
+    gemelos al solver (solo los backtracking lo aceptan).
+    """
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    red = preprocesar(A, rooms.index(anchor_room))
+    if not red.factible:
+        stats = Stats(proven_optimal=True, reduccion=red.reporte(rooms))
+        observador = opciones.get("observador")
+        if observador is not None:
+            observador.iniciar()
+            observador.finalizar(stats, -10**9, None)
+        return None, -10**9, stats
+    if simetria and red.simetria is not None:
+        opciones["simetria"] = red.simetria
+    perm, score, stats = solver(rooms, red.A, anchor_room, **opciones)
+    stats.reduccion = red.reporte(rooms)
+    return perm, score, stats
@@ -0,0 +1,175 @@
+# ----------------------------------------
+# Programación dinámica exacta (Held–Karp)
+# ----------------------------------------
+from typing import List, Optional
+
+import numpy as np
+
+from logica.algoritmo.genetico import Observador, Presupuesto, Stats
+from logica.algoritmo.genetico.evaluacion import matriz_densa
+
+# Valor "menos infinito" para estados inalcanzables (cabe en int32). Todo lo
+# que quede por debajo de NEG // 2 tras sumar pesos se satura de vuelta a NEG.
+NEG = -(1 << 30)
+
+# Tope de memoria (en bytes) del bloque temporal (b x m x m, int64) por capa.
+BLOQUE_BYTES = 64 * 1024 * 1024
+
+
+def _popcount(m: int) -> np.ndarray:
+    """popcount de todas las máscaras 0..2^m-1 (uint8)."""
+    pc = np.zeros(1 << m, dtype=np.uint8)
+    for b in range(m):
+        paso = 1 << b
+        # las máscaras con el bit b encendido suman 1
+        pc.reshape(-1, 2 * paso)[:, paso:] += 1
+    return pc
+
+
+def _reconstruir(dp: np.ndarray, W: np.ndarray, full: int, last: int) -> List[int]:
+    """Recupera el camino óptimo recorriendo dp hacia atrás (sin tabla de padres)."""
+    camino = [last]
+    mask, j = full, last
+    while mask != (1 << j):
+        prev_mask = mask ^ (1 << j)
+        objetivo = dp[mask, j]
+        for i in range(W.shape[0]):
+            if (prev_mask >> i) & 1 and dp[prev_mask, i] > NEG \
+                    and W[i, j] > NEG and dp[prev_mask, i] + W[i, j] == objetivo:
+                camino.append(i)
+                mask, j = prev_mask, i
+                break
+        else:  # pragma: no cover - dp inconsistente
+            raise RuntimeError("No se pudo reconstruir el camino óptimo")
+    camino.reverse()
+    return camino
+
+
+def solve_held_karp(rooms: List[str],
+                    A: List[List[int]],
+                    anchor_room: Optional[str] = None,
+                    observador: Optional[Observador] = None,
+                    presupuesto: Optional[Presupuesto] = None):
+    """
+    Solver exacto por programación dinámica sobre subconjuntos (Held–Karp).
+    - Fija anchor_room en slot 0 (igual que solve_backtracking).
+    - dp[mask][j] = mejor puntaje de un camino que sale del anchor, visita
+      exactamente las salas de 'mask' y termina en j.
+    - Las aristas con A=0 están prohibidas, incluido el cierre del anillo.
+    - Procesa las máscaras por capas de popcount y en bloques acotados,
+      así la memoria es O(2^(N-1) * (N-1)) int32 más un temporal fijo.
+    Devuelve (perm, score, Stats) con el mismo contrato que solve_backtracking.
+    'observador' recibe el avance por bloque de máscaras (sin incumbente hasta
+    el final: el óptimo solo se conoce al cerrar el anillo).
+    'presupuesto' se revisa por bloque; si se agota no hay incumbente parcial
+    que devolver, así que el resultado es (None, -10**9, stats).
+    """
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    stats = Stats()
+    best_perm, best_score = None, -10**9
+    if observador is not None:
+        observador.iniciar()
+    if presupuesto is not None:
+        presupuesto.iniciar()
+
+    M = matriz_densa(A)
+    otros = [i for i in range(n) if i != anchor]
+    m = len(otros)
+
+    if m == 0:
+        # Anillo de una sola sala: el cierre es A[a][a]
+        stats.nodes_expanded += 1
+        stats.depth_expansions[1] = 1
+        if M[anchor, anchor] == 0:
+            stats.leaves_infeasible += 1
+        else:
+            stats.leaves_feasible += 1
+            best_perm, best_score = [anchor], int(M[anchor, anchor])
+        stats.proven_optimal = True
+        if observador is not None:
+            observador.finalizar(stats, best_score, best_perm)
+        return best_perm, best_score, stats
+
+    # Pesos entre salas no-anchor (NEG = prohibido)
+    sub = M[np.ix_(otros, otros)]
+    W = np.where(sub != 0, sub, NEG).astype(np.int32)
+    np.fill_diagonal(W, NEG)
+    salida = M[anchor, otros]    # anchor -> j
+    cierre = M[otros, anchor]    # j -> anchor
+
+    full = (1 << m) - 1
+    dp = np.full((1 << m, m), NEG, dtype=np.int32)
+    unos = 1 << np.arange(m, dtype=np.int64)
+    dp[unos, np.arange(m)] = np.where(salida != 0, salida, NEG)
+
+    stats.nodes_expanded += 1
+    stats.depth_expansions[1] = 1
+    stats.children_generated += m
+    stats.children_pruned_zero += int((salida == 0).sum())
+    stats.children_valid += int((salida != 0).sum())
+
+    pc = _popcount(m)
+    orden = np.argsort(pc, kind="stable")
+    cortes = np.searchsorted(pc[orden], np.arange(m + 2))
+    bloque = max(1, BLOQUE_BYTES // (8 * m * m))
+
+    for k in range(1, m):
+        if stats.stopped_by is not None:
+            break
+        capa = orden[cortes[k]:cortes[k + 1]].astype(np.int64)
+        stats.depth_expansions[k + 1] = int(len(capa))
+        for ini in range(0, len(capa), bloque):
+            if presupuesto is not None and presupuesto.verificar(stats, completo=True):
+                break
+            masks = capa[ini:ini + bloque]
+            vals = dp[masks].astype(np.int64)      # (b, m)
+            vivos = vals > NEG
+            expandidos = int(vivos.sum())
+            stats.nodes_expanded += expandidos
+            # cand[b, j] = max_i dp[mask, i] + W[i, j]
+            cand = (vals[:, :, None] + W[None, :, :]).max(axis=1)
+            cand[cand <= NEG // 2] = NEG
+
+            libres = (masks[:, None] & unos[None, :]) == 0  # j fuera de mask
+            # hijos lógicos = (#estados vivos) * (#salas libres)
+            vivos_por_mask = vivos.sum(axis=1)
+            libres_por_mask = libres.sum(axis=1)
+            generados = int((vivos_por_mask * libres_por_mask).sum())
+            validos = int(((cand > NEG) & libres).sum())
+            stats.children_generated += generados
+            stats.children_valid += validos
+            stats.children_pruned_zero += generados - validos
+
+            bi, bj = np.nonzero(libres)
+            dp[masks[bi] | unos[bj], bj] = cand[bi, bj]
+            if observador is not None:
+                observador.nodo(stats, best_score, best_perm, cantidad=max(1, expandidos))
+
+    if stats.stopped_by is not None:
+        if observador is not None:
+            observador.finalizar(stats, best_score, best_perm)
+        return best_perm, best_score, stats
+
+    # Cierre del anillo: último -> anchor
+    stats.proven_optimal = True
+    finales = dp[full]
+    alcanzables = finales > NEG
+    cierre_ok = alcanzables & (cierre != 0)
+    stats.leaves_feasible += int(cierre_ok.sum())
+    stats.leaves_infeasible += int((alcanzables & ~cierre_ok).sum())
+
+    if cierre_ok.any():
+        totales = np.where(cierre_ok, finales.astype(np.int64) + cierre, np.iinfo(np.int64).min)
+        last = int(np.argmax(totales))
+        best_score = int(totales[last])
+        camino = _reconstruir(dp, W, full, last)
+        best_perm = [anchor] + [otros[j] for j in camino]
+
+    if observador is not None:
+        observador.finalizar(stats, best_score, best_perm)
+    return best_perm, best_score, stats
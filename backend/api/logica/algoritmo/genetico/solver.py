@@ -0,0 +1,138 @@
+# ----------------------------
+# Selección de solver
+# ----------------------------
+import random
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.busqueda_local import solve_busqueda_local
+from logica.algoritmo.genetico.cache import CacheSoluciones
+from logica.algoritmo.genetico.evaluacion import matriz_densa
+from logica.algoritmo.genetico.evolutivo import solve_genetico
+from logica.algoritmo.genetico.paralelo import solve_backtracking_paralelo
+from logica.algoritmo.genetico.preproceso import componentes, solve_preprocesado
+from logica.algoritmo.genetico.programacion_dinamica import solve_held_karp
+
+# Todos comparten el contrato (rooms, A, anchor_room) -> (perm, score, Stats)
+SOLVERS: Dict[str, Callable] = {
+    "backtracking": solve_backtracking,
+    "backtracking_paralelo": solve_backtracking_paralelo,
+    "held_karp": solve_held_karp,
+    "genetico": solve_genetico,
+    "busqueda_local": solve_busqueda_local,
+}
+
+# Solvers que garantizan el óptimo (los que verificar_solvers cruza por defecto)
+EXACTOS = ("backtracking", "backtracking_paralelo", "held_karp")
+
+# Solvers que aprovechan el orden de gemelos del preproceso
+CON_SIMETRIA = ("backtracking", "backtracking_paralelo")
+
+
+def solve(rooms: List[str],
+          A: List[List[int]],
+          anchor_room: Optional[str] = None,
+          metodo: str = "backtracking",
+          cache: Optional[CacheSoluciones] = None,
+          preprocesar: bool = False,
+          **opciones):
+    """
+    Resuelve el layout en anillo con el solver indicado en 'metodo'
+    (ver SOLVERS). 'opciones' se pasan tal cual al solver (p. ej.
+    observador=..., tiempo_max=...). Con 'cache' se reutilizan resultados
+    óptimos de la misma instancia (cualquier solver exacto sirve para
+    cualquier método). Con preprocesar=True se reduce A antes de buscar
+    (ver preproceso.py) y el resumen queda en stats.reduccion.
+    Devuelve (perm, score, Stats).
+    """
+    if metodo not in SOLVERS:
+        raise ValueError(f"Solver desconocido: {metodo!r} (opciones: {', '.join(SOLVERS)})")
+    solver = SOLVERS[metodo]
+    if preprocesar:
+        solver = partial(solve_preprocesado, solver, simetria=metodo in CON_SIMETRIA)
+    if cache is not None:
+        return cache.resolver(solver, rooms, A, anchor_room, **opciones)
+    return solver(rooms, A, anchor_room, **opciones)
+
+
+def solve_por_componentes(rooms: List[str],
+                          A,
+                          anclas: Optional[List[str]] = None,
+                          metodo: str = "backtracking",
+                          **opciones):
+    """
+    Parte las salas en las componentes conexas del grafo de aristas
+    permitidas (A != 0) y arma un anillo independiente por componente (un
+    piso por componente). Sirve cuando las restricciones hacen imposible un
+    único anillo pero no varios. 'anclas' fija el anchor de cada componente
+    si alguna de sus salas está en la lista. Devuelve
+    (layouts, score_total, [Stats por componente]); layouts son listas de
+    nombres y None si esa componente no admite anillo.
+    """
+    M = matriz_densa(A)
+    n = len(rooms)
+    vecinos = [0]*n
+    for i, j in zip(*M.nonzero()):
+        if i != j:
+            vecinos[i] |= 1 << int(j)
+    layouts, total, stats = [], 0, []
+    for comp in componentes(vecinos):
+        sub = [rooms[i] for i in comp]
+        anchor = next((r for r in (anclas or []) if r in sub), sub[0])
+        perm, score, st = solve(sub, M[comp][:, comp], anchor, metodo, **opciones)
+        layouts.append([sub[i] for i in perm] if perm is not None else None)
+        total += score if perm is not None else 0
+        stats.append(st)
+    return layouts, total, stats
+
+
+def matriz_aleatoria(n: int, semilla: int, p_cero: float = 0.3, w_max: int = 5,
+                     simetrica: bool = True) -> List[List[int]]:
+    """
+    A aleatoria con una fracción p_cero de pares prohibidos; con
+    simetrica=False cada sentido de un par sale por separado.
+    """
+    rng = random.Random(semilla)
+    A = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            w = 0 if rng.random() < p_cero else rng.randint(1, w_max)
+            A[i][j] = A[j][i] = w
+            if not simetrica:
+                A[j][i] = 0 if rng.random() < p_cero else rng.randint(1, w_max)
+    return A
+
+
+def verificar_solvers(n_max: int = 8,
+                      instancias: int = 20,
+                      metodos: Optional[List[str]] = None,
+                      referencia: str = "backtracking") -> int:
+    """
+    Cruza los solvers exactos contra 'referencia' en instancias pequeñas
+    aleatorias: mismo puntaje óptimo y layouts válidos (anchor en slot 0,
+    sin aristas A=0, cierre incluido). Devuelve cuántas instancias se
+    verificaron; lanza AssertionError ante la primera discrepancia.
+    """
+    metodos = metodos or [m for m in EXACTOS if m != referencia]
+    verificadas = 0
+    for n in range(1, n_max + 1):
+        rooms = [f"R{i}" for i in range(n)]
+        for semilla in range(instancias):
+            A = matriz_aleatoria(n, semilla)
+            _, ref_score, _ = solve(rooms, A, metodo=referencia)
+            for metodo in metodos:
+                perm, score, _ = solve(rooms, A, metodo=metodo)
+                assert score == ref_score, \
+                    f"{metodo} (n={n}, semilla={semilla}): {score} != {ref_score}"
+                if perm is None:
+                    continue
+                assert perm[0] == 0 and sorted(perm) == list(range(n)), perm
+                aristas = [A[perm[i]][perm[(i + 1) % n]] for i in range(n)]
+                assert all(aristas) and sum(aristas) == score, perm
+            verificadas += 1
+    return verificadas
+
+
+if __name__ == "__main__":
+    print("Instancias verificadas:", verificar_solvers())
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+def como_vectores(v) -> np.ndarray:
+    """
+    Lleva vectores a un arreglo (N x 3) float64. Acepta (N x 3), un solo
+    vector (3,) o el formato columna de algebra_matrices ([[x], [y], [z]]).
+    """
+    a = np.asarray(v, dtype=np.float64)
+    if a.ndim == 2 and a.shape[1] == 1:
+        a = a.T
+    return np.atleast_2d(a)
+
+
+def matmul_lote(M, V) -> np.ndarray:
+    """
+    Aplica matrices a un lote de vectores fila.
+    - M (3 x 3) y V (N x 3): la misma matriz a todos -> V M^T (una llamada BLAS).
+    - M (N x 3 x 3) y V (N x 3): una matriz por vector.
+    - M 4x4 homogénea: aplica también la traslación.
+    """
+    M = np.asarray(M, dtype=np.float64)
+    V = np.asarray(V, dtype=np.float64)
+    if M.ndim == 2:
+        if M.shape == (4, 4):
+            return V @ M[:3, :3].T + M[:3, 3]
+        return V @ M.T
+    return np.einsum("nij,nj->ni", M, V)
+
+
+def cruz_lote(a, b) -> np.ndarray:
+    """Producto cruz fila a fila de dos lotes (N x 3) (o uno contra muchos)."""
+    return np.cross(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+
+
+def punto_lote(a, b) -> np.ndarray:
+    """Producto punto fila a fila de dos lotes (N x 3)."""
+    return np.einsum("ij,ij->i", np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+
+
+def normalizar(v) -> np.ndarray:
+    """Vectores unitarios (los nulos quedan en 0)."""
+    v = np.asarray(v, dtype=np.float64)
+    largo = np.linalg.norm(v, axis=-1, keepdims=True)
+    return np.divide(v, largo, out=np.zeros_like(v), where=largo > 0)
+
+
+def normales(vertices, caras=None) -> np.ndarray:
+    """
+    Normales unitarias de triángulos (regla de la mano derecha).
+    - Sin 'caras': 'vertices' es (N x 3 x 3), un triángulo por fila.
+    - Con 'caras' (N x 3) de índices: los triángulos son vertices[caras].
+    """
+    t = np.asarray(vertices, dtype=np.float64)
+    if caras is not None:
+        t = t[np.asarray(caras)]
+    return normalizar(np.cross(t[:, 1] - t[:, 0], t[:, 2] - t[:, 0]))
+
+
+def punto_en_poligono(puntos, poligono) -> np.ndarray:
+    """
+    Para cada punto (N x 2, o N x 3 usando x, y) indica si cae dentro del
+    polígono (M x 2, vértices en orden, cerrado implícitamente). Regla
+    par-impar con un rayo hacia +x, evaluada para todos los puntos contra
+    todas las aristas a la vez (N x M). Los puntos justo sobre el borde
+    pueden quedar de cualquier lado.
+    """
+    p = np.asarray(puntos, dtype=np.float64)[:, :2]
+    q = np.asarray(poligono, dtype=np.float64)[:, :2]
+    x, y = p[:, 0:1], p[:, 1:2]
+    x1, y1 = q[:, 0], q[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+
+    cruza = (y1 > y) != (y2 > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_corte = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    return ((cruza & (x < x_corte)).sum(axis=1) % 2).astype(bool)
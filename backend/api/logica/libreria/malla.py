@@ -0,0 +1,185 @@
+import base64
+import io
+import json
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from logica.libreria.algebra_vectorial import normales
+
+
+@dataclass
+class Malla:
+    """
+    Malla poligonal indexada: 'vertices' (V x 3) compartidos y 'caras' en
+    grupos, cada grupo un arreglo (F x k) de índices de caras de k lados
+    (p. ej. tapas hexagonales y laterales cuadradas). Se dibuja como una
+    sola colección y se exporta a STL binario, OBJ y glTF.
+    """
+    vertices: np.ndarray
+    caras: list[np.ndarray] = field(default_factory=list)
+
+    @property
+    def n_caras(self) -> int:
+        return sum(len(g) for g in self.caras)
+
+    def triangulos(self) -> np.ndarray:
+        """Caras en abanico desde su primer vértice (T x 3)."""
+        partes = [g[:, [0, i, i + 1]] for g in self.caras for i in range(1, g.shape[1] - 1)]
+        if not partes:
+            return np.empty((0, 3), dtype=np.int64)
+        return np.concatenate(partes)
+
+    def poligonos(self) -> list[np.ndarray]:
+        """Una lista (k x 3) por cara, como la pide Poly3DCollection."""
+        return [p for g in self.caras for p in self.vertices[g]]
+
+    def coleccion(self, **estilo):
+        """Toda la malla en un solo Poly3DCollection."""
+        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+        return Poly3DCollection(self.poligonos(), **estilo)
+
+    # ---------- exportación ----------
+    def a_stl(self) -> bytes:
+        """STL binario (triángulos con su normal, en float32)."""
+        t = self.triangulos()
+        registro = np.dtype([("normal", "<f4", 3), ("v", "<f4", (3, 3)), ("attr", "<u2")])
+        datos = np.zeros(len(t), dtype=registro)
+        datos["normal"] = normales(self.vertices, t)
+        datos["v"] = self.vertices[t]
+        return b"malla".ljust(80, b"\0") + struct.pack("<I", len(t)) + datos.tobytes()
+
+    def a_obj(self) -> str:
+        """OBJ de texto; las caras conservan sus k lados (índices desde 1)."""
+        salida = io.StringIO()
+        np.savetxt(salida, self.vertices, fmt="v %.9g %.9g %.9g")
+        for g in self.caras:
+            np.savetxt(salida, g + 1, fmt="f" + " %d" * g.shape[1])
+        return salida.getvalue()
+
+    def _gltf(self) -> tuple[dict, bytes]:
+        # glTF usa +y hacia arriba: (x, y, z) -> (x, z, -y)
+        posiciones = np.ascontiguousarray(
+            np.column_stack([self.vertices[:, 0], self.vertices[:, 2], -self.vertices[:, 1]]),
+            dtype="<f4")
+        indices = np.ascontiguousarray(self.triangulos().ravel(), dtype="<u4")
+        bloque_i = indices.tobytes().ljust(-(-indices.nbytes // 4) * 4, b"\0")
+        binario = bloque_i + posiciones.tobytes()
+
+        documento = {
+            "asset": {"version": "2.0", "generator": "nasa/malla"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"mesh": 0}],
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 1}, "indices": 0, "mode": 4}]}],
+            "buffers": [{"byteLength": len(binario)}],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": indices.nbytes, "target": 34963},
+                {"buffer": 0, "byteOffset": len(bloque_i), "byteLength": posiciones.nbytes, "target": 34962},
+            ],
+            "accessors": [
+                {"bufferView": 0, "componentType": 5125, "count": len(indices), "type": "SCALAR"},
+                {"bufferView": 1, "componentType": 5126, "count": len(posiciones), "type": "VEC3",
+                 "min": posiciones.min(axis=0).tolist() if len(posiciones) else [0, 0, 0],
+                 "max": posiciones.max(axis=0).tolist() if len(posiciones) else [0, 0, 0]},
+            ],
+        }
+        return documento, binario
+
+    def a_gltf(self) -> str:
+        """glTF 2.0 de texto con el buffer embebido en base64."""
+        documento, binario = self._gltf()
+        documento["buffers"][0]["uri"] = ("data:application/octet-stream;base64,"
+                                          + base64.b64encode(binario).decode("ascii"))
+        return json.dumps(documento)
+
+    def a_glb(self) -> bytes:
+        """glTF 2.0 binario (.glb): encabezado + bloque JSON + bloque BIN."""
+        documento, binario = self._gltf()
+        texto = json.dumps(documento).encode("utf-8")
+        texto = texto.ljust(-(-len(texto) // 4) * 4, b" ")
+        binario = binario.ljust(-(-len(binario) // 4) * 4, b"\0")
+        largo = 12 + 8 + len(texto) + 8 + len(binario)
+        return (struct.pack("<4sII", b"glTF", 2, largo)
+                + struct.pack("<I4s", len(texto), b"JSON") + texto
+                + struct.pack("<I4s", len(binario), b"BIN\0") + binario)
+
+    def exportar(self, ruta: str | Path) -> Path:
+        """Escribe según la extensión: .stl, .obj, .gltf o .glb."""
+        ruta = Path(ruta)
+        formatos = {".stl": self.a_stl, ".obj": self.a_obj, ".gltf": self.a_gltf, ".glb": self.a_glb}
+        if ruta.suffix.lower() not in formatos:
+            raise ValueError(f"Formato no soportado: {ruta.suffix}")
+        contenido = formatos[ruta.suffix.lower()]()
+        if isinstance(contenido, str):
+            ruta.write_text(contenido, encoding="utf-8")
+        else:
+            ruta.write_bytes(contenido)
+        return ruta
+
+
+def unir_vertices(puntos: np.ndarray, tolerancia: float = 1e-9) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Funde los puntos que coinciden (a 'tolerancia'): devuelve los vértices
+    únicos y, para cada punto de entrada, su índice en ellos.
+    """
+    claves = np.round(puntos / tolerancia).astype(np.int64)
+    _, primera, inversa = np.unique(claves, axis=0, return_index=True, return_inverse=True)
+    return puntos[primera], inversa.ravel()
+
+
+def prismas(abajo, arriba, fusionar_internas: bool = False, tolerancia: float = 1e-9) -> Malla:
+    """
+    Malla de N prismas a partir de sus bases (N x k x 3) y tapas (N x k x 3),
+    con las bases en orden antihorario visto desde arriba. Todo sale de
+    operaciones sobre índices, sin recorrer prismas en Python:
+    - tapa superior (k lados), inferior (invertida, normal hacia abajo) y
+      k laterales [b_i, b_i+1, t_i+1, t_i] por prisma;
+    - los vértices que comparten prismas vecinos se funden;
+    - con fusionar_internas=True se quitan las paredes que quedan entre dos
+      prismas pegados (aparecen dos veces), dejando solo la cáscara.
+    """
+    abajo = np.asarray(abajo, dtype=np.float64)
+    arriba = np.asarray(arriba, dtype=np.float64)
+    n, k = abajo.shape[:2]
+
+    vertices, inversa = unir_vertices(np.concatenate([abajo.reshape(-1, 3), arriba.reshape(-1, 3)]),
+                                      tolerancia)
+    b = inversa[:n * k].reshape(n, k)
+    t = inversa[n * k:].reshape(n, k)
+
+    siguiente = np.roll(np.arange(k), -1)
+    laterales = np.stack([b, b[:, siguiente], t[:, siguiente], t], axis=2).reshape(-1, 4)
+    if fusionar_internas and len(laterales):
+        _, inversa_l, cuenta = np.unique(np.sort(laterales, axis=1), axis=0,
+                                         return_inverse=True, return_counts=True)
+        laterales = laterales[cuenta[inversa_l.ravel()] == 1]
+
+    tapas = np.concatenate([t, b[:, ::-1]])
+    return Malla(vertices, [tapas, laterales])
+
+
+def extruir(poligonos, alto, **opciones) -> Malla:
+    """
+    Extruye N polígonos de k lados (N x k x 2, o x 3 con su z) hacia +z en
+    'alto' (uno para todos o uno por polígono). Ver prismas().
+    """
+    P = np.asarray(poligonos, dtype=np.float64)
+    if P.shape[-1] == 2:
+        P = np.concatenate([P, np.zeros(P.shape[:-1] + (1,))], axis=-1)
+    altos = np.broadcast_to(np.asarray(alto, dtype=np.float64), P.shape[:1])
+    arriba = P.copy()
+    arriba[..., 2] += altos[:, None]
+    return prismas(P, arriba, **opciones)
+
+
+def malla_objetos(objetos, **opciones) -> Malla:
+    """
+    Malla de Objeto prismáticos con 2k vértices (los k de la base y luego
+    los k de la tapa, como hexagono()), todos con el mismo k.
+    """
+    V = np.stack([o.coordenadas for o in objetos])
+    k = V.shape[1] // 2
+    return prismas(V[:, :k], V[:, k:], **opciones)
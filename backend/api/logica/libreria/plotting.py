@@ -6,20 +6,30 @@ mpl.rcParams['keymap.save'] = []
 
 def proyectar_ortogonal(objeto, plano="xy"):
     puntos = []
-    if plano == "xy":
-        puntos = [(v.x, v.y) for v in objeto.vertices]
-    elif plano == "xz":
-        puntos = [(v.x, v.z) for v in objeto.vertices]
-    elif plano == "yz":
-        puntos = [(v.y, v.z) for v in objeto.vertices]
+    ejes = {"xy": [0, 1], "xz": [0, 2], "yz": [1, 2]}
+    if plano in ejes:
+        puntos = [tuple(p) for p in objeto.coordenadas[:, ejes[plano]].tolist()]
     return puntos
 
 
 def dibujar_interactivo(objeto):
+    # cada tecla solo compone la rotación; se aplica al redibujar.
+    # El modo perezoso es solo mientras dura la ventana: al cerrarla se
+    # restaura el del llamador y la rotación queda aplicada a los vértices.
+    perezoso = objeto.perezoso
+    objeto.perezoso = True
+    try:
+        _dibujar_interactivo(objeto)
+    finally:
+        objeto.perezoso = perezoso
+        if not perezoso:
+            objeto._consolidar()
+
+
+def _dibujar_interactivo(objeto):
     fig, ax = plt.subplots(figsize=(10, 10))
-    puntos = [(v.x, v.y) for v in objeto.vertices]
-    xs, ys = zip(*puntos)
-    sc = ax.scatter(xs, ys, c="blue", s=50)
+    xy = objeto.coordenadas[:, :2]
+    sc = ax.scatter(xy[:, 0], xy[:, 1], c="blue", s=50)
 
     ax.set_aspect("equal", adjustable="box")
     ax.axhline(0, color="gray", lw=0.5)
@@ -41,9 +51,7 @@ def dibujar_interactivo(objeto):
         elif event.key == "e":
             objeto.rotar_y(-5)
 
-        pts = [(v.x, v.y) for v in objeto.vertices]
-        xs, ys = zip(*pts)
-        sc.set_offsets(list(zip(xs, ys)))
+        sc.set_offsets(objeto.coordenadas[:, :2])
         fig.canvas.draw_idle()
 
     fig.canvas.mpl_connect("key_press_event", on_key)
@@ -0,0 +1,212 @@
+# ----------------------------------------
+# Carga indexada de restricciones.json
+# ----------------------------------------
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from logica.objetos.grafo import Grafo
+from logica.objetos.nodo import Nodo
+
+
+def _par(i: int, j: int) -> Tuple[int, int]:
+    return (i, j) if i < j else (j, i)
+
+
+class GrafoRestricciones:
+    """
+    Grafo de salas con pares prohibidos (A=0) y preferencias con peso.
+    - Cada nombre se interna una vez en un id entero (dict nombre -> id),
+      así cada par cuesta O(1) en vez de buscar el Nodo en una lista.
+    - Los pares se guardan sin orden ((a, b) == (b, a)) y sin repetidos.
+    - Mantiene a la vez los Nodo (restriccion/preferencia) y la matriz A
+      densa int32; agregar/quitar un par actualiza ambos sin reconstruir.
+    - Si hay catálogo de salas, un nombre fuera de él es inválido; un par
+      (a, a) siempre lo es. Con estricto=True se lanza ValueError, si no se
+      anota en 'invalidos' y se ignora.
+    - Como en matriz_adyacencia, una preferencia pisa a un par prohibido.
+    """
+
+    def __init__(self,
+                 catalogo: Optional[Iterable[str]] = None,
+                 default_weight: int = 1,
+                 estricto: bool = True) -> None:
+        self.default_weight = default_weight
+        self.estricto = estricto
+        self.nombres: List[str] = []
+        self.idx: Dict[str, int] = {}
+        self.nodos: List[Nodo] = []
+        self.ceros: set = set()
+        self.prefs: Dict[Tuple[int, int], int] = {}
+        self.invalidos: List[Tuple[str, str, str]] = []   # (a, b, motivo)
+        self.duplicados = 0
+        self._A = np.zeros((0, 0), dtype=np.int32)
+        self.cerrado = catalogo is not None
+        for nombre in catalogo or ():
+            self._internar(nombre)
+
+    # ---------- carga ----------
+    @classmethod
+    def desde_json(cls, ruta: str, ruta_rooms: Optional[str] = None,
+                   **opciones) -> "GrafoRestricciones":
+        """
+        Lee restricciones.json (y opcionalmente rooms.json como catálogo,
+        que además fija el orden de los ids) en una sola pasada.
+        """
+        catalogo = None
+        if ruta_rooms is not None:
+            with open(ruta_rooms, "r", encoding="utf-8") as f:
+                catalogo = json.load(f)
+        with open(ruta, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        grafo = cls(catalogo, **opciones)
+        grafo.cargar(data)
+        return grafo
+
+    def cargar(self, data: dict) -> "GrafoRestricciones":
+        """Agrega los zero_pairs y preferences de un dict ya parseado."""
+        for a, b in data.get("zero_pairs", []):
+            self.agregar_cero(a, b)
+        for p in data.get("preferences", []):
+            a, b = p["pair"]
+            self.agregar_preferencia(a, b, p["weight"])
+        return self
+
+    # ---------- ids ----------
+    @property
+    def n(self) -> int:
+        return len(self.nombres)
+
+    def _internar(self, nombre: str) -> int:
+        i = self.idx.get(nombre)
+        if i is not None:
+            return i
+        i = self.idx[nombre] = len(self.nombres)
+        self.nombres.append(nombre)
+        self.nodos.append(Nodo(nombre))
+        if i >= len(self._A):
+            # crece al doble: agregar salas de a una es O(1) amortizado
+            nuevo = np.full((max(4, 2*len(self._A)),)*2, self.default_weight, dtype=np.int32)
+            nuevo[:len(self._A), :len(self._A)] = self._A
+            self._A = nuevo
+        self._A[i, :] = self._A[:, i] = self.default_weight
+        self._A[i, i] = 0
+        return i
+
+    def _ids(self, a: str, b: str) -> Optional[Tuple[int, int]]:
+        motivo = None
+        if a == b:
+            motivo = "par consigo misma"
+        elif self.cerrado and (a not in self.idx or b not in self.idx):
+            motivo = "sala fuera del catálogo"
+        if motivo is not None:
+            if self.estricto:
+                raise ValueError(f"Par inválido ({a!r}, {b!r}): {motivo}")
+            self.invalidos.append((a, b, motivo))
+            return None
+        return self._internar(a), self._internar(b)
+
+    def _fijar(self, i: int, j: int) -> None:
+        par = _par(i, j)
+        if par in self.prefs:
+            w = self.prefs[par]
+        elif par in self.ceros:
+            w = 0
+        else:
+            w = self.default_weight
+        self._A[i, j] = self._A[j, i] = w
+
+    # ---------- edición incremental ----------
+    def agregar_cero(self, a: str, b: str) -> bool:
+        """Prohíbe a~b. Devuelve False si el par era inválido o repetido."""
+        ids = self._ids(a, b)
+        if ids is None:
+            return False
+        par = _par(*ids)
+        if par in self.ceros:
+            self.duplicados += 1
+            return False
+        self.ceros.add(par)
+        self.nodos[ids[0]].add_restriccion(self.nodos[ids[1]])
+        self._fijar(*ids)
+        return True
+
+    def agregar_preferencia(self, a: str, b: str, peso: int) -> bool:
+        """Fija el peso de a~b (si ya existía, se reemplaza)."""
+        ids = self._ids(a, b)
+        if ids is None:
+            return False
+        par = _par(*ids)
+        if par in self.prefs:
+            self.duplicados += 1
+        self.nodos[ids[0]].add_preferencia(self.nodos[ids[1]], peso)
+        self.prefs[par] = peso
+        self._fijar(*ids)
+        return True
+
+    def quitar_cero(self, a: str, b: str) -> bool:
+        par = self._existente(a, b)
+        if par is None or par not in self.ceros:
+            return False
+        self.ceros.discard(par)
+        self.nodos[par[0]].quitar_restriccion(self.nodos[par[1]])
+        self._fijar(*par)
+        return True
+
+    def quitar_preferencia(self, a: str, b: str) -> bool:
+        par = self._existente(a, b)
+        if par is None or par not in self.prefs:
+            return False
+        del self.prefs[par]
+        self.nodos[par[0]].quitar_preferencia(self.nodos[par[1]])
+        self._fijar(*par)
+        return True
+
+    def _existente(self, a: str, b: str) -> Optional[Tuple[int, int]]:
+        if a not in self.idx or b not in self.idx:
+            return None
+        return _par(self.idx[a], self.idx[b])
+
+    # ---------- consultas ----------
+    def peso(self, a: str, b: str) -> int:
+        return int(self._A[self.idx[a], self.idx[b]])
+
+    def matriz(self, rooms: Optional[List[str]] = None):
+        """
+        (A, idx) para 'rooms' (todas las salas si es None), en ese orden.
+        A es una copia int32: el grafo puede seguir editándose.
+        """
+        if rooms is None:
+            rooms = self.nombres
+        for r in rooms:
+            if r not in self.idx:
+                if self.cerrado:
+                    raise ValueError(f"Sala fuera del catálogo: {r!r}")
+                self._internar(r)
+        ids = np.array([self.idx[r] for r in rooms], dtype=np.intp)
+        return self._A[np.ix_(ids, ids)], {r: k for k, r in enumerate(rooms)}
+
+    def grafo(self, rooms: Optional[List[str]] = None) -> Grafo:
+        """
+        Igual que matriz() pero como Grafo (bitsets + pesos dispersos), sin
+        pasar por la matriz densa: para catálogos con cientos de salas.
+        """
+        if rooms is None:
+            rooms = self.nombres
+        local = {self.idx[r]: k for k, r in enumerate(rooms)}
+        g = Grafo(len(rooms), self.default_weight)
+        for i, j in self.ceros:
+            if i in local and j in local:
+                g.prohibir(local[i], local[j])
+        for (i, j), w in self.prefs.items():
+            if i in local and j in local:
+                g.preferir(local[i], local[j], w)
+        return g
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        return (f"<GrafoRestricciones salas={self.n} prohibidos={len(self.ceros)} "
+                f"preferencias={len(self.prefs)}>")
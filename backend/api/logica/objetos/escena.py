@@ -0,0 +1,136 @@
+from typing import Iterable, Optional, Self
+
+import numpy as np
+
+from logica.objetos.objeto import (Objeto, escala, homogenea, rotacion_x,
+                                   rotacion_y, rotacion_z, traslacion)
+
+
+class Escena:
+    """
+    Muchos Objeto empaquetados en un solo arreglo de vértices (V x 3):
+    los vértices del objeto k son coordenadas[desplazamientos[k]:desplazamientos[k+1]].
+    Las transformaciones (a todos o a un subconjunto de objetos) y las cajas,
+    dimensiones y centroides por objeto son una sola operación vectorizada,
+    sin recorrer los objetos en Python. sincronizar() devuelve el resultado
+    a los Objeto originales.
+    """
+
+    def __init__(self, objetos: Iterable[Objeto] = ()) -> None:
+        self.objetos: list[Objeto] = []
+        self.coordenadas = np.empty((0, 3), dtype=np.float64)
+        self.desplazamientos = np.zeros(1, dtype=np.intp)
+        self.extender(objetos)
+
+    def extender(self, objetos: Iterable[Objeto]) -> Self:
+        """Agrega objetos en bloque (una sola concatenación)."""
+        nuevos = list(objetos)
+        if not nuevos:
+            return self
+        bloques = [o.coordenadas for o in nuevos]
+        largos = np.fromiter((len(b) for b in bloques), dtype=np.intp, count=len(bloques))
+        self.coordenadas = np.concatenate([self.coordenadas, *bloques])
+        self.desplazamientos = np.concatenate(
+            [self.desplazamientos, self.desplazamientos[-1] + np.cumsum(largos)])
+        self.objetos.extend(nuevos)
+        return self
+
+    def agregar(self, objeto: Objeto) -> Self:
+        return self.extender([objeto])
+
+    # ---------- índices ----------
+    def __len__(self) -> int:
+        return len(self.objetos)
+
+    def __getitem__(self, k: int) -> np.ndarray:
+        """Vértices del objeto k (vista, sin copia)."""
+        return self.coordenadas[self.desplazamientos[k]:self.desplazamientos[k + 1]]
+
+    @property
+    def cantidades(self) -> np.ndarray:
+        """Vértices por objeto."""
+        return np.diff(self.desplazamientos)
+
+    @property
+    def pertenencia(self) -> np.ndarray:
+        """Para cada vértice, el índice del objeto al que pertenece."""
+        return np.repeat(np.arange(len(self.objetos)), self.cantidades)
+
+    def _filas(self, indices) -> Optional[np.ndarray]:
+        if indices is None:
+            return None
+        return np.isin(self.pertenencia, np.asarray(indices, dtype=np.intp))
+
+    # ---------- transformaciones ----------
+    def transformar(self, matriz, indices=None) -> Self:
+        """
+        Aplica 'matriz' (3x3 o 4x4 homogénea) a todos los objetos o solo a
+        los de 'indices', en una sola multiplicación.
+        """
+        M = homogenea(matriz)
+        filas = self._filas(indices)
+        if filas is None:
+            self.coordenadas = self.coordenadas @ M[:3, :3].T + M[:3, 3]
+        else:
+            self.coordenadas[filas] = self.coordenadas[filas] @ M[:3, :3].T + M[:3, 3]
+        return self
+
+    def trasladar(self, dx: float, dy: float, dz: float, indices=None) -> Self:
+        return self.transformar(traslacion(dx, dy, dz), indices)
+
+    def trasladar_cada(self, desplazamientos) -> Self:
+        """Traslada el objeto k por desplazamientos[k] (K x 3), todos a la vez."""
+        self.coordenadas = self.coordenadas + np.asarray(desplazamientos, dtype=np.float64)[self.pertenencia]
+        return self
+
+    def escalar(self, fx: float, fy: float, fz: float, indices=None) -> Self:
+        return self.transformar(escala(fx, fy, fz), indices)
+
+    def rotar_z(self, g_z: int | float, indices=None) -> Self:
+        return self.transformar(rotacion_z(g_z), indices)
+
+    def rotar_x(self, g_x: int | float, indices=None) -> Self:
+        return self.transformar(rotacion_x(g_x), indices)
+
+    def rotar_y(self, g_y: int | float, indices=None) -> Self:
+        return self.transformar(rotacion_y(g_y), indices)
+
+    # ---------- consultas por objeto, en bloque ----------
+    def cajas(self) -> tuple[np.ndarray, np.ndarray]:
+        """(minimos, maximos), cada uno (K x 3): la caja alineada a los ejes de cada objeto."""
+        k = len(self.objetos)
+        minimos = np.full((k, 3), np.nan)
+        maximos = np.full((k, 3), np.nan)
+        llenos = self.cantidades > 0
+        if llenos.any():
+            inicios = self.desplazamientos[:-1][llenos]
+            minimos[llenos] = np.minimum.reduceat(self.coordenadas, inicios, axis=0)
+            maximos[llenos] = np.maximum.reduceat(self.coordenadas, inicios, axis=0)
+        return minimos, maximos
+
+    def dimensiones(self) -> np.ndarray:
+        """(largo, ancho, alto) de cada objeto (K x 3); 0 con menos de 2 vértices."""
+        minimos, maximos = self.cajas()
+        dims = maximos - minimos
+        dims[self.cantidades < 2] = 0
+        return dims
+
+    def centroides(self) -> np.ndarray:
+        """Promedio de los vértices de cada objeto (K x 3); NaN si no tiene."""
+        k = len(self.objetos)
+        sumas = np.zeros((k, 3))
+        llenos = self.cantidades > 0
+        if llenos.any():
+            sumas[llenos] = np.add.reduceat(self.coordenadas, self.desplazamientos[:-1][llenos], axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sumas / self.cantidades[:, None]
+
+    # ---------- vuelta a los Objeto ----------
+    def sincronizar(self) -> list[Objeto]:
+        """Copia los vértices actuales a cada Objeto original."""
+        for k, o in enumerate(self.objetos):
+            o.set_vertices(self[k])
+        return self.objetos
+
+    def __repr__(self) -> str:
+        return f"<Escena objetos={len(self.objetos)} vertices={len(self.coordenadas)}>"
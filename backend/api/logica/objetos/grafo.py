@@ -0,0 +1,128 @@
+from __future__ import annotations
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+
+def bits(mascara: int) -> Iterator[int]:
+    """Índices de los bits encendidos de 'mascara', de menor a mayor."""
+    while mascara:
+        bajo = mascara & -mascara
+        yield bajo.bit_length() - 1
+        mascara ^= bajo
+
+
+class _Fila:
+    """Fila i de un Grafo: se indexa como A[i][j] sin materializar la fila."""
+    __slots__ = ("i", "mascara", "pesos", "default")
+
+    def __init__(self, i: int, mascara: int, default: int) -> None:
+        self.i = i
+        self.mascara = mascara              # bit j encendido = i~j permitido
+        self.pesos: Dict[int, int] = {}     # solo los pesos != default
+        self.default = default
+
+    def __getitem__(self, j: int) -> int:
+        if not (self.mascara >> j) & 1:
+            return 0
+        return self.pesos.get(j, self.default)
+
+
+class Grafo:
+    """
+    Grafo de salas con ids enteros 0..n-1, pensado para catálogos grandes:
+    - cada sala guarda un bitset de vecinos permitidos (prohibido() es un
+      shift) y un dict solo con los pesos que difieren de 'default';
+    - ocupa O(n^2 / 8 + preferencias) en vez de n^2 enteros;
+    - G[i][j] devuelve el mismo peso que A[i][j] (0 si está prohibido), así
+      que los solvers que recorren A escalar por escalar lo aceptan tal
+      cual, y los que usan la vecindad leen 'permitidos' directamente.
+    """
+    __slots__ = ("n", "default", "_filas")
+
+    def __init__(self, n: int, default: int = 1) -> None:
+        self.n = n
+        self.default = default
+        todos = (1 << n) - 1
+        self._filas: List[_Fila] = [_Fila(i, todos & ~(1 << i), default) for i in range(n)]
+
+    @classmethod
+    def desde_matriz(cls, A, default: int = 1) -> Grafo:
+        M = np.asarray(A)
+        n = len(M)
+        g = cls(n, default)
+        for i, j in zip(*np.nonzero(M == 0)):
+            if i != j:
+                g._filas[i].mascara &= ~(1 << int(j))
+        for i, j in zip(*np.nonzero((M != 0) & (M != default))):
+            g._filas[i].pesos[int(j)] = int(M[i, j])
+        return g
+
+    # ---------- edición ----------
+    def prohibir(self, i: int, j: int) -> None:
+        self._filas[i].mascara &= ~(1 << j)
+        self._filas[j].mascara &= ~(1 << i)
+
+    def permitir(self, i: int, j: int) -> None:
+        if i != j:
+            self._filas[i].mascara |= 1 << j
+            self._filas[j].mascara |= 1 << i
+
+    def preferir(self, i: int, j: int, peso: int) -> None:
+        """Fija el peso de i~j (peso 0 equivale a prohibir)."""
+        if peso == 0:
+            self.prohibir(i, j)
+            return
+        self.permitir(i, j)
+        for a, b in ((i, j), (j, i)):
+            if peso == self.default:
+                self._filas[a].pesos.pop(b, None)
+            else:
+                self._filas[a].pesos[b] = peso
+
+    # ---------- consultas O(1) ----------
+    def prohibido(self, i: int, j: int) -> bool:
+        return not (self._filas[i].mascara >> j) & 1
+
+    def peso(self, i: int, j: int) -> int:
+        return self._filas[i][j]
+
+    def grado(self, i: int) -> int:
+        """Cantidad de vecinos permitidos de i."""
+        return self._filas[i].mascara.bit_count()
+
+    def vecinos(self, i: int) -> List[int]:
+        return list(bits(self._filas[i].mascara))
+
+    @property
+    def permitidos(self) -> List[int]:
+        """Bitset de vecinos permitidos por sala (mismo formato que backtrack_pila)."""
+        return [f.mascara for f in self._filas]
+
+    # ---------- interoperabilidad con A ----------
+    def __getitem__(self, i: int) -> _Fila:
+        return self._filas[i]
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n, self.n)
+
+    def toarray(self) -> np.ndarray:
+        A = np.zeros((self.n, self.n), dtype=np.int32)
+        for f in self._filas:
+            vecinos = list(bits(f.mascara))
+            A[f.i, vecinos] = self.default
+            for j, w in f.pesos.items():
+                if (f.mascara >> j) & 1:
+                    A[f.i, j] = w
+        return A
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        A = self.toarray()
+        return A if dtype is None else A.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return f"<Grafo n={self.n} aristas={sum(f.mascara.bit_count() for f in self._filas) // 2}>"
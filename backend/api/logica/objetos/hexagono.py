@@ -1,8 +1,21 @@
 import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
 
 from logica.objetos.objeto import Objeto
 from logica.objetos.punto import Punto
-from logica.libreria.algebra import punto_medio
+from logica.libreria.algebra_vectorial import punto_en_poligono
+
+# Hexágono de radio 1 (vértice 0 sobre +x), en el mismo orden que hexagono()
+_ANGULOS = 2 * np.pi * np.arange(6) / 6
+HEX_UNITARIO = np.column_stack([np.cos(_ANGULOS), np.sin(_ANGULOS)])
+
+# Vecinos en coordenadas axiales (q, r), en el orden de piso(): el vecino k
+# comparte la arista entre los vértices k y k+1 (dirección 30° + 60° k)
+DIRECCIONES = np.array([(1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1)], dtype=np.int64)
 
 
 def f_x(x, radio, lado):
@@ -14,31 +27,193 @@ def f_y(y, radio, lado):
 
 
 def hexagono(centro: Punto, radio: float):
-    o = Objeto()
-    for i in range(6):
-        x = f_x(centro.x, radio, i)
-        y = f_y(centro.y, radio, i)
-        o.add_vertice(Punto([[x], [y], [0]]))
-
-    for i in range(6):
-        x = f_x(centro.x, radio, i)
-        y = f_y(centro.y, radio, i)
-        o.add_vertice(Punto([[x], [y], [centro.z]]))
-
-    return o
-
-
-def piso(radio: float, espesor: float):
-    # hexágono central
-    centros = [Punto([[0], [0], [0]])]
-    central = hexagono(Punto([[0], [0], [espesor]]), radio)
-
-    # calcular centros vecinos usando puntos medios
-    for i in range(6):
-        v1 = central.vertices[i]
-        v2 = central.vertices[(i + 1) % 6]
-        mx, my = punto_medio(v1, v2)
-        centros.append(Punto([[2 * mx], [2 * my], [0]]))
-
-    # generar hexágonos a partir de esos centros
-    return [hexagono(c, radio) for c in centros]
+    # base en z=0 y tapa en z=centro.z
+    return prismas_hexagonales([centro.get_tuple()], radio)[0]
+
+
+@lru_cache(maxsize=64)
+def plantilla_hexagono(radio: float) -> np.ndarray:
+    """
+    Prisma hexagonal de 'radio' centrado en el origen (12 x 3): los 6
+    vértices de la base en z=0 y los de la tapa en z=1, en el orden de
+    hexagono(). Se calcula una vez por radio y se comparte (solo lectura).
+    """
+    p = np.zeros((12, 3))
+    p[:6, :2] = p[6:, :2] = radio * HEX_UNITARIO
+    p[6:, 2] = 1
+    p.flags.writeable = False
+    return p
+
+
+def prismas_hexagonales(centros, radio: float, alto: float | None = None) -> list[Objeto]:
+    """
+    Un prisma hexagonal por centro (N x 3), armados juntos a partir de la
+    plantilla: V = plantilla * (1, 1, alto) + (x, y, 0), una sola operación
+    para los N. Sin 'alto', la tapa queda en la z de cada centro (como
+    hexagono()). Largo y ancho salen de la plantilla una vez para todos;
+    cada prisma es una vista sobre el arreglo común (N x 12 x 3).
+    """
+    c = np.asarray(centros, dtype=np.float64).reshape(-1, 3)
+    altos = c[:, 2] if alto is None else np.full(len(c), float(alto))
+    plantilla = plantilla_hexagono(radio)
+
+    V = plantilla * np.column_stack([np.ones((len(c), 2)), altos])[:, None, :]
+    V[:, :, :2] += c[:, None, :2]
+
+    largo, ancho = np.ptp(plantilla[:, :2], axis=0).tolist()
+    return [Objeto.desde_arreglo(V[k], (largo, ancho, h))
+            for k, h in enumerate(np.abs(altos).tolist())]
+
+
+# ---------- coordenadas axiales ----------
+def anillos_axiales(anillos: int) -> np.ndarray:
+    """
+    (q, r) de todas las celdas a distancia <= 'anillos' del centro
+    (1 + 3 a (a + 1) celdas), ordenadas por anillo y, dentro de cada
+    anillo, por ángulo desde 30° (el orden de los vecinos en piso()).
+    """
+    rango = np.arange(-anillos, anillos + 1)
+    q, r = (m.ravel() for m in np.meshgrid(rango, rango, indexing="ij"))
+    dentro = np.abs(q + r) <= anillos
+    q, r = q[dentro], r[dentro]
+
+    anillo = np.maximum(np.maximum(np.abs(q), np.abs(r)), np.abs(q + r))
+    x, y = _cartesianas(q, r, 1.0)
+    angulo = np.round((np.degrees(np.arctan2(y, x)) - 30) % 360, 6)
+    orden = np.lexsort((angulo, anillo))
+    return np.column_stack([q[orden], r[orden]])
+
+
+def rectangulo_axial(columnas: int, filas: int) -> np.ndarray:
+    """
+    (q, r) de una grilla de 'columnas' x 'filas' (columnas impares corridas
+    media celda hacia +y), fila por fila.
+    """
+    col, fila = (m.ravel() for m in np.meshgrid(np.arange(columnas), np.arange(filas)))
+    return np.column_stack([col, fila - (col - (col & 1)) // 2])
+
+
+def _cartesianas(q: np.ndarray, r: np.ndarray, paso: float) -> tuple[np.ndarray, np.ndarray]:
+    """Centros (x, y) con 'paso' = distancia entre centros vecinos."""
+    return paso * (math.sqrt(3) / 2) * q, paso * (r + q / 2)
+
+
+def vecinos_axiales(axiales: np.ndarray) -> np.ndarray:
+    """
+    Índice de vecinos (N x 6): vecinos[i, k] es la celda en la dirección k
+    de la celda i, o -1 si no está en la grilla. Se codifica cada (q, r) en
+    un entero y se buscan los 6N vecinos de una vez con searchsorted.
+    """
+    axiales = np.asarray(axiales, dtype=np.int64)
+    if len(axiales) == 0:
+        return np.empty((0, 6), dtype=np.int64)
+    bajo = axiales.min(axis=0) - 1
+    ancho = axiales.max(axis=0) - bajo + 2
+
+    def clave(qr: np.ndarray) -> np.ndarray:
+        return (qr[..., 0] - bajo[0]) * ancho[1] + (qr[..., 1] - bajo[1])
+
+    claves = clave(axiales)
+    orden = np.argsort(claves)
+    ordenadas = claves[orden]
+    buscadas = clave(axiales[:, None, :] + DIRECCIONES)
+    pos = np.searchsorted(ordenadas, buscadas).clip(max=len(ordenadas) - 1)
+    return np.where(ordenadas[pos] == buscadas, orden[pos], -1)
+
+
+# ---------- grilla ----------
+@dataclass
+class Grilla:
+    """
+    Celdas hexagonales de un piso: coordenadas axiales, centros (N x 3, z=0)
+    e índice de vecinos (N x 6, -1 = borde). 'separacion' es el espacio
+    entre los bordes de celdas vecinas.
+    """
+    radio: float
+    axiales: np.ndarray
+    separacion: float = 0.0
+    centros: np.ndarray = field(init=False)
+    vecinos: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.axiales = np.asarray(self.axiales, dtype=np.int64).reshape(-1, 2)
+        x, y = _cartesianas(self.axiales[:, 0], self.axiales[:, 1], self.paso)
+        self.centros = np.column_stack([x, y, np.zeros(len(x))])
+        self.vecinos = vecinos_axiales(self.axiales)
+
+    @property
+    def paso(self) -> float:
+        """Distancia entre centros de celdas vecinas."""
+        return math.sqrt(3) * self.radio + self.separacion
+
+    def __len__(self) -> int:
+        return len(self.axiales)
+
+    def vertices(self) -> np.ndarray:
+        """Vértices (x, y) de todas las celdas (N x 6 x 2)."""
+        return self.centros[:, None, :2] + self.radio * HEX_UNITARIO
+
+    def aristas(self) -> np.ndarray:
+        """Pares (i, j), i < j, de celdas que comparten lado (E x 2)."""
+        i = np.repeat(np.arange(len(self)), 6)
+        j = self.vecinos.ravel()
+        vecinas = j > i
+        return np.column_stack([i[vecinas], j[vecinas]])
+
+    def recortar(self, contiene: Callable[[np.ndarray], np.ndarray]) -> "Grilla":
+        """
+        Deja solo las celdas con sus 6 vértices dentro de la huella;
+        'contiene' recibe puntos (M x 2) y devuelve una máscara (M,).
+        """
+        dentro = contiene(self.vertices().reshape(-1, 2)).reshape(-1, 6).all(axis=1)
+        return Grilla(self.radio, self.axiales[dentro], self.separacion)
+
+    def celdas(self, alto: float = 0.0) -> list[Objeto]:
+        """Un prisma hexagonal por celda (tapa superior en z = alto)."""
+        return prismas_hexagonales(self.centros, self.radio, alto)
+
+
+def grilla_anillos(radio: float, anillos: int, separacion: float = 0.0) -> Grilla:
+    """Celda central más 'anillos' anillos alrededor."""
+    return Grilla(radio, anillos_axiales(anillos), separacion)
+
+
+def grilla_rectangular(radio: float, columnas: int, filas: int, separacion: float = 0.0) -> Grilla:
+    return Grilla(radio, rectangulo_axial(columnas, filas), separacion)
+
+
+def _cubrir(radio: float, semiancho: float, separacion: float) -> Grilla:
+    """Grilla de anillos que alcanza a cubrir un círculo de radio 'semiancho'."""
+    paso = math.sqrt(3) * radio + separacion
+    return grilla_anillos(radio, math.ceil(semiancho / (paso * math.sqrt(3) / 2)) + 1, separacion)
+
+
+def grilla_circular(radio: float, diametro: float, separacion: float = 0.0) -> Grilla:
+    """Celdas que caben enteras en un círculo (piso de un domo)."""
+    r2 = (diametro / 2) ** 2
+    return _cubrir(radio, diametro / 2, separacion).recortar(
+        lambda p: (p ** 2).sum(axis=1) <= r2 + 1e-9)
+
+
+def grilla_cilindro(radio: float, longitud: float, diametro: float, separacion: float = 0.0) -> Grilla:
+    """
+    Celdas que caben enteras en el piso de un cilindro acostado, tomado a
+    la altura del eje: un rectángulo 'longitud' (x) por 'diametro' (y)
+    centrado en el origen.
+    """
+    mitad = np.array([longitud / 2, diametro / 2])
+    return _cubrir(radio, float(np.hypot(*mitad)), separacion).recortar(
+        lambda p: (np.abs(p) <= mitad + 1e-9).all(axis=1))
+
+
+def grilla_poligono(radio: float, poligono, separacion: float = 0.0) -> Grilla:
+    """Celdas que caben enteras en un polígono (M x 2) arbitrario."""
+    poligono = np.asarray(poligono, dtype=np.float64)
+    alcance = float(np.linalg.norm(poligono, axis=1).max())
+    return _cubrir(radio, alcance, separacion).recortar(
+        lambda p: punto_en_poligono(p, poligono))
+
+
+def piso(radio: float, espesor: float, anillos: int = 1):
+    # hexágono central más 'anillos' anillos de celdas vecinas
+    return grilla_anillos(radio, anillos).celdas()
@@ -0,0 +1,312 @@
+from itertools import product
+from typing import Iterable, Optional
+
+import numpy as np
+
+from logica.objetos.escena import Escena
+from logica.objetos.objeto import Objeto
+
+# Codificación de una celda (i, j, k) de la grilla en un solo entero
+_BITS = 21
+_DESPLAZAMIENTO = 1 << (_BITS - 1)
+
+# Una caja que tocaría más celdas que esto (p. ej. la cáscara del domo) no
+# se anota celda por celda: va a una lista aparte que toda consulta revisa
+MAX_CELDAS_OBJETO = 4096
+
+
+def _clave(celdas: np.ndarray) -> np.ndarray:
+    c = celdas.astype(np.int64) + _DESPLAZAMIENTO
+    return (c[..., 0] << (2 * _BITS)) | (c[..., 1] << _BITS) | c[..., 2]
+
+
+def caja(objeto: Objeto) -> tuple[np.ndarray, np.ndarray]:
+    """(minimo, maximo) de la caja alineada a los ejes del objeto."""
+    coordenadas = objeto.coordenadas
+    if len(coordenadas) == 0:
+        raise ValueError("Objeto sin vértices")
+    minimo, maximo = coordenadas.min(axis=0), coordenadas.max(axis=0)
+    if not (np.isfinite(minimo).all() and np.isfinite(maximo).all()):
+        raise ValueError("Objeto con coordenadas no finitas")
+    return minimo, maximo
+
+
+class IndiceEspacial:
+    """
+    Índice de cajas alineadas a los ejes (AABB) de Objeto sobre una grilla
+    uniforme de celdas de lado 'celda': cada objeto se anota en las celdas
+    que toca su caja, así una consulta solo mira los objetos de sus celdas
+    en vez de compararse con todos (O(n^2)).
+    - Las cajas viven en dos arreglos (K x 3) y la prueba exacta de
+      superposición sobre los candidatos es vectorizada.
+    - insertar_lote() calcula todas las celdas de todas las cajas en numpy.
+    - actualizar()/transformar() mueven un objeto a sus celdas nuevas sin
+      reconstruir el resto.
+    - pares() da todos los pares superpuestos con barrido y poda sobre x,
+      vectorizado.
+    - Las cajas que tocarían más de MAX_CELDAS_OBJETO celdas no se anotan
+      en la grilla: quedan en un conjunto aparte que cada consulta suma a
+      sus candidatos.
+    Los objetos sin vértices (o con coordenadas no finitas) no tienen caja
+    y se rechazan con ValueError.
+    Los índices devueltos son posiciones internas: objetos[i] es el Objeto
+    (None si se quitó). La caja es una cota: para objetos que no son cajas
+    (p. ej. hexágonos vecinos) que se superpongan sus AABB no implica que
+    se toquen.
+    Dos cajas se superponen si se penetran más de 'tolerancia' en cada eje
+    (tocarse por una cara no cuenta); en un eje donde alguna es plana basta
+    con que se toquen.
+    """
+
+    def __init__(self, celda: Optional[float] = None, tolerancia: float = 1e-9) -> None:
+        self.celda = celda
+        self.tolerancia = tolerancia
+        self.objetos: list[Optional[Objeto]] = []
+        self._minimos = np.empty((0, 3))
+        self._maximos = np.empty((0, 3))
+        self._activos = np.empty(0, dtype=bool)
+        self._rangos = np.empty((0, 2, 3), dtype=np.int64)   # celdas [lo, hi] de cada caja
+        self._celdas: dict[int, set[int]] = {}
+        self._posicion: dict[int, int] = {}                 # id(objeto) -> índice
+        self._grandes: set[int] = set()                     # cajas fuera de la grilla
+
+    @classmethod
+    def desde_escena(cls, escena: Escena, celda: Optional[float] = None, **opciones) -> "IndiceEspacial":
+        """Índice de los objetos de una Escena, con sus cajas calculadas en bloque."""
+        indice = cls(celda, **opciones)
+        minimos, maximos = escena.cajas()
+        indice._agregar(escena.objetos, minimos, maximos)
+        return indice
+
+    # ---------- tamaño ----------
+    def __len__(self) -> int:
+        return int(self._activos[:len(self.objetos)].sum())
+
+    @property
+    def minimos(self) -> np.ndarray:
+        return self._minimos[:len(self.objetos)]
+
+    @property
+    def maximos(self) -> np.ndarray:
+        return self._maximos[:len(self.objetos)]
+
+    @property
+    def activos(self) -> np.ndarray:
+        return self._activos[:len(self.objetos)]
+
+    def _reservar(self, n: int) -> None:
+        """Agranda los arreglos (al doble) si no caben n objetos más."""
+        necesario = len(self.objetos) + n
+        if necesario <= len(self._minimos):
+            return
+        capacidad = max(necesario, 2 * len(self._minimos), 16)
+        for nombre, forma, tipo, relleno in (("_minimos", (3,), np.float64, np.nan),
+                                             ("_maximos", (3,), np.float64, np.nan),
+                                             ("_activos", (), bool, False),
+                                             ("_rangos", (2, 3), np.int64, 0)):
+            viejo = getattr(self, nombre)
+            nuevo = np.full((capacidad,) + forma, relleno, dtype=tipo)
+            nuevo[:len(viejo)] = viejo
+            setattr(self, nombre, nuevo)
+
+    # ---------- grilla ----------
+    def _celdas_de(self, minimos: np.ndarray, maximos: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        lo = np.floor(minimos / self.celda).astype(np.int64)
+        hi = np.floor(maximos / self.celda).astype(np.int64)
+        return lo, hi
+
+    def _anotar(self, indices: np.ndarray) -> None:
+        """Anota los objetos 'indices' en todas las celdas que tocan, en bloque."""
+        indices = np.asarray(indices)
+        lo, hi = self._rangos[indices, 0], self._rangos[indices, 1]
+        tramo = hi - lo + 1
+        # en float: el producto de tres tramos enormes desborda int64
+        grandes = tramo.astype(np.float64).prod(axis=1) > MAX_CELDAS_OBJETO
+        if grandes.any():
+            self._grandes.update(indices[grandes].tolist())
+            indices, lo, tramo = indices[~grandes], lo[~grandes], tramo[~grandes]
+            if not len(indices):
+                return
+        cuantas = tramo.prod(axis=1)
+        dueno = np.repeat(np.arange(len(indices)), cuantas)
+        k = np.arange(cuantas.sum()) - np.repeat(np.cumsum(cuantas) - cuantas, cuantas)
+        sy, sz = tramo[dueno, 1], tramo[dueno, 2]
+        celdas = lo[dueno] + np.column_stack([k // (sy * sz), (k // sz) % sy, k % sz])
+
+        claves = _clave(celdas)
+        orden = np.argsort(claves, kind="stable")
+        claves, miembros = claves[orden], indices[dueno[orden]]
+        unicas, inicios = np.unique(claves, return_index=True)
+        for clave, grupo in zip(unicas.tolist(), np.split(miembros, inicios[1:])):
+            self._celdas.setdefault(clave, set()).update(grupo.tolist())
+
+    def _borrar(self, i: int) -> None:
+        if i in self._grandes:
+            self._grandes.discard(i)
+            return
+        lo, hi = self._rangos[i]
+        for celda in product(*(range(a, b + 1) for a, b in zip(lo.tolist(), hi.tolist()))):
+            clave = int(_clave(np.array(celda)))
+            miembros = self._celdas.get(clave)
+            if miembros is not None:
+                miembros.discard(i)
+                if not miembros:
+                    del self._celdas[clave]
+
+    # ---------- inserción y actualización ----------
+    def _agregar(self, objetos: list[Objeto], minimos: np.ndarray, maximos: np.ndarray) -> np.ndarray:
+        malas = ~(np.isfinite(minimos).all(axis=1) & np.isfinite(maximos).all(axis=1))
+        if malas.any():
+            raise ValueError("Objetos sin vértices o con coordenadas no finitas: "
+                             f"{np.flatnonzero(malas).tolist()}")
+        if self.celda is None:
+            # lado de celda: la mediana del lado mayor de las cajas
+            extension = (maximos - minimos).max(axis=1) if len(objetos) else np.empty(0)
+            mediana = float(np.median(extension)) if len(extension) else 0.0
+            self.celda = mediana if mediana > self.tolerancia else 1.0
+        self._reservar(len(objetos))
+        inicio = len(self.objetos)
+        indices = np.arange(inicio, inicio + len(objetos))
+        self._minimos[indices] = minimos
+        self._maximos[indices] = maximos
+        self._activos[indices] = True
+        lo, hi = self._celdas_de(minimos, maximos)
+        self._rangos[indices, 0], self._rangos[indices, 1] = lo, hi
+        self.objetos.extend(objetos)
+        for i, o in zip(indices.tolist(), objetos):
+            self._posicion[id(o)] = i
+        if len(indices):
+            self._anotar(indices)
+        return indices
+
+    def insertar_lote(self, objetos: Iterable[Objeto]) -> np.ndarray:
+        """Inserta muchos objetos a la vez; devuelve sus índices."""
+        objetos = list(objetos)
+        cajas = [caja(o) for o in objetos]
+        minimos = np.array([c[0] for c in cajas]).reshape(-1, 3)
+        maximos = np.array([c[1] for c in cajas]).reshape(-1, 3)
+        return self._agregar(objetos, minimos, maximos)
+
+    def insertar(self, objeto: Objeto) -> int:
+        return int(self.insertar_lote([objeto])[0])
+
+    def indice(self, objeto: Objeto) -> int:
+        if id(objeto) not in self._posicion:
+            raise KeyError("El objeto no está en el índice")
+        return self._posicion[id(objeto)]
+
+    def actualizar(self, objeto: Objeto) -> None:
+        """Recalcula la caja del objeto (p. ej. tras moverlo) y lo cambia de celdas."""
+        i = self.indice(objeto)
+        minimo, maximo = caja(objeto)
+        self._minimos[i], self._maximos[i] = minimo, maximo
+        lo, hi = self._celdas_de(minimo, maximo)
+        if (lo == self._rangos[i, 0]).all() and (hi == self._rangos[i, 1]).all():
+            return
+        self._borrar(i)
+        self._rangos[i, 0], self._rangos[i, 1] = lo, hi
+        self._anotar(np.array([i]))
+
+    def transformar(self, objeto: Objeto, matriz) -> Objeto:
+        """objeto.transformar(matriz) y actualiza su lugar en el índice."""
+        objeto.transformar(matriz)
+        self.actualizar(objeto)
+        return objeto
+
+    def quitar(self, objeto: Objeto) -> None:
+        i = self._posicion.pop(id(objeto))
+        self._borrar(i)
+        self._activos[i] = False
+        self.objetos[i] = None
+
+    # ---------- superposición ----------
+    def _se_superponen(self, min_a, max_a, min_b, max_b) -> np.ndarray:
+        cruce = np.minimum(max_a, max_b) - np.maximum(min_a, min_b)
+        plana = ((max_a - min_a) <= self.tolerancia) | ((max_b - min_b) <= self.tolerancia)
+        return np.where(plana, cruce >= -self.tolerancia, cruce > self.tolerancia).all(axis=-1)
+
+    def consultar(self, minimo, maximo) -> np.ndarray:
+        """Índices de los objetos cuya caja se superpone con [minimo, maximo]."""
+        if self.celda is None:
+            # todavía no se insertó nada
+            return np.empty(0, dtype=np.int64)
+        minimo = np.asarray(minimo, dtype=np.float64)
+        maximo = np.asarray(maximo, dtype=np.float64)
+        lo, hi = self._celdas_de(minimo, maximo)
+        if np.prod((hi - lo + 1).astype(np.float64)) > len(self._celdas):
+            # la consulta cubre más celdas de las que hay ocupadas: probar todo
+            candidatos = np.flatnonzero(self.activos)
+        else:
+            vistos: set[int] = set(self._grandes)
+            for celda in product(*(range(a, b + 1) for a, b in zip(lo.tolist(), hi.tolist()))):
+                vistos.update(self._celdas.get(int(_clave(np.array(celda))), ()))
+            candidatos = np.fromiter(vistos, dtype=np.int64, count=len(vistos))
+        candidatos.sort()
+        dentro = self._se_superponen(self._minimos[candidatos], self._maximos[candidatos], minimo, maximo)
+        return candidatos[dentro]
+
+    def superpuestos(self, objeto: Objeto) -> list[Objeto]:
+        """Objetos del índice que se superponen con 'objeto' (sin contarse a sí mismo)."""
+        minimo, maximo = caja(objeto)
+        propio = self._posicion.get(id(objeto))
+        return [self.objetos[i] for i in self.consultar(minimo, maximo).tolist() if i != propio]
+
+    def pares(self) -> np.ndarray:
+        """
+        Todos los pares (i, j), i < j, de cajas superpuestas (P x 2). Se
+        ordenan las cajas por x mínima y, para cada una, searchsorted da las
+        que empiezan antes de que termine (candidatas en x); el resto de
+        los ejes se prueba en bloque sobre esas candidatas.
+        """
+        vivos = np.flatnonzero(self.activos)
+        orden = vivos[np.argsort(self._minimos[vivos, 0], kind="stable")]
+        inicio_x = self._minimos[orden, 0]
+        fin = np.searchsorted(inicio_x, self._maximos[orden, 0] + self.tolerancia, side="right")
+        cuantas = np.maximum(fin - np.arange(len(orden)) - 1, 0)
+        a = np.repeat(np.arange(len(orden)), cuantas)
+        b = a + 1 + (np.arange(cuantas.sum()) - np.repeat(np.cumsum(cuantas) - cuantas, cuantas))
+        i, j = orden[a], orden[b]
+        si = self._se_superponen(self._minimos[i], self._maximos[i], self._minimos[j], self._maximos[j])
+        pares = np.sort(np.column_stack([i[si], j[si]]), axis=1)
+        return pares[np.lexsort((pares[:, 1], pares[:, 0]))]
+
+    # ---------- contención en el hábitat ----------
+    def dentro_de_cilindro(self, diametro: float, longitud: float, centro=(0.0, 0.0, 0.0)) -> np.ndarray:
+        """
+        Máscara (K,) de las cajas completamente dentro de un cilindro
+        acostado a lo largo de x (como grilla_cilindro()), centrado en
+        'centro'. Una caja está dentro si su esquina más alejada del eje
+        lo está. Los objetos quitados dan False.
+        """
+        c = np.asarray(centro, dtype=np.float64)
+        lo, hi = self.minimos - c, self.maximos - c
+        lejos = np.maximum(np.abs(lo), np.abs(hi))
+        en_largo = (lo[:, 0] >= -longitud / 2 - self.tolerancia) & (hi[:, 0] <= longitud / 2 + self.tolerancia)
+        en_radio = lejos[:, 1] ** 2 + lejos[:, 2] ** 2 <= (diametro / 2) ** 2 + self.tolerancia
+        return en_largo & en_radio & self.activos
+
+    def dentro_de_domo(self, diametro: float, centro=(0.0, 0.0, 0.0)) -> np.ndarray:
+        """
+        Máscara (K,) de las cajas completamente dentro de un domo
+        (semiesfera sobre z = centro z): su esquina más alejada del centro
+        dentro de la esfera y nada bajo el piso.
+        """
+        c = np.asarray(centro, dtype=np.float64)
+        lo, hi = self.minimos - c, self.maximos - c
+        lejos = np.maximum(np.abs(lo), np.abs(hi))
+        en_esfera = (lejos ** 2).sum(axis=1) <= (diametro / 2) ** 2 + self.tolerancia
+        return en_esfera & (lo[:, 2] >= -self.tolerancia) & self.activos
+
+    def dentro_de(self, envolvente, centro=(0.0, 0.0, 0.0)) -> np.ndarray:
+        """Según la envolvente de routers/rooms.py: Cilindro (longitud, diametro) o Domo (diametro)."""
+        if getattr(envolvente, "longitud", None) is not None:
+            return self.dentro_de_cilindro(envolvente.diametro, envolvente.longitud, centro)
+        return self.dentro_de_domo(envolvente.diametro, centro)
+
+    def fuera_de(self, envolvente, centro=(0.0, 0.0, 0.0)) -> list[Objeto]:
+        """Objetos que no caben en la envolvente."""
+        fuera = ~self.dentro_de(envolvente, centro) & self.activos
+        return [self.objetos[i] for i in np.flatnonzero(fuera).tolist()]
+
+    def __repr__(self) -> str:
+        return f"<IndiceEspacial objetos={len(self)} celdas={len(self._celdas)} grandes={len(self._grandes)} celda={self.celda}>"
@@ -1,30 +1,58 @@
 from __future__ import annotations
 from typing import Dict, List, Self, Tuple
 
+import numpy as np
+
 from logica.objetos.objeto import Objeto
 
 
 class Nodo:
+    """
+    Sala del grafo de restricciones. 'restriccion' es el set de salas con
+    las que no puede ser vecina y 'preferencia' un dict sala -> peso, así
+    prohibido() y peso() son O(1).
+    """
+    __slots__ = ("id", "objeto", "preferencia", "restriccion")
+
     def __init__(self, id) -> None:
         self.id = id
         self.objeto = None
-        self.preferencia = []
-        self.restriccion = []
+        self.preferencia: Dict[Nodo, int] = {}
+        self.restriccion: set = set()
 
     def add_objeto(self, objeto: Objeto) -> Self:
         self.objeto = objeto
         return self
 
     def add_restriccion(self, nodo):
-        self.restriccion.append(nodo)
-        nodo.restriccion.append(self)
+        self.restriccion.add(nodo)
+        nodo.restriccion.add(self)
+        return self
+
+    def add_preferencia(self, nodo, peso: int = 1):
+        self.preferencia[nodo] = peso
+        nodo.preferencia[self] = peso
         return self
 
-    def add_preferencia(self, nodo):
-        self.preferencia.append(nodo)
-        nodo.preferencia.append(nodo)
+    def quitar_restriccion(self, nodo):
+        self.restriccion.discard(nodo)
+        nodo.restriccion.discard(self)
         return self
 
+    def quitar_preferencia(self, nodo):
+        self.preferencia.pop(nodo, None)
+        nodo.preferencia.pop(self, None)
+        return self
+
+    def prohibido(self, nodo) -> bool:
+        return nodo in self.restriccion
+
+    def peso(self, nodo, default: int = 1) -> int:
+        """Peso de la arista con 'nodo' (la preferencia pisa a la restricción)."""
+        if nodo in self.preferencia:
+            return self.preferencia[nodo]
+        return 0 if nodo in self.restriccion else default
+
     def __eq__(self, other: Nodo):
         if isinstance(other, Nodo):
             return self.id == other.id
@@ -42,34 +70,128 @@ class Nodo:
         return self.__str__()
 
 
+def _entradas(rooms, zero_pairs, prefs):
+    """
+    Traduce los pares por nombre a entradas (fila, col, valor) de A en una
+    sola pasada, con cada par en ambos sentidos y sin la diagonal. Van
+    primero los ceros y luego las prefs: ante pares repetidos manda el
+    último. 'prefs' puede ser la lista de restricciones.json
+    ({"pair": [a, b], "weight": w}) o un dict {(a, b): w}.
+    """
+    idx = {r: i for i, r in enumerate(rooms)}
+    if isinstance(prefs, dict):
+        prefs = [{"pair": par, "weight": w} for par, w in prefs.items()]
+    pares = np.array([(idx[a], idx[b]) for a, b in zero_pairs]
+                     + [(idx[p["pair"][0]], idx[p["pair"][1]]) for p in prefs],
+                     dtype=np.intp).reshape(-1, 2)
+    pesos = np.array([0]*len(zero_pairs) + [p["weight"] for p in prefs], dtype=np.int32)
+
+    # (a, b) y (b, a) seguidos, así A queda simétrica aunque haya repetidos
+    filas = pares.ravel()
+    cols = pares[:, ::-1].ravel()
+    vals = np.repeat(pesos, 2)
+    fuera = filas != cols
+    return idx, filas[fuera], cols[fuera], vals[fuera]
+
+
 def matriz_adyacencia(rooms: List[Nodo],
                       zero_pairs: List[Tuple[str, str]],
                       prefs: Dict[Tuple[str, str], int],
                       default_weight: int = 1):
     """
-    Crea A (NxN) simétrica:
+    Crea A (NxN) simétrica como np.ndarray int32 contiguo:
       - default_weight para pares no especificados
       - 0 para pares prohibidos (zero_pairs)
-      - pesos personalizados en 'prefs'
+      - pesos personalizados en 'prefs' (pisan a zero_pairs)
+    Devuelve (A, idx) con idx: sala -> fila de A.
+    """
+    n = len(rooms)
+    idx, filas, cols, vals = _entradas(rooms, zero_pairs, prefs)
+    A = np.full((n, n), default_weight, dtype=np.int32)
+    np.fill_diagonal(A, 0)  # no nos interesa i~i
+    A[filas, cols] = vals
+    return A, idx
+
+
+class MatrizCSR:
+    """
+    A simétrica en formato CSR para catálogos grandes con pocos pares
+    explícitos: solo se guardan las entradas de zero_pairs/prefs; el resto
+    de la fila vale 'default' (y la diagonal 0). Se indexa como A[i][j] o
+    A[i, j] y np.asarray(A) la densifica, así que cualquier solver la acepta.
+    """
+
+    def __init__(self, n: int, indptr: np.ndarray, indices: np.ndarray,
+                 data: np.ndarray, default: int = 1) -> None:
+        self.n = n
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.default = default
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n, self.n)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def obtener(self, i: int, j: int) -> int:
+        if i == j:
+            return 0
+        a, b = self.indptr[i], self.indptr[i + 1]
+        k = a + int(np.searchsorted(self.indices[a:b], j))
+        if k < b and self.indices[k] == j:
+            return int(self.data[k])
+        return self.default
+
+    def fila(self, i: int) -> np.ndarray:
+        """Fila i densa (int32)."""
+        f = np.full(self.n, self.default, dtype=np.int32)
+        f[i] = 0
+        a, b = self.indptr[i], self.indptr[i + 1]
+        f[self.indices[a:b]] = self.data[a:b]
+        return f
+
+    def __getitem__(self, clave):
+        if isinstance(clave, tuple):
+            return self.obtener(*clave)
+        return self.fila(clave)
+
+    def toarray(self) -> np.ndarray:
+        A = np.full((self.n, self.n), self.default, dtype=np.int32)
+        np.fill_diagonal(A, 0)
+        filas = np.repeat(np.arange(self.n), np.diff(self.indptr))
+        A[filas, self.indices] = self.data
+        return A
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        A = self.toarray()
+        return A if dtype is None else A.astype(dtype, copy=False)
+
+
+def matriz_adyacencia_csr(rooms: List[Nodo],
+                          zero_pairs: List[Tuple[str, str]],
+                          prefs: Dict[Tuple[str, str], int],
+                          default_weight: int = 1):
+    """
+    Igual que matriz_adyacencia pero devuelve (MatrizCSR, idx): memoria
+    proporcional a los pares explícitos en vez de N^2.
     """
-    # n = len(rooms)
-    # idx = {r: i for i, r in enumerate(rooms)}
-    # A = [[default_weight for _ in range(n)] for __ in range(n)]
-    # for i in range(n):
-    #     A[i][i] = 0  # no nos interesa i~i
-
-    # # pares prohibidos
-    # for pair in zero_pairs:
-    #     ia, ib = idx[pair[0]], idx[pair[1]]
-    #     A[ia][ib] = 0
-    #     A[ib][ia] = 0
-
-    # for p in prefs:
-    #     pair = p["pair"]  # type: ignore
-    #     w = p["weight"]  # type: ignore
-
-    #     ia, ib = idx[pair[0]], idx[pair[1]]
-    #     A[ia][ib] = w
-    #     A[ib][ia] = w
-
-    # return A, idx
+    n = len(rooms)
+    idx, filas, cols, vals = _entradas(rooms, zero_pairs, prefs)
+
+    # Una entrada por (fila, col): la última de cada par repetido
+    clave = filas * n + cols
+    _, ultimo = np.unique(clave[::-1], return_index=True)
+    orden = len(clave) - 1 - ultimo      # np.unique deja las claves ordenadas
+    filas, cols, vals = filas[orden], cols[orden], vals[orden]
+
+    indptr = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.bincount(filas, minlength=n), out=indptr[1:])
+    return MatrizCSR(n, indptr, cols.astype(np.intp), vals.astype(np.int32),
+                     default=default_weight), idx
@@ -1,101 +1,239 @@
 from random import randint
 from typing import Self
 
-from matplotlib.pylab import cos, radians, sin
+import numpy as np
+from numpy import cos, radians, sin
 
-from logica.libreria.algebra_matrices import producto_punto
-from logica.objetos.punto import Punto
+from logica.objetos.punto import Punto, PuntoArray, PuntoVista
 
 
-class Objeto:
-    def __init__(self) -> None:
-        self.id = randint(100000, 999999)
+def escala(fx: float, fy: float, fz: float) -> np.ndarray:
+    return np.array([
+        [fx, 0, 0],
+        [0, fy, 0],
+        [0, 0, fz]
+    ], dtype=np.float64)
+
+
+def rotacion_z(g_z: int | float) -> np.ndarray:
+    theta = radians(g_z)
+    return np.array([
+        [cos(theta), -sin(theta), 0],
+        [sin(theta),  cos(theta), 0],
+        [0,         0,        1]
+    ])
+
+
+def rotacion_x(g_x: int | float) -> np.ndarray:
+    theta = radians(g_x)
+    return np.array([
+        [1, 0, 0],
+        [0, cos(theta), -sin(theta)],
+        [0, sin(theta),  cos(theta)]
+    ])
+
 
-        self.largo = None
-        self.ancho = None
-        self.alto = None
+def rotacion_y(g_y: int | float) -> np.ndarray:
+    theta = radians(g_y)
+    return np.array([
+        [cos(theta), 0, sin(theta)],
+        [0, 1, 0],
+        [-sin(theta), 0,  cos(theta)]
+    ])
 
-        self.vertices: list[Punto] = []
+
+def traslacion(dx: float, dy: float, dz: float) -> np.ndarray:
+    matriz = np.eye(4)
+    matriz[:3, 3] = (dx, dy, dz)
+    return matriz
+
+
+def homogenea(matriz) -> np.ndarray:
+    """Lleva una matriz 3x3 (lineal) a 4x4 homogénea; una 4x4 queda igual."""
+    M = np.asarray(matriz, dtype=np.float64)
+    if M.shape == (3, 3):
+        H = np.eye(4)
+        H[:3, :3] = M
+        M = H
+    return M
+
+
+class Objeto:
+    """
+    Sólido descrito por sus vértices. Se guardan en un solo arreglo (N x 3)
+    float64: las transformaciones son una multiplicación de matrices y las
+    dimensiones una reducción vectorizada. 'vertices' sigue entregando
+    objetos tipo Punto (vistas sobre el arreglo) para el código existente.
+
+    Con perezoso=True las transformaciones no tocan los vértices: se
+    componen en una matriz homogénea 4x4 pendiente que se aplica (una vez,
+    sobre los vértices originales) recién al leer coordenadas/vertices o
+    dimensiones, y el resultado queda en cache hasta la siguiente
+    transformación. Como siempre se parte de los vértices originales, girar
+    muchas veces no acumula error de redondeo en los vértices. En ese modo
+    las vistas de 'vertices' son de solo lectura.
+    """
+
+    def __init__(self, perezoso: bool = False) -> None:
+        self.id = randint(100000, 999999)
+        self.perezoso = perezoso
+
+        self._dimensiones = (None, None, None)
+        self._dimensiones_pendientes = False
+
+        self._base = np.empty((0, 3), dtype=np.float64)
+        self._transformacion = np.eye(4)
+        self._cache: np.ndarray | None = self._base
+
+    @classmethod
+    def desde_arreglo(cls, coordenadas, dimensiones=None, perezoso: bool = False) -> "Objeto":
+        """
+        Objeto sobre un arreglo (N x 3) ya armado, sin copiarlo ni agregar
+        vértice por vértice. Si se conocen las dimensiones (p. ej. porque
+        todos los objetos de un lote comparten forma) no se recalculan.
+        """
+        o = cls(perezoso)
+        o._base = o._cache = np.asarray(coordenadas, dtype=np.float64).reshape(-1, 3)
+        if dimensiones is None:
+            o.actualizar_dimensiones()
+        else:
+            o._dimensiones = tuple(dimensiones)
+        return o
+
+    # ---------- dimensiones (se recalculan al leerlas si hay pendientes) ----------
+    def _dimension(self, k: int):
+        if self._dimensiones_pendientes:
+            self.actualizar_dimensiones()
+        return self._dimensiones[k]
+
+    def _fijar_dimension(self, k: int, valor) -> None:
+        dims = list(self._dimensiones)
+        dims[k] = valor
+        self._dimensiones = tuple(dims)
+
+    largo = property(lambda self: self._dimension(0), lambda self, v: self._fijar_dimension(0, v))
+    ancho = property(lambda self: self._dimension(1), lambda self, v: self._fijar_dimension(1, v))
+    alto = property(lambda self: self._dimension(2), lambda self, v: self._fijar_dimension(2, v))
+
+    # ---------- vértices ----------
+    @property
+    def coordenadas(self) -> np.ndarray:
+        """Vértices como arreglo (N x 3), una fila (x, y, z) por vértice."""
+        if self._cache is None:
+            T = self._transformacion
+            self._cache = self._base @ T[:3, :3].T + T[:3, 3]
+            self._cache.flags.writeable = False
+        return self._cache
+
+    @property
+    def vertices(self) -> list[Punto]:
+        coordenadas = self.coordenadas
+        return [PuntoVista(coordenadas, i) for i in range(len(coordenadas))]
+
+    @vertices.setter
+    def vertices(self, vertices) -> None:
+        self._base = self._cache = _como_arreglo(vertices)
+        self._transformacion = np.eye(4)
+
+    @property
+    def puntos(self) -> PuntoArray:
+        """Los vértices como PuntoArray (sobre el mismo arreglo, sin copiar)."""
+        return PuntoArray(self.coordenadas)
+
+    def _consolidar(self) -> None:
+        """Aplica la transformación pendiente y la deja en identidad."""
+        if self._cache is None or not self._cache.flags.writeable:
+            self._base = self._cache = np.array(self.coordenadas)
+            self._transformacion = np.eye(4)
+
+    @property
+    def transformacion(self) -> np.ndarray:
+        """Matriz 4x4 acumulada desde los vértices originales."""
+        return self._transformacion.copy()
 
     def actualizar_dimensiones(self) -> Self:
-        if len(self.vertices) < 2:
-            self.largo = self.ancho = self.alto = 0
+        self._dimensiones_pendientes = False
+        coordenadas = self.coordenadas
+        if len(coordenadas) < 2:
+            self._dimensiones = (0, 0, 0)
             return self
 
-        xs = [v.x for v in self.vertices]
-        ys = [v.y for v in self.vertices]
-        zs = [v.z for v in self.vertices]
-
-        self.largo = max(xs) - min(xs)
-        self.ancho = max(ys) - min(ys)
-        self.alto = max(zs) - min(zs)
+        self._dimensiones = tuple(np.ptp(coordenadas, axis=0).tolist())
 
         return self
 
-    def transformar(self, matriz: list[list[int | float]]):
-        nuevos_vertices = []
-        for v in self.matriz():
-            v_rotado = producto_punto(matriz, v)
-            nuevos_vertices.append(Punto(v_rotado))
+    def transformar(self, matriz) -> Self:
+        """
+        Aplica 'matriz': 3x3 (lineal) o 4x4 homogénea (admite traslación).
+        """
+        M = homogenea(matriz)
+        if self.perezoso:
+            self._transformacion = M @ self._transformacion
+            self._cache = None
+            self._dimensiones_pendientes = True
+            return self
 
-        self.vertices = nuevos_vertices
+        # v' = M v para cada vértice, con los vértices como filas: V' = V M^T
+        self._consolidar()
+        self._base = self._cache = self._base @ M[:3, :3].T + M[:3, 3]
 
         return self.actualizar_dimensiones()
 
-    def escalar(self, fx: float, fy: float, fz: float) -> Self:
-        matriz = [
-            [fx, 0, 0],
-            [0, fy, 0],
-            [0, 0, fz]
-        ]
+    def trasladar(self, dx: float, dy: float, dz: float) -> Self:
+        return self.transformar(traslacion(dx, dy, dz))
 
-        return self.transformar(matriz)
+    def escalar(self, fx: float, fy: float, fz: float) -> Self:
+        return self.transformar(escala(fx, fy, fz))
 
     def rotar_z(self, g_z: int | float) -> Self:
-        theta = radians(g_z)
-        matriz = [
-            [cos(theta), -sin(theta), 0],
-            [sin(theta),  cos(theta), 0],
-            [0,         0,        1]
-        ]
-
-        return self.transformar(matriz)
+        return self.transformar(rotacion_z(g_z))
 
     def rotar_x(self, g_x: int | float) -> Self:
-        theta = radians(g_x)
-        matriz = [
-            [1, 0, 0],
-            [0, cos(theta), -sin(theta)],
-            [0, sin(theta),  cos(theta)]
-        ]
-
-        return self.transformar(matriz)
+        return self.transformar(rotacion_x(g_x))
 
     def rotar_y(self, g_y: int | float) -> Self:
-        theta = radians(g_y)
-        matriz = [
-            [cos(theta), 0, sin(theta)],
-            [0, 1, 0],
-            [-sin(theta), 0,  cos(theta)]
-        ]
+        return self.transformar(rotacion_y(g_y))
 
-        return self.transformar(matriz)
-
-    def set_vertices(self, vertices: list[Punto]) -> Self:
+    def set_vertices(self, vertices) -> Self:
+        """Acepta una lista de Punto, un PuntoArray o un arreglo (N x 3)."""
         self.vertices = vertices
 
         return self.actualizar_dimensiones()
 
     def add_vertice(self, vertice: Punto) -> Self:
-        self.vertices.append(vertice)
+        self._consolidar()
+        self._base = self._cache = np.vstack([self._base, [vertice.get_tuple()]])
 
         return self.actualizar_dimensiones()
 
     def matriz(self) -> list[list[list[int | float]]]:
-        return [[[v.x], [v.y], [v.z]] for v in self.vertices]
+        return self.coordenadas[:, :, None].tolist()
+
+    def to_dict(self) -> dict:
+        """Forma serializable (la que entrega la API)."""
+        return {
+            "id": self.id,
+            "largo": self.largo,
+            "ancho": self.ancho,
+            "alto": self.alto,
+            "vertices": [dict(zip("xyz", v)) for v in self.coordenadas.tolist()],
+        }
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def __bool__(self) -> bool:
+        # un Objeto sin vértices sigue siendo un objeto (no depende de __len__)
+        return True
 
     def __str__(self) -> str:
-        return "[" + ", ".join(f"({v.x}, {v.y}, {v.z})" for v in self.vertices) + "]"
+        return "[" + ", ".join(f"({x}, {y}, {z})" for x, y, z in self.coordenadas.tolist()) + "]"
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+def _como_arreglo(vertices) -> np.ndarray:
+    if isinstance(vertices, (np.ndarray, PuntoArray)):
+        return np.array(vertices, dtype=np.float64).reshape(-1, 3)
+    return np.array([v.get_tuple() for v in vertices], dtype=np.float64).reshape(-1, 3)
@@ -1,11 +1,38 @@
+from numbers import Real
+from typing import Iterable, Iterator, Self
+
+import numpy as np
+
+from logica.libreria.algebra_vectorial import matmul_lote
 from logica.libreria.tipos import coordenada
 
 
 class Punto:
-    def __init__(self, m: list[list[int | float]]) -> None:
-        self.x = m[0][0]
-        self.y = m[1][0]
-        self.z = m[2][0]
+    """
+    Punto 3D. Se construye directo, Punto(x, y, z), o con la matriz
+    columna 3x1 de siempre, Punto([[x], [y], [z]]).
+    """
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y: coordenada | None = None, z: coordenada | None = None) -> None:
+        if y is None and z is None:
+            # forma columna 3x1
+            try:
+                if len(x) != 3 or any(len(fila) != 1 for fila in x):
+                    raise TypeError
+                x, y, z = x[0][0], x[1][0], x[2][0]
+            except TypeError:
+                raise TypeError("Punto espera (x, y, z) o una columna 3x1 [[x], [y], [z]]") from None
+        if not all(isinstance(v, Real) for v in (x, y, z)):
+            raise TypeError("Punto espera (x, y, z) o una columna 3x1 [[x], [y], [z]]")
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def desde_tupla(cls, xyz: Iterable[coordenada]) -> "Punto":
+        x, y, z = xyz
+        return cls(x, y, z)
 
     def __str__(self) -> str:
         return f"{self.vector()}"
@@ -18,3 +45,162 @@ class Punto:
 
     def get_tuple(self) -> tuple:
         return (self.x, self.y, self.z)
+
+
+class PuntoVista(Punto):
+    """
+    Punto que lee y escribe directo en la fila 'i' de un arreglo (N x 3),
+    p. ej. los vértices de un Objeto: no copia nada y los cambios se ven
+    en el arreglo.
+    """
+    __slots__ = ("_arreglo", "_i")
+
+    def __init__(self, arreglo, i: int) -> None:
+        self._arreglo = arreglo
+        self._i = i
+
+    @property
+    def x(self) -> float:
+        return float(self._arreglo[self._i, 0])
+
+    @x.setter
+    def x(self, valor: coordenada) -> None:
+        self._arreglo[self._i, 0] = valor
+
+    @property
+    def y(self) -> float:
+        return float(self._arreglo[self._i, 1])
+
+    @y.setter
+    def y(self, valor: coordenada) -> None:
+        self._arreglo[self._i, 1] = valor
+
+    @property
+    def z(self) -> float:
+        return float(self._arreglo[self._i, 2])
+
+    @z.setter
+    def z(self, valor: coordenada) -> None:
+        self._arreglo[self._i, 2] = valor
+
+
+def _operando(otro):
+    """Lleva el otro lado de una operación a algo que numpy difunda contra (N x 3)."""
+    if isinstance(otro, PuntoArray):
+        return otro.datos
+    if isinstance(otro, Punto):
+        return np.array(otro.get_tuple(), dtype=np.float64)
+    return otro
+
+
+class PuntoArray:
+    """
+    Muchos puntos en un solo arreglo (N x 3) float64: 24 bytes por punto
+    en vez de un objeto Python por punto. Indexar con un entero entrega un
+    PuntoVista (lee y escribe en el arreglo); con un slice o una máscara,
+    otro PuntoArray (vista si numpy lo permite). La aritmética es
+    vectorizada y np.asarray(puntos) devuelve el arreglo sin copiarlo.
+    """
+    __slots__ = ("datos",)
+
+    def __init__(self, datos=()) -> None:
+        if isinstance(datos, PuntoArray):
+            datos = datos.datos
+        elif not isinstance(datos, np.ndarray):
+            datos = list(datos)
+            if datos and isinstance(datos[0], Punto):
+                datos = [p.get_tuple() for p in datos]
+        self.datos = np.asarray(datos, dtype=np.float64).reshape(-1, 3)
+
+    @classmethod
+    def desde_xyz(cls, x, y, z) -> "PuntoArray":
+        """Desde columnas (o escalares, que se repiten)."""
+        return cls(np.stack(np.broadcast_arrays(x, y, z), axis=1))
+
+    @classmethod
+    def ceros(cls, n: int) -> "PuntoArray":
+        return cls(np.zeros((n, 3)))
+
+    # ---------- columnas ----------
+    @property
+    def x(self) -> np.ndarray:
+        return self.datos[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.datos[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.datos[:, 2]
+
+    # ---------- contenedor ----------
+    def __len__(self) -> int:
+        return len(self.datos)
+
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            n = len(self.datos)
+            if not -n <= i < n:
+                raise IndexError("índice fuera de rango")
+            return PuntoVista(self.datos, int(i) % n)
+        return PuntoArray(self.datos[i])
+
+    def __setitem__(self, i, valor) -> None:
+        self.datos[i] = _operando(valor)
+
+    def __iter__(self) -> Iterator[PuntoVista]:
+        return (PuntoVista(self.datos, i) for i in range(len(self.datos)))
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self.datos, dtype=dtype)
+        return self.datos if dtype is None else self.datos.astype(dtype, copy=False)
+
+    def tolist(self) -> list[Punto]:
+        return [Punto(x, y, z) for x, y, z in self.datos.tolist()]
+
+    # ---------- aritmética vectorizada ----------
+    def __add__(self, otro) -> "PuntoArray":
+        return PuntoArray(self.datos + _operando(otro))
+
+    __radd__ = __add__
+
+    def __sub__(self, otro) -> "PuntoArray":
+        return PuntoArray(self.datos - _operando(otro))
+
+    def __rsub__(self, otro) -> "PuntoArray":
+        return PuntoArray(_operando(otro) - self.datos)
+
+    def __mul__(self, otro) -> "PuntoArray":
+        return PuntoArray(self.datos * _operando(otro))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro) -> "PuntoArray":
+        return PuntoArray(self.datos / _operando(otro))
+
+    def __neg__(self) -> "PuntoArray":
+        return PuntoArray(-self.datos)
+
+    def __iadd__(self, otro) -> Self:
+        self.datos += _operando(otro)
+        return self
+
+    def __isub__(self, otro) -> Self:
+        self.datos -= _operando(otro)
+        return self
+
+    def __imul__(self, otro) -> Self:
+        self.datos *= _operando(otro)
+        return self
+
+    def normas(self) -> np.ndarray:
+        return np.linalg.norm(self.datos, axis=1)
+
+    def transformar(self, matriz) -> "PuntoArray":
+        """Aplica una matriz 3x3 o 4x4 homogénea a todos los puntos."""
+        return PuntoArray(matmul_lote(matriz, self.datos))
+
+    def __repr__(self) -> str:
+        return f"<PuntoArray n={len(self.datos)}>"
@@ -0,0 +1,251 @@
+# ----------------------------------------
+# Render sin pantalla de vistas previas
+# ----------------------------------------
+import hashlib
+import io
+import json
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+from logica.libreria.malla import extruir
+from logica.objetos.hexagono import Grilla, grilla_anillos, grilla_cilindro, grilla_circular
+
+FORMATOS = {"png": "image/png", "svg": "image/svg+xml"}
+VISTAS = ("planta", "3d")
+HUELLAS = ("anillos", "domo", "cilindro")
+# 60 anillos = 10 981 celdas: tope para lo que se arma dentro de un request
+# (también acota las grillas de domo / cilindro)
+MAX_ANILLOS = 60
+MAX_PIXELES = 2048
+
+
+@dataclass(frozen=True)
+class Diseno:
+    """
+    Lo que define una vista previa: la grilla del piso (anillos alrededor
+    del centro, o recortada a un domo / cilindro), la vista y el formato.
+    Dos diseños iguales tienen la misma clave() y comparten imagen.
+    """
+    radio: float = 1.0
+    alto: float = 0.4
+    separacion: float = 0.0
+    huella: str = "anillos"
+    anillos: int = 1
+    diametro: Optional[float] = None
+    longitud: Optional[float] = None
+    vista: str = "planta"
+    formato: str = "png"
+    pixeles: int = 512
+    elev: float = 30.0
+    azim: float = 35.0
+
+    def __post_init__(self) -> None:
+        if self.formato not in FORMATOS:
+            raise ValueError(f"Formato no soportado: {self.formato}")
+        if self.vista not in VISTAS:
+            raise ValueError(f"Vista no soportada: {self.vista}")
+        if self.huella not in HUELLAS:
+            raise ValueError(f"Huella no soportada: {self.huella}")
+        if not self.radio > 0 or not self.alto > 0:
+            raise ValueError("radio y alto deben ser positivos")
+        if not self.separacion >= 0:
+            raise ValueError("separacion no puede ser negativa")
+        if not 16 <= self.pixeles <= MAX_PIXELES:
+            raise ValueError(f"pixeles debe estar entre 16 y {MAX_PIXELES}")
+        if self.huella == "anillos":
+            if not 0 <= self.anillos <= MAX_ANILLOS:
+                raise ValueError(f"anillos debe estar entre 0 y {MAX_ANILLOS}")
+            return
+        if self.diametro is None or not self.diametro > 0:
+            raise ValueError(f"La huella '{self.huella}' necesita diametro positivo")
+        semiancho = self.diametro / 2
+        if self.huella == "cilindro":
+            if self.longitud is None or not self.longitud > 0:
+                raise ValueError("La huella 'cilindro' necesita longitud positiva")
+            semiancho = math.hypot(self.longitud / 2, self.diametro / 2)
+        # grilla_circular / grilla_cilindro recortan una grilla de anillos que cubre la huella
+        paso = math.sqrt(3) * self.radio + self.separacion
+        if semiancho / (paso * math.sqrt(3) / 2) > MAX_ANILLOS:
+            raise ValueError("La huella necesita demasiadas celdas para ese radio")
+
+    def clave(self) -> str:
+        """
+        Hash de los campos que influyen en la imagen: los que la huella o la
+        vista no usan (p. ej. diametro con 'anillos', alto o cámara en planta)
+        no entran, así dos diseños que se ven igual comparten clave.
+        """
+        datos = asdict(self)
+        if self.huella == "anillos":
+            del datos["diametro"], datos["longitud"]
+        else:
+            del datos["anillos"]
+            if self.huella == "domo":
+                del datos["longitud"]
+        if self.vista == "planta":
+            del datos["alto"], datos["elev"], datos["azim"]
+        datos = {k: float(v) if isinstance(v, (int, float)) and k not in ("anillos", "pixeles") else v
+                 for k, v in datos.items()}
+        texto = json.dumps(datos, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def grilla(self) -> Grilla:
+        if self.huella == "domo":
+            return grilla_circular(self.radio, self.diametro, self.separacion)
+        if self.huella == "cilindro":
+            return grilla_cilindro(self.radio, self.longitud, self.diametro, self.separacion)
+        return grilla_anillos(self.radio, self.anillos, self.separacion)
+
+
+class Lienzo:
+    """
+    Figuras Agg (sin pyplot ni ventana) reutilizadas entre cuadros: una por
+    vista, se limpian los ejes y se vuelve a dibujar sobre la misma figura
+    en vez de crear y destruir una por imagen.
+    """
+
+    def __init__(self, dpi: int = 100) -> None:
+        self.dpi = dpi
+        self._figuras: Dict[str, Tuple[Figure, object]] = {}
+
+    def _ejes(self, vista: str):
+        if vista not in self._figuras:
+            figura = Figure(dpi=self.dpi)
+            FigureCanvasAgg(figura)
+            ejes = figura.add_subplot(111, projection="3d" if vista == "3d" else None)
+            self._figuras[vista] = (figura, ejes)
+        figura, ejes = self._figuras[vista]
+        ejes.cla()
+        return figura, ejes
+
+    def dibujar(self, diseno: Diseno) -> bytes:
+        figura, ejes = self._ejes(diseno.vista)
+        lado = diseno.pixeles / self.dpi
+        figura.set_size_inches(lado, lado)
+        grilla = diseno.grilla()
+
+        if diseno.vista == "planta":
+            ejes.add_collection(PolyCollection(grilla.vertices(), facecolors="lightblue",
+                                               edgecolors="black", linewidths=0.5))
+            ejes.set_aspect("equal", adjustable="datalim")
+            ejes.autoscale_view()
+        else:
+            malla = extruir(grilla.vertices(), diseno.alto)
+            ejes.add_collection3d(malla.coleccion(facecolors="lightblue", edgecolors="black",
+                                                  linewidths=0.3, alpha=0.75))
+            if len(malla.vertices):
+                bajo, alto = malla.vertices.min(axis=0), malla.vertices.max(axis=0)
+                centro, mitad = (bajo + alto) / 2, (alto - bajo).max() / 2
+                ejes.set_xlim(centro[0] - mitad, centro[0] + mitad)
+                ejes.set_ylim(centro[1] - mitad, centro[1] + mitad)
+                ejes.set_zlim(centro[2] - mitad, centro[2] + mitad)
+            ejes.view_init(elev=diseno.elev, azim=diseno.azim)
+        ejes.set_axis_off()
+
+        salida = io.BytesIO()
+        figura.savefig(salida, format=diseno.formato)
+        return salida.getvalue()
+
+
+# Un Lienzo por proceso del pool (se crea en el initializer y se reusa)
+_lienzo: Optional[Lienzo] = None
+
+
+def _iniciar_worker() -> None:
+    global _lienzo
+    _lienzo = Lienzo()
+
+
+def _renderizar(diseno: Diseno) -> bytes:
+    global _lienzo
+    if _lienzo is None:
+        _lienzo = Lienzo()
+    return _lienzo.dibujar(diseno)
+
+
+class PoolRender:
+    """
+    Vistas previas renderizadas en un ProcessPoolExecutor (cada worker con
+    su Lienzo) y guardadas en un cache LRU por Diseno.clave(). lote()
+    reparte muchos diseños entre los workers a la vez.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_entradas: int = 512) -> None:
+        self.max_workers = max_workers
+        self.max_entradas = max_entradas
+        self.hits = 0
+        self.misses = 0
+        self._memoria: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _iniciar(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 initializer=_iniciar_worker)
+            return self._pool
+
+    def _buscar(self, clave: str) -> Optional[bytes]:
+        with self._lock:
+            imagen = self._memoria.get(clave)
+            if imagen is None:
+                self.misses += 1
+                return None
+            self._memoria.move_to_end(clave)
+            self.hits += 1
+            return imagen
+
+    def _recordar(self, clave: str, imagen: bytes) -> None:
+        with self._lock:
+            self._memoria[clave] = imagen
+            self._memoria.move_to_end(clave)
+            while len(self._memoria) > self.max_entradas:
+                self._memoria.popitem(last=False)
+
+    def previsualizar(self, diseno: Diseno) -> Tuple[str, bytes]:
+        """(clave, imagen) del diseño, del cache o recién renderizada."""
+        clave = diseno.clave()
+        imagen = self._buscar(clave)
+        if imagen is None:
+            imagen = self._iniciar().submit(_renderizar, diseno).result()
+            self._recordar(clave, imagen)
+        return clave, imagen
+
+    def lote(self, disenos: List[Diseno]) -> List[bytes]:
+        """Imágenes de muchos diseños; solo se renderizan los que faltan."""
+        claves = [d.clave() for d in disenos]
+        imagenes = [self._buscar(c) for c in claves]
+        faltan = {c: d for c, d, img in zip(claves, disenos, imagenes) if img is None}
+        nuevas: Dict[str, bytes] = {}
+        if faltan:
+            nuevas = dict(zip(faltan, self._iniciar().map(_renderizar, faltan.values())))
+            for clave, imagen in nuevas.items():
+                self._recordar(clave, imagen)
+        return [img if img is not None else nuevas[c] for c, img in zip(claves, imagenes)]
+
+    def estadisticas(self) -> dict:
+        consultas = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / consultas if consultas else 0.0,
+            "entradas": len(self._memoria),
+            "max_entradas": self.max_entradas,
+        }
+
+    def cerrar(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+renderizador = PoolRender()
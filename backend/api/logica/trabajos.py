@@ -0,0 +1,229 @@
+# ----------------------------------------
+# Trabajos de layout en segundo plano
+# ----------------------------------------
+import multiprocessing as mp
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional
+
+from logica.algoritmo.genetico import Cancelacion, Observador, Presupuesto, Progreso, Stats
+from logica.algoritmo.genetico.busqueda_local import solve_busqueda_local
+from logica.algoritmo.genetico.cache import CacheSoluciones, clave_canonica
+from logica.algoritmo.genetico.evaluacion import puntaje_factible
+from logica.algoritmo.genetico.solver import solve
+
+
+class EstadoTrabajo(str, Enum):
+    pendiente = "pendiente"
+    ejecutando = "ejecutando"
+    terminado = "terminado"
+    cancelado = "cancelado"
+    error = "error"
+
+
+@dataclass
+class Trabajo:
+    id: str
+    rooms: List[str]
+    metodo: str
+    estado: EstadoTrabajo = EstadoTrabajo.pendiente
+    creado: float = field(default_factory=time.time)
+    terminado: Optional[float] = None
+    resultado: Optional[dict] = None
+    error: Optional[str] = None
+
+
+def _publicar(progreso, job_id: str, fase: str, rooms: List[str],
+              perm: Optional[List[int]], score: Optional[int], extra: dict) -> None:
+    progreso[job_id] = {
+        "fase": fase,
+        "best_score": score if perm is not None else None,
+        "best_layout": [rooms[i] for i in perm] if perm is not None else None,
+        **extra,
+    }
+
+
+def _ejecutar(job_id: str, rooms: List[str], A: List[List[int]],
+              anchor_room: Optional[str], metodo: str, tiempo_max: Optional[float],
+              progreso, evento) -> dict:
+    """
+    Corre en un proceso del pool. Primero entrega un layout rápido con
+    búsqueda local y luego lanza el solver pedido, publicando el incumbente
+    en 'progreso' (dict de un Manager) mientras avanza.
+    """
+    inicio = time.perf_counter()
+    perm, score, _ = solve_busqueda_local(rooms, A, anchor_room)
+    _publicar(progreso, job_id, "heuristica", rooms, perm, score, {"elapsed": time.perf_counter() - inicio})
+
+    def reportar(p: Progreso) -> None:
+        if p.best_perm is not None and p.best_score > score:
+            _publicar(progreso, job_id, metodo, rooms, p.best_perm, p.best_score,
+                      {"elapsed": time.perf_counter() - inicio,
+                       "nodes_expanded": p.nodes_expanded,
+                       "nodes_per_sec": p.nodes_per_sec})
+        else:
+            actual = dict(progreso.get(job_id, {}))
+            actual.update(fase=metodo, elapsed=time.perf_counter() - inicio,
+                          nodes_expanded=p.nodes_expanded, nodes_per_sec=p.nodes_per_sec)
+            progreso[job_id] = actual
+
+    presupuesto = Presupuesto(tiempo_max=tiempo_max, cancelacion=Cancelacion(evento))
+    observador = Observador(reportar, cada_nodos=None, cada_ms=250)
+    exacto_perm, exacto_score, stats = solve(rooms, A, anchor_room, metodo,
+                                             observador=observador,
+                                             presupuesto=presupuesto)
+    # Manda el solver pedido; la heurística solo queda si él no dio anillo
+    # (ninguno posible o presupuesto agotado) y tras reverificarla contra A
+    if exacto_perm is not None:
+        perm, score = exacto_perm, exacto_score
+    else:
+        score = puntaje_factible(perm, A)
+        if score is None:
+            perm = None
+    return {
+        "perm": perm,
+        "score": score if perm is not None else None,
+        "layout": [rooms[i] for i in perm] if perm is not None else None,
+        "stats": stats.to_dict(),
+        "elapsed": time.perf_counter() - inicio,
+    }
+
+
+class GestorTrabajos:
+    """
+    Cola de trabajos de layout. Los solves corren en un ProcessPoolExecutor
+    (fuera del event loop de uvicorn); el progreso y la cancelación cruzan
+    de proceso a través de un multiprocessing.Manager. Los resultados óptimos
+    quedan en 'cache' y una instancia repetida se responde sin encolar nada.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_historial: int = 1000,
+                 cache: Optional[CacheSoluciones] = None) -> None:
+        self.max_workers = max_workers
+        self.max_historial = max_historial
+        self.cache = cache if cache is not None else CacheSoluciones()
+        self._trabajos: Dict[str, Trabajo] = {}
+        self._eventos: Dict[str, object] = {}
+        self._futuros: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._progreso = None
+
+    def _iniciar(self) -> None:
+        if self._pool is None:
+            self._manager = mp.Manager()
+            self._progreso = self._manager.dict()
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def enviar(self, rooms: List[str], A: List[List[int]],
+               anchor_room: Optional[str] = None,
+               metodo: str = "held_karp",
+               tiempo_max: Optional[float] = 30.0) -> Trabajo:
+        """
+        Encola un solve y devuelve de inmediato el Trabajo (estado pendiente),
+        o ya terminado si la instancia estaba en el cache.
+        """
+        clave = clave_canonica(rooms, A, anchor_room)
+        guardado = self.cache.obtener(rooms, A, anchor_room, clave=clave)
+        with self._lock:
+            self._iniciar()
+            self._purgar()
+            trabajo = Trabajo(id=uuid.uuid4().hex, rooms=list(rooms), metodo=metodo)
+            if guardado is not None:
+                perm, score, stats = guardado
+                trabajo.resultado = {
+                    "perm": perm,
+                    "score": score if perm is not None else None,
+                    "layout": [rooms[i] for i in perm] if perm is not None else None,
+                    "stats": stats.to_dict(),
+                    "elapsed": 0.0,
+                    "cache": True,
+                }
+                trabajo.estado = EstadoTrabajo.terminado
+                trabajo.terminado = time.time()
+                self._trabajos[trabajo.id] = trabajo
+                return trabajo
+            evento = self._manager.Event()
+            self._trabajos[trabajo.id] = trabajo
+            self._eventos[trabajo.id] = evento
+            futuro = self._pool.submit(_ejecutar, trabajo.id, list(rooms),
+                                       A, anchor_room, metodo,
+                                       tiempo_max, self._progreso, evento)
+            self._futuros[trabajo.id] = futuro
+        futuro.add_done_callback(lambda f, t=trabajo, a=A, an=anchor_room, c=clave:
+                                 self._terminar(t, f, a, an, c))
+        return trabajo
+
+    def _terminar(self, trabajo: Trabajo, futuro: Future, A=None,
+                  anchor_room: Optional[str] = None, clave: Optional[str] = None) -> None:
+        # corre en el hilo del callback: el estado final se escribe bajo el
+        # lock para que obtener() no lo pise con 'ejecutando'
+        resultado = error = None
+        if futuro.cancelled():
+            estado = EstadoTrabajo.cancelado
+        else:
+            try:
+                resultado = futuro.result()
+            except Exception as e:  # el error se reporta por la API
+                estado, error = EstadoTrabajo.error, repr(e)
+            else:
+                stats = Stats.from_dict(resultado["stats"])
+                if A is not None:
+                    self.cache.guardar(trabajo.rooms, A, anchor_room, resultado["perm"],
+                                       resultado["score"] if resultado["perm"] is not None else -10**9,
+                                       stats, clave=clave)
+                cancelado = stats.stopped_by == "cancelado"
+                estado = EstadoTrabajo.cancelado if cancelado else EstadoTrabajo.terminado
+        with self._lock:
+            self._futuros.pop(trabajo.id, None)
+            trabajo.resultado, trabajo.error = resultado, error
+            trabajo.terminado = time.time()
+            trabajo.estado = estado
+
+    def _purgar(self) -> None:
+        """Olvida los trabajos terminados más antiguos si hay demasiados."""
+        viejos = [t for t in self._trabajos.values() if t.terminado is not None]
+        for t in sorted(viejos, key=lambda t: t.terminado)[:max(0, len(self._trabajos) - self.max_historial)]:
+            self._trabajos.pop(t.id, None)
+            self._eventos.pop(t.id, None)
+            self._progreso.pop(t.id, None)
+
+    def obtener(self, job_id: str) -> Optional[Trabajo]:
+        trabajo = self._trabajos.get(job_id)
+        if trabajo is not None and trabajo.estado == EstadoTrabajo.pendiente \
+                and self.progreso(job_id) is not None:
+            # el worker ya publicó algo: salió de la cola. Se vuelve a mirar
+            # bajo el lock por si _terminar() lo cerró mientras tanto
+            with self._lock:
+                if trabajo.estado == EstadoTrabajo.pendiente:
+                    trabajo.estado = EstadoTrabajo.ejecutando
+        return trabajo
+
+    def progreso(self, job_id: str) -> Optional[dict]:
+        if self._progreso is None:
+            return None
+        return self._progreso.get(job_id)
+
+    def cancelar(self, job_id: str) -> bool:
+        evento = self._eventos.get(job_id)
+        if evento is None:
+            return False
+        futuro = self._futuros.get(job_id)
+        if futuro is None or not futuro.cancel():
+            # ya está corriendo: cancelación cooperativa vía Presupuesto
+            evento.set()
+        return True
+
+    def cerrar(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._manager.shutdown()
+            self._pool = self._manager = self._progreso = None
+
+
+gestor = GestorTrabajos()
@@ -1,12 +1,24 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from routers.rooms import router as rooms_router
 from routers.habitats import router as habitats_router
 from routers.formas import router as formas_router
+from logica.trabajos import gestor
+from logica.render import renderizador
 
 from fastapi.middleware.cors import CORSMiddleware
 
 
-app = FastAPI()
+@asynccontextmanager
+async def ciclo_de_vida(app: FastAPI):
+    yield
+    # al apagar: baja los pools de procesos (solves pendientes y render de previews)
+    gestor.cerrar()
+    renderizador.cerrar()
+
+
+app = FastAPI(lifespan=ciclo_de_vida)
 
 # Dominios permitidos (puedes ajustar según tu frontend)
 origins = [
@@ -1,7 +1,11 @@
-from fastapi import APIRouter
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from pydantic import BaseModel
-from logica.objetos.hexagono import hexagono, piso as p
+from logica.libreria.malla import extruir
+from logica.objetos.hexagono import grilla_anillos, hexagono, piso as p
 from logica.objetos.punto import Punto
+from logica.render import FORMATOS, MAX_ANILLOS, MAX_PIXELES, Diseno, renderizador
 
 router = APIRouter(prefix="/formas")
 
@@ -12,10 +16,68 @@ class HexPayload(BaseModel):
 
 @router.post("/hex")
 def hex(payload: HexPayload):
-    centro = Punto(payload.centro)
+    try:
+        centro = Punto(payload.centro)
+    except TypeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     return hexagono(centro, payload.radio).matriz()
 
 
 @router.get("/piso")
-def piso(radio:float, espesor: float):
-    return p(radio, espesor)
+def piso(radio: float = Query(gt=0), espesor: float = Query(ge=0),
+         anillos: int = Query(default=1, ge=0, le=MAX_ANILLOS)):
+    return [o.to_dict() for o in p(radio, espesor, anillos)]
+
+
+# formato -> (método de Malla, media type)
+FORMATOS_MALLA = {
+    "glb": ("a_glb", "model/gltf-binary"),
+    "gltf": ("a_gltf", "model/gltf+json"),
+    "stl": ("a_stl", "model/stl"),
+    "obj": ("a_obj", "text/plain"),
+}
+
+
+@router.get("/piso/malla")
+def piso_malla(radio: float = Query(gt=0), alto: float = Query(gt=0),
+               anillos: int = Query(default=1, ge=0, le=MAX_ANILLOS),
+               separacion: float = Query(default=0.0, ge=0),
+               formato: Literal["glb", "gltf", "stl", "obj"] = "glb"):
+    # todo el piso como una sola malla, listo para el visor del frontend
+    metodo, tipo = FORMATOS_MALLA[formato]
+    malla = extruir(grilla_anillos(radio, anillos, separacion).vertices(), alto)
+    return Response(content=getattr(malla, metodo)(), media_type=tipo)
+
+
+@router.get("/preview")
+def preview(radio: float = Query(default=1.0, gt=0), alto: float = Query(default=0.4, gt=0),
+            separacion: float = Query(default=0.0, ge=0),
+            huella: Literal["anillos", "domo", "cilindro"] = "anillos",
+            anillos: int = Query(default=1, ge=0, le=MAX_ANILLOS),
+            diametro: Optional[float] = Query(default=None, gt=0),
+            longitud: Optional[float] = Query(default=None, gt=0),
+            vista: Literal["planta", "3d"] = "planta",
+            formato: Literal["png", "svg"] = "png",
+            pixeles: int = Query(default=512, ge=16, le=MAX_PIXELES),
+            elev: float = 30.0, azim: float = 35.0,
+            if_none_match: Optional[str] = Header(default=None)):
+    # imagen del piso renderizada sin pantalla; cacheada por hash del diseño
+    try:
+        diseno = Diseno(radio=radio, alto=alto, separacion=separacion, huella=huella,
+                        anillos=anillos, diametro=diametro, longitud=longitud, vista=vista,
+                        formato=formato, pixeles=pixeles, elev=elev, azim=azim)
+    except ValueError as e:
+        # combinaciones inválidas (p. ej. domo sin diametro o demasiadas celdas)
+        raise HTTPException(status_code=422, detail=str(e))
+
+    etag = f'"{diseno.clave()}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    _, imagen = renderizador.previsualizar(diseno)
+    return Response(content=imagen, media_type=FORMATOS[formato],
+                    headers={"ETag": etag, "Cache-Control": "public, max-age=86400"})
+
+
+@router.get("/preview/cache")
+def preview_cache():
+    return renderizador.estadisticas()
@@ -1,12 +1,18 @@
 from enum import Enum
+from pathlib import Path
 from typing import Optional
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from logica.objetos.hexagono import piso
+from logica.libreria.restricciones import GrafoRestricciones
+from logica.trabajos import gestor
 
 PREFIX = "/rooms"
 
+# Catálogo de salas y restricciones (junto a main.py)
+DATOS = Path(__file__).resolve().parent.parent
+ANCLA_DEFECTO = "EVA-3 (Airlock) / Suit Donning & Pressurization"
+
 router = APIRouter(prefix=f"{PREFIX}",
                    tags=["Rooms"])
 
@@ -47,12 +53,60 @@ class Formulario(BaseModel):
     notas: str
 
 
+def cargar_problema(payload: Formulario):
+    """
+    Arma (rooms, A, anchor) a partir del formulario: si 'prioridad' nombra
+    salas del catálogo se usan esas (en ese orden), si no el catálogo completo.
+    """
+    grafo = GrafoRestricciones.desde_json(DATOS / "restricciones.json", DATOS / "rooms.json")
+
+    pedidas = [r for r in payload.prioridad if isinstance(r, str) and r in grafo.idx]
+    rooms = list(dict.fromkeys(pedidas)) or grafo.nombres
+    presentes = set(rooms)
+
+    A, _ = grafo.matriz(rooms)
+    anchor = ANCLA_DEFECTO if ANCLA_DEFECTO in presentes else rooms[0]
+    return rooms, A, anchor
+
+
 @router.post("/")
 def obtener_piso(payload: Formulario):
-    # hacer algo y entregar matriz
-    matriz = piso(1, 0.25)
+    # encola el solve y responde de inmediato con el id del trabajo
+    rooms, A, anchor = cargar_problema(payload)
+    trabajo = gestor.enviar(rooms, A, anchor)
+
+    return {"id": trabajo.id, "estado": trabajo.estado}
+
+
+@router.get("/jobs/{job_id}")
+def obtener_trabajo(job_id: str):
+    trabajo = gestor.obtener(job_id)
+    if trabajo is None:
+        raise HTTPException(status_code=404, detail="Trabajo no encontrado")
+
+    return {
+        "id": trabajo.id,
+        "estado": trabajo.estado,
+        "metodo": trabajo.metodo,
+        "rooms": trabajo.rooms,
+        "progreso": gestor.progreso(job_id),
+        "resultado": trabajo.resultado,
+        "error": trabajo.error,
+    }
+
+
+@router.delete("/jobs/{job_id}")
+def cancelar_trabajo(job_id: str):
+    if not gestor.cancelar(job_id):
+        raise HTTPException(status_code=404, detail="Trabajo no encontrado")
+
+    return {"id": job_id, "cancelado": True}
+
 
-    return matriz
+@router.get("/cache")
+def estadisticas_cache():
+    # hit rate del cache de soluciones del gestor de trabajos
+    return gestor.cache.estadisticas()
 
 
 @router.get("/{id}")
@@ -0,0 +1,11 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.fixture(scope="session")
+def cliente():
+    # el shutdown de la app baja los pools de trabajos y de render
+    with TestClient(app) as c:
+        yield c
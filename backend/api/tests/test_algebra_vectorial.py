@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from logica.libreria.algebra_vectorial import (como_vectores, cruz_lote, matmul_lote, normales,
+                                               normalizar, punto_en_poligono, punto_lote)
+from logica.objetos.objeto import homogenea, rotacion_z, traslacion
+
+rng = np.random.default_rng(0)
+V = rng.uniform(-5, 5, (20, 3))
+W = rng.uniform(-5, 5, (20, 3))
+
+
+def _cruz(a, b):
+    return [a[1]*b[2] - a[2]*b[1], a[2]*b[0] - a[0]*b[2], a[0]*b[1] - a[1]*b[0]]
+
+
+def test_como_vectores():
+    assert como_vectores([1, 2, 3]).tolist() == [[1, 2, 3]]
+    assert como_vectores([[1], [2], [3]]).tolist() == [[1, 2, 3]]
+    assert como_vectores(V).shape == (20, 3)
+
+
+def test_matmul_lote_misma_matriz():
+    M = rng.uniform(-1, 1, (3, 3))
+    assert matmul_lote(M, V) == pytest.approx(np.array([M @ v for v in V]))
+
+
+def test_matmul_lote_homogenea():
+    T = traslacion(1, 2, 3) @ homogenea(rotacion_z(40))
+    esperado = [(T @ np.append(v, 1))[:3] for v in V]
+    assert matmul_lote(T, V) == pytest.approx(np.array(esperado))
+
+
+def test_matmul_lote_una_matriz_por_vector():
+    Ms = rng.uniform(-1, 1, (20, 3, 3))
+    assert matmul_lote(Ms, V) == pytest.approx(np.array([m @ v for m, v in zip(Ms, V)]))
+
+
+def test_cruz_y_punto_lote():
+    assert cruz_lote(V, W) == pytest.approx(np.array([_cruz(a, b) for a, b in zip(V, W)]))
+    # uno contra muchos
+    assert cruz_lote(V[0], W) == pytest.approx(np.array([_cruz(V[0], b) for b in W]))
+    assert punto_lote(V, W) == pytest.approx(np.array([sum(a*b) for a, b in zip(V, W)]))
+    # el cruz es perpendicular a ambos factores
+    C = cruz_lote(V, W)
+    assert np.abs(punto_lote(C, V)).max() < 1e-9 and np.abs(punto_lote(C, W)).max() < 1e-9
+
+
+def test_normalizar():
+    u = normalizar(np.vstack([V, [0, 0, 0]]))
+    assert np.linalg.norm(u[:-1], axis=1) == pytest.approx(np.ones(20))
+    assert u[-1].tolist() == [0, 0, 0]
+
+
+def test_normales():
+    T = rng.uniform(-5, 5, (15, 3, 3))
+    esperado = []
+    for a, b, c in T:
+        n = np.array(_cruz(b - a, c - a))
+        esperado.append(n / np.linalg.norm(n))
+    assert normales(T) == pytest.approx(np.array(esperado))
+
+    # con índices da lo mismo que con los triángulos armados
+    vertices = T.reshape(-1, 3)
+    caras = np.arange(45).reshape(15, 3)
+    assert np.array_equal(normales(vertices, caras), normales(T))
+
+    # antihorario visto desde +z -> normal +z; degenerado -> 0
+    plano = [[[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+             [[0, 0, 0], [1, 1, 1], [2, 2, 2]]]
+    assert normales(plano).tolist() == [[0, 0, 1], [0, 0, -1], [0, 0, 0]]
+
+
+def _dentro_escalar(p, poligono):
+    """Número de giro: referencia sin vectorizar (para puntos fuera del borde)."""
+    angulo = 0.0
+    for k in range(len(poligono)):
+        a = np.subtract(poligono[k], p)
+        b = np.subtract(poligono[(k + 1) % len(poligono)], p)
+        angulo += np.arctan2(a[0]*b[1] - a[1]*b[0], a @ b)
+    return abs(angulo) > np.pi
+
+
+# Cóncavos: una "L" y una estrella de 5 puntas
+L = [(0, 0), (4, 0), (4, 1), (1, 1), (1, 4), (0, 4)]
+_t = np.linspace(np.pi/2, np.pi/2 + 2*np.pi, 10, endpoint=False)
+_r = np.where(np.arange(10) % 2 == 0, 3.0, 1.2)
+ESTRELLA = np.column_stack([_r*np.cos(_t), _r*np.sin(_t)]).tolist()
+
+
+@pytest.mark.parametrize("poligono", [L, ESTRELLA, ESTRELLA[::-1]], ids=["L", "estrella", "estrella-horario"])
+def test_punto_en_poligono_concavo(poligono):
+    puntos = rng.uniform(-4, 5, (400, 2))
+    esperado = [_dentro_escalar(p, np.array(poligono)) for p in puntos]
+    assert punto_en_poligono(puntos, poligono).tolist() == esperado
+
+
+def test_punto_en_poligono_casos():
+    L_dentro = [(0.5, 3), (3, 0.5), (0.5, 0.5)]
+    L_fuera = [(2, 2), (3, 3), (-1, 0.5), (5, 0.5)]
+    assert punto_en_poligono(L_dentro + L_fuera, L).tolist() == [True]*3 + [False]*4
+    # N x 3 usa x, y
+    assert punto_en_poligono([[0.5, 3, 99]], L).tolist() == [True]
+    # el rayo pasa justo por un vértice del rombo: se cuenta una sola vez
+    rombo = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+    assert punto_en_poligono([(-0.5, 0), (-2, 0), (0, 0.5)], rombo).tolist() == [True, False, True]
+
+
+def test_punto_en_poligono_borde_compartido():
+    # Un punto sobre el borde común de dos celdas vecinas cae en exactamente una
+    a = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    derecha = [(1, 0), (2, 0), (2, 1), (1, 1)]
+    arriba = [(0, 1), (1, 1), (1, 2), (0, 2)]
+    for vecina, borde in ((derecha, [(1, 0.25), (1, 0.5), (1, 0.75)]),
+                          (arriba, [(0.25, 1), (0.5, 1), (0.75, 1)])):
+        en_a = punto_en_poligono(borde, a)
+        en_vecina = punto_en_poligono(borde, vecina)
+        assert (en_a ^ en_vecina).all()
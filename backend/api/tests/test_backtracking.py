@@ -0,0 +1,50 @@
+import pytest
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.preproceso import preprocesar
+from logica.algoritmo.genetico.solver import matriz_aleatoria
+from tests.test_preproceso import matriz_gemelos
+
+
+@pytest.mark.parametrize("acotar", [True, False])
+@pytest.mark.parametrize("n", range(1, 9))
+def test_pila_igual_a_recursivo(n, acotar):
+    rooms = [f"R{i}" for i in range(n)]
+    for semilla in range(5):
+        A = matriz_aleatoria(n, semilla)
+        pila = solve_backtracking(rooms, A, acotar=acotar, modo="pila")
+        recursivo = solve_backtracking(rooms, A, acotar=acotar, modo="recursivo")
+        assert pila[:2] == recursivo[:2]
+
+
+def test_modo_desconocido():
+    with pytest.raises(ValueError):
+        solve_backtracking(["R0", "R1"], [[0, 1], [1, 0]], modo="otro")
+
+
+@pytest.mark.parametrize("modo", ["pila", "recursivo"])
+def test_la_cota_no_cambia_el_optimo(modo):
+    rooms = [f"R{i}" for i in range(9)]
+    podados = 0
+    for semilla in range(6):
+        A = matriz_aleatoria(9, semilla, p_cero=0.2)
+        con = solve_backtracking(rooms, A, acotar=True, modo=modo)
+        sin = solve_backtracking(rooms, A, acotar=False, modo=modo)
+        assert con[:2] == sin[:2]
+        assert sin[2].children_pruned_bound == 0
+        assert con[2].nodes_expanded <= sin[2].nodes_expanded
+        podados += con[2].children_pruned_bound
+    assert podados > 0
+
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_simetria_en_ambos_modos(semilla):
+    rooms = [f"R{i}" for i in range(9)]
+    A = matriz_gemelos(9, 4, semilla)
+    simetria = preprocesar(A, 0).simetria
+    pila = solve_backtracking(rooms, A, modo="pila", simetria=simetria)
+    recursivo = solve_backtracking(rooms, A, modo="recursivo", simetria=simetria)
+    libre = solve_backtracking(rooms, A, modo="recursivo")
+    assert pila[:2] == recursivo[:2]
+    assert recursivo[1] == libre[1]
+    assert recursivo[2].nodes_expanded < libre[2].nodes_expanded
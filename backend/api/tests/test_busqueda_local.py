@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.busqueda_local import anillo_greedy, mejorar, solve_busqueda_local
+from logica.algoritmo.genetico.evaluacion import delta_2opt, delta_or_opt, delta_swap, evaluate_perm
+from logica.algoritmo.genetico.programacion_dinamica import solve_held_karp
+from logica.algoritmo.genetico.solver import EXACTOS, matriz_aleatoria, solve
+
+
+def _movimientos(n, simetrica=True):
+    """Todos los movimientos que mira mejorar() (el slot 0 queda fijo)."""
+    for i in range(1, n - 1):
+        for j in range(i + 1, n):
+            if simetrica:
+                yield delta_2opt, (i, j)
+            yield delta_swap, (i, j)
+    for largo in (1, 2, 3):
+        for i in range(1, n - largo + 1):
+            for k in range(n):
+                if not i - 1 <= k < i + largo:
+                    yield delta_or_opt, (i, largo, k, False)
+                    if simetrica:
+                        yield delta_or_opt, (i, largo, k, True)
+
+
+@pytest.mark.parametrize("simetrica", [True, False])
+@pytest.mark.parametrize("n", [4, 6, 9, 12])
+def test_mejorar_llega_a_optimo_local(n, simetrica):
+    for semilla in range(5):
+        A = matriz_aleatoria(n, semilla, p_cero=0.15, simetrica=simetrica)
+        perm = anillo_greedy(A, n, 0, random.Random(semilla))
+        if perm is None:
+            continue
+        score = mejorar(perm, A, Stats())
+        assert perm[0] == 0 and sorted(perm) == list(range(n))
+        assert score == evaluate_perm(perm, A)
+        for delta, args in _movimientos(n, simetrica):
+            d, ok = delta(perm, A, *args)
+            assert not (ok and d > 0), (delta.__name__, args)
+
+
+@pytest.mark.parametrize("simetrica", [True, False])
+@pytest.mark.parametrize("n", range(3, 9))
+def test_solve_busqueda_local(n, simetrica):
+    rooms = [f"R{i}" for i in range(n)]
+    for semilla in range(5):
+        A = matriz_aleatoria(n, semilla, p_cero=0.2, simetrica=simetrica)
+        _, optimo, _ = solve_held_karp(rooms, A)
+        perm, score, _ = solve_busqueda_local(rooms, A, "R1", tiempo_max=5.0)
+        if perm is None:
+            continue
+        assert perm[0] == 1 and sorted(perm) == list(range(n))
+        assert all(A[perm[i]][perm[(i + 1) % n]] for i in range(n))
+        assert score == evaluate_perm(perm, A) <= optimo
+
+
+@pytest.mark.parametrize("diagonal", [0, 3])
+def test_una_sala_igual_que_los_exactos(diagonal):
+    # con una sala el cierre es A[0][0]: todos los solvers coinciden
+    esperado = solve(["R0"], [[diagonal]], metodo="held_karp")[:2]
+    assert solve_busqueda_local(["R0"], [[diagonal]])[:2] == esperado
+    for metodo in EXACTOS:
+        assert solve(["R0"], [[diagonal]], metodo=metodo)[:2] == esperado
@@ -0,0 +1,70 @@
+import numpy as np
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.cache import CacheSoluciones, clave_canonica
+from logica.algoritmo.genetico.solver import matriz_aleatoria
+
+
+def _permutar(rooms, A, orden):
+    A = np.asarray(A)
+    return [rooms[i] for i in orden], A[np.ix_(orden, orden)].tolist()
+
+
+def test_clave_no_depende_del_orden():
+    rooms = [f"R{i}" for i in range(6)]
+    A = matriz_aleatoria(6, 1)
+    rooms2, A2 = _permutar(rooms, A, [3, 0, 5, 1, 4, 2])
+    assert clave_canonica(rooms, A, "R0") == clave_canonica(rooms2, A2, "R0")
+    assert clave_canonica(rooms, A, "R0") == clave_canonica(rooms, np.asarray(A), "R0")
+    # otro anchor u otra A son otra instancia
+    assert clave_canonica(rooms, A, "R0") != clave_canonica(rooms, A, "R1")
+    A[0][1] = A[1][0] = A[0][1] + 1
+    assert clave_canonica(rooms, A, "R0") != clave_canonica(rooms2, A2, "R0")
+
+
+def test_guardar_y_obtener_con_otro_orden(tmp_path):
+    rooms = [f"R{i}" for i in range(6)]
+    A = matriz_aleatoria(6, 2, p_cero=0.1)
+    perm, score, stats = solve_backtracking(rooms, A)
+    cache = CacheSoluciones(directorio=str(tmp_path))
+    assert cache.obtener(rooms, A) is None
+    assert cache.guardar(rooms, A, None, perm, score, stats)
+
+    # el mismo layout (por nombre) con las salas en otro orden
+    rooms2, A2 = _permutar(rooms, A, [0, 4, 2, 5, 1, 3])
+    perm2, score2, stats2 = cache.obtener(rooms2, A2, "R0")
+    assert score2 == score
+    assert [rooms2[i] for i in perm2] == [rooms[i] for i in perm]
+    assert stats2.to_dict() == stats.to_dict()
+
+    # y desde disco, en un cache nuevo
+    nuevo = CacheSoluciones(directorio=str(tmp_path))
+    assert nuevo.obtener(rooms, A)[1] == score
+    assert nuevo.hits_disco == 1
+    assert cache.estadisticas()["hits"] == 1 and cache.estadisticas()["misses"] == 1
+
+
+def test_no_guarda_resultados_sin_probar():
+    rooms = ["R0", "R1", "R2"]
+    A = matriz_aleatoria(3, 0, p_cero=0.0)
+    perm, score, stats = solve_backtracking(rooms, A)
+    stats.proven_optimal = False
+    cache = CacheSoluciones()
+    assert not cache.guardar(rooms, A, None, perm, score, stats)
+    assert cache.obtener(rooms, A) is None
+
+
+def test_resolver_reutiliza():
+    rooms = [f"R{i}" for i in range(5)]
+    A = matriz_aleatoria(5, 4)
+    cache = CacheSoluciones()
+    llamadas = []
+
+    def solver(*args, **opciones):
+        llamadas.append(args)
+        return solve_backtracking(*args, **opciones)
+
+    primero = cache.resolver(solver, rooms, A)
+    segundo = cache.resolver(solver, rooms, A)
+    assert len(llamadas) == 1
+    assert primero[:2] == segundo[:2]
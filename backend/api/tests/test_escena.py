@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from logica.objetos.escena import Escena
+from logica.objetos.objeto import Objeto
+
+
+def _objetos(semilla):
+    """Objetos de distintos tamaños, incluido uno vacío y uno de un solo vértice."""
+    rng = np.random.default_rng(semilla)
+    tamaños = [5, 0, 1, 8, 3, 12]
+    return [Objeto.desde_arreglo(rng.uniform(-10, 10, (t, 3))) if t else Objeto() for t in tamaños]
+
+
+def _copias(objetos):
+    return [np.array(o.coordenadas) for o in objetos]
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_consultas_igual_que_por_objeto(semilla):
+    objetos = _objetos(semilla)
+    escena = Escena(objetos)
+    assert len(escena) == len(objetos)
+    assert escena.cantidades.tolist() == [len(o) for o in objetos]
+
+    minimos, maximos = escena.cajas()
+    dims = escena.dimensiones()
+    centroides = escena.centroides()
+    for k, o in enumerate(objetos):
+        V = o.coordenadas
+        assert np.array_equal(escena[k], V)
+        if len(V) == 0:
+            assert np.isnan(minimos[k]).all() and np.isnan(maximos[k]).all()
+            assert np.isnan(centroides[k]).all()
+            assert dims[k].tolist() == [0, 0, 0]
+            continue
+        assert np.array_equal(minimos[k], V.min(axis=0))
+        assert np.array_equal(maximos[k], V.max(axis=0))
+        assert centroides[k] == pytest.approx(V.mean(axis=0))
+        assert dims[k].tolist() == pytest.approx([o.largo, o.ancho, o.alto])
+
+
+def test_transformar_subconjunto():
+    objetos = _objetos(1)
+    antes = _copias(objetos)
+    escena = Escena(objetos)
+    elegidos = [0, 3]
+    escena.rotar_z(30, indices=elegidos).trasladar(1, -2, 3, indices=elegidos).escalar(2, 1, 1, indices=[5])
+
+    referencia = [Objeto.desde_arreglo(V.copy()) for V in antes]
+    for k in elegidos:
+        referencia[k].rotar_z(30).trasladar(1, -2, 3)
+    referencia[5].escalar(2, 1, 1)
+    for k, r in enumerate(referencia):
+        if k in elegidos or k == 5:
+            assert escena[k] == pytest.approx(r.coordenadas)
+        else:
+            assert np.array_equal(escena[k], antes[k])
+    # los Objeto originales no cambian hasta sincronizar()
+    assert all(np.array_equal(o.coordenadas, V) for o, V in zip(objetos, antes))
+
+
+def test_transformar_todos_y_trasladar_cada():
+    objetos = _objetos(2)
+    antes = _copias(objetos)
+    escena = Escena(objetos).rotar_x(90)
+    for k, V in enumerate(antes):
+        assert escena[k] == pytest.approx(Objeto.desde_arreglo(V.copy()).rotar_x(90).coordenadas)
+
+    desplazamientos = np.arange(len(objetos)*3, dtype=float).reshape(-1, 3)
+    previo = [escena[k].copy() for k in range(len(escena))]
+    escena.trasladar_cada(desplazamientos)
+    for k, V in enumerate(previo):
+        assert escena[k] == pytest.approx(V + desplazamientos[k])
+
+
+def test_sincronizar():
+    objetos = _objetos(3)
+    escena = Escena(objetos).escalar(1, 2, 3, indices=[3]).trasladar(5, 0, 0)
+    devueltos = escena.sincronizar()
+    assert devueltos is escena.objetos
+    dims = escena.dimensiones()
+    for k, o in enumerate(objetos):
+        assert np.array_equal(o.coordenadas, escena[k])
+        assert [o.largo, o.ancho, o.alto] == pytest.approx(dims[k].tolist())
+    # lo sincronizado es una copia: editar la escena después no toca los objetos
+    escena.trasladar(1, 1, 1)
+    assert not np.array_equal(objetos[0].coordenadas, escena[0])
+
+
+def test_extender_y_agregar():
+    objetos = _objetos(0)
+    escena = Escena(objetos[:2]).extender(objetos[2:4]).agregar(objetos[4])
+    assert escena.desplazamientos.tolist() == [0, 5, 5, 6, 14, 17]
+    assert escena.pertenencia.tolist() == [0]*5 + [2] + [3]*8 + [4]*3
+    assert len(Escena().extender([])) == 0
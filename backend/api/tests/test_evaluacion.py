@@ -0,0 +1,97 @@
+import random
+
+import numpy as np
+import pytest
+
+from logica.algoritmo.genetico.evaluacion import (delta_2opt, delta_or_opt, delta_swap, es_simetrica,
+                                                  evaluar_lote, evaluate_perm, puntaje_factible)
+from logica.objetos.grafo import Grafo
+from logica.algoritmo.genetico.solver import matriz_aleatoria
+
+INSTANCIAS = [(n, semilla) for n in range(2, 10) for semilla in range(4)]
+
+
+def _instancia(n, semilla, simetrica=True):
+    rng = random.Random(semilla)
+    perm = list(range(n))
+    rng.shuffle(perm)
+    return perm, matriz_aleatoria(n, semilla, p_cero=0.2, simetrica=simetrica)
+
+
+def _factible(perm, A):
+    return all(A[perm[k]][perm[(k + 1) % len(perm)]] for k in range(len(perm)))
+
+
+def _comparar(perm, A, nuevo, delta, factible):
+    """El delta debe coincidir con reevaluar el anillo entero."""
+    assert delta == evaluate_perm(nuevo, A) - evaluate_perm(perm, A)
+    # 'factible' mira solo las aristas nuevas: coincide cuando el anillo de partida lo es
+    if _factible(nuevo, A):
+        assert factible
+    if _factible(perm, A):
+        assert factible == _factible(nuevo, A)
+
+
+@pytest.mark.parametrize("simetrica", [True, False])
+@pytest.mark.parametrize("n, semilla", INSTANCIAS)
+def test_delta_swap(n, semilla, simetrica):
+    perm, A = _instancia(n, semilla, simetrica)
+    for i in range(n):
+        for j in range(n):
+            nuevo = list(perm)
+            nuevo[i], nuevo[j] = nuevo[j], nuevo[i]
+            _comparar(perm, A, nuevo, *delta_swap(perm, A, i, j))
+
+
+@pytest.mark.parametrize("n, semilla", INSTANCIAS)
+def test_delta_2opt(n, semilla):
+    perm, A = _instancia(n, semilla)
+    for i in range(n):
+        for j in range(i, n):
+            nuevo = perm[:i] + perm[i:j + 1][::-1] + perm[j + 1:]
+            _comparar(perm, A, nuevo, *delta_2opt(perm, A, i, j))
+
+
+@pytest.mark.parametrize("simetrica", [True, False])
+@pytest.mark.parametrize("n, semilla", INSTANCIAS)
+def test_delta_or_opt(n, semilla, simetrica):
+    # invertir el tramo solo vale con A simétrica
+    perm, A = _instancia(n, semilla, simetrica)
+    for largo in range(1, n - 1):
+        for i in range(n - largo + 1):
+            for k in range(n):
+                if i <= k < i + largo or k == (i - 1) % n:
+                    continue
+                for invertir in (False, True) if simetrica else (False,):
+                    tramo = perm[i:i + largo][::-1] if invertir else perm[i:i + largo]
+                    nuevo = perm[:i] + perm[i + largo:]
+                    destino = k + 1 if k < i else k + 1 - largo
+                    nuevo[destino:destino] = tramo
+                    _comparar(perm, A, nuevo, *delta_or_opt(perm, A, i, largo, k, invertir))
+
+
+def test_evaluar_lote_coincide_con_evaluate_perm():
+    rng = np.random.default_rng(0)
+    A = matriz_aleatoria(7, 3, p_cero=0.3)
+    perms = np.array([rng.permutation(7) for _ in range(50)])
+    scores, factible = evaluar_lote(perms, A)
+    for p, s, f in zip(perms.tolist(), scores.tolist(), factible.tolist()):
+        assert s == evaluate_perm(p, A)
+        assert f == _factible(p, A)
+
+
+def test_es_simetrica():
+    for n in range(1, 7):
+        A = matriz_aleatoria(n, n)
+        assert es_simetrica(A) and es_simetrica(np.asarray(A)) and es_simetrica(Grafo.desde_matriz(A))
+    B = matriz_aleatoria(6, 0, simetrica=False)
+    assert not es_simetrica(B) and not es_simetrica(Grafo.desde_matriz(B))
+
+
+def test_puntaje_factible():
+    A = [[0, 2, 3], [2, 0, 0], [3, 1, 0]]
+    assert puntaje_factible([0, 2, 1], A) == 3 + 1 + 2
+    assert puntaje_factible([0, 1, 2], A) is None     # A[1][2] == 0
+    assert puntaje_factible([0, 2], A) is None
+    assert puntaje_factible([0, 0, 1], A) is None
+    assert puntaje_factible(None, A) is None
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from logica.algoritmo.genetico.evaluacion import evaluate_perm, puntaje_factible
+from logica.algoritmo.genetico.evolutivo import CRUCES, _mutar, solve_genetico
+from logica.algoritmo.genetico.programacion_dinamica import solve_held_karp
+from logica.algoritmo.genetico.solver import matriz_aleatoria
+
+
+@pytest.mark.parametrize("cruce", sorted(CRUCES))
+def test_cruces_dan_permutaciones(cruce):
+    rng = np.random.default_rng(0)
+    for m in range(1, 12):
+        for _ in range(50):
+            p1, p2 = rng.permutation(m) + 1, rng.permutation(m) + 1
+            hijo = CRUCES[cruce](p1, p2, rng)
+            assert sorted(hijo.tolist()) == list(range(1, m + 1))
+
+
+def test_mutar_conserva_genes():
+    rng = np.random.default_rng(1)
+    for m in range(0, 10):
+        genoma = rng.permutation(m)
+        _mutar(genoma, rng, p_swap=1.0, p_inversion=1.0)
+        assert sorted(genoma.tolist()) == list(range(m))
+
+
+@pytest.mark.parametrize("cruce", sorted(CRUCES))
+@pytest.mark.parametrize("simetrica", [True, False])
+def test_resultado_factible(cruce, simetrica):
+    rooms = [f"R{i}" for i in range(9)]
+    for semilla in range(4):
+        A = matriz_aleatoria(9, semilla, p_cero=0.2, simetrica=simetrica)
+        perm, score, _ = solve_genetico(rooms, A, "R2", poblacion=40, generaciones=40,
+                                        cruce=cruce, semilla=semilla)
+        _, optimo, _ = solve_held_karp(rooms, A, "R2")
+        if perm is None:
+            continue
+        assert perm[0] == 2
+        assert puntaje_factible(perm, A) == score == evaluate_perm(perm, A)
+        assert score <= optimo
+
+
+def test_semilla_reproducible():
+    rooms = [f"R{i}" for i in range(10)]
+    A = matriz_aleatoria(10, 7, p_cero=0.2)
+    uno = solve_genetico(rooms, A, poblacion=30, generaciones=20, semilla=11)
+    otro = solve_genetico(rooms, A, poblacion=30, generaciones=20, semilla=11)
+    assert uno[:2] == otro[:2]
+
+
+def test_sin_anillo():
+    A = matriz_aleatoria(5, 0, p_cero=0.0)
+    for j in range(5):
+        A[0][j] = A[j][0] = 0
+    perm, _, _ = solve_genetico([f"R{i}" for i in range(5)], A, poblacion=10, generaciones=5)
+    assert perm is None
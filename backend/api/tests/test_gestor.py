@@ -0,0 +1,47 @@
+from concurrent.futures import Future
+
+from logica.trabajos import EstadoTrabajo, GestorTrabajos, Trabajo
+
+
+def _resultado():
+    return {"perm": [0, 1, 2], "score": 3, "layout": ["a", "b", "c"],
+            "stats": {"stopped_by": None, "proven_optimal": True}, "elapsed": 0.0}
+
+
+def test_obtener_no_pisa_un_trabajo_terminado(monkeypatch):
+    gestor = GestorTrabajos()
+    trabajo = Trabajo(id="t", rooms=["a", "b", "c"], metodo="held_karp")
+    gestor._trabajos["t"] = trabajo
+    futuro = Future()
+    futuro.set_result(_resultado())
+
+    def progreso(job_id):
+        # el worker termina justo entre el chequeo de 'pendiente' y la escritura
+        gestor._terminar(trabajo, futuro)
+        return {"fase": "held_karp"}
+
+    monkeypatch.setattr(gestor, "progreso", progreso)
+    assert gestor.obtener("t").estado == EstadoTrabajo.terminado
+    assert trabajo.resultado["score"] == 3 and trabajo.terminado is not None
+
+
+def test_obtener_marca_ejecutando():
+    gestor = GestorTrabajos()
+    gestor._progreso = {"t": {"fase": "heuristica"}}
+    gestor._trabajos["t"] = Trabajo(id="t", rooms=["a"], metodo="held_karp")
+    assert gestor.obtener("t").estado == EstadoTrabajo.ejecutando
+    assert gestor.obtener("otro") is None
+
+
+def test_terminar_con_error_y_cancelado():
+    gestor = GestorTrabajos()
+    con_error, cancelado = (Trabajo(id=i, rooms=["a"], metodo="held_karp") for i in "ec")
+    futuro = Future()
+    futuro.set_exception(RuntimeError("falló"))
+    gestor._terminar(con_error, futuro)
+    assert con_error.estado == EstadoTrabajo.error and "falló" in con_error.error
+
+    futuro = Future()
+    futuro.cancel()
+    gestor._terminar(cancelado, futuro)
+    assert cancelado.estado == EstadoTrabajo.cancelado and cancelado.resultado is None
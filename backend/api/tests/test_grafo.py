@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+import pytest
+
+from logica.algoritmo.genetico.solver import matriz_aleatoria, solve
+from logica.objetos.grafo import Grafo, bits
+
+
+@pytest.mark.parametrize("mascara", [0, 1, 0b1011, 1 << 70, (1 << 70) | 5, (1 << 64) - 1])
+def test_bits(mascara):
+    assert list(bits(mascara)) == [i for i in range(mascara.bit_length()) if (mascara >> i) & 1]
+
+
+def comparar(g, A):
+    n = len(A)
+    assert np.array_equal(g.toarray(), A) and np.array_equal(np.asarray(g), A)
+    for i in range(n):
+        vecinos = [j for j in range(n) if j != i and A[i, j] != 0]
+        assert g.vecinos(i) == vecinos
+        assert g.grado(i) == len(vecinos)
+        assert g.permitidos[i] == sum(1 << j for j in vecinos)
+        for j in range(n):
+            assert g.prohibido(i, j) == (A[i, j] == 0)
+            assert g.peso(i, j) == g[i][j] == A[i, j]
+
+
+@pytest.mark.parametrize("semilla", range(8))
+def test_desde_matriz_igual_a_densa(semilla):
+    A = np.array(matriz_aleatoria(11, semilla, p_cero=0.3, w_max=4), dtype=np.int32)
+    g = Grafo.desde_matriz(A)
+    assert g.shape == A.shape and len(g) == 11
+    comparar(g, A)
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_edicion_igual_a_densa(semilla):
+    rng = random.Random(semilla)
+    n, default = 9, 2
+    g = Grafo(n, default)
+    A = np.full((n, n), default, dtype=np.int32)
+    np.fill_diagonal(A, 0)
+    # pesos explícitos vigentes: permitir() los vuelve a mostrar
+    pesos = {}
+    for _ in range(150):
+        i, j = rng.sample(range(n), 2)
+        accion = rng.randrange(3)
+        if accion == 0:
+            g.prohibir(i, j)
+            A[i, j] = A[j, i] = 0
+        elif accion == 1:
+            g.permitir(i, j)
+            A[i, j] = A[j, i] = pesos.get((min(i, j), max(i, j)), default)
+        else:
+            w = rng.randint(0, 5)
+            g.preferir(i, j, w)
+            if w:
+                pesos[min(i, j), max(i, j)] = w
+            A[i, j] = A[j, i] = w
+        comparar(g, A)
+
+
+def test_permitir_ignora_la_diagonal():
+    g = Grafo(3)
+    g.permitir(1, 1)
+    assert g.prohibido(1, 1) and g.grado(1) == 2
+
+
+def test_solvers_aceptan_grafo():
+    rooms = [f"R{i}" for i in range(8)]
+    A = matriz_aleatoria(8, 3, p_cero=0.2)
+    g = Grafo.desde_matriz(A)
+    for metodo in ("backtracking", "held_karp"):
+        assert solve(rooms, g, metodo=metodo)[:2] == solve(rooms, A, metodo=metodo)[:2]
@@ -0,0 +1,119 @@
+import math
+
+import numpy as np
+import pytest
+
+from logica.objetos.hexagono import (DIRECCIONES, anillos_axiales, f_x, f_y, grilla_anillos, grilla_cilindro,
+                                     grilla_circular, hexagono, piso, plantilla_hexagono,
+                                     prismas_hexagonales)
+from logica.objetos.punto import Punto
+
+
+def _hexagono_base(x, y, z, radio):
+    """La construcción original, vértice por vértice: base en z=0 y tapa en z."""
+    return [[f_x(x, radio, i), f_y(y, radio, i), 0.0] for i in range(6)] + \
+           [[f_x(x, radio, i), f_y(y, radio, i), z] for i in range(6)]
+
+
+@pytest.mark.parametrize("anillos", [0, 1, 2, 5])
+def test_anillos_axiales(anillos):
+    qr = anillos_axiales(anillos)
+    assert len(qr) == 1 + 3 * anillos * (anillos + 1)
+    assert len({tuple(c) for c in qr.tolist()}) == len(qr)
+    distancia = np.maximum(np.maximum(np.abs(qr[:, 0]), np.abs(qr[:, 1])), np.abs(qr.sum(axis=1)))
+    assert (np.diff(distancia) >= 0).all()
+
+
+def test_vecinos_y_aristas():
+    g = grilla_anillos(1.0, 3, separacion=0.2)
+    for i, fila in enumerate(g.vecinos.tolist()):
+        for k, j in enumerate(fila):
+            if j >= 0:
+                assert (g.axiales[j] - g.axiales[i]).tolist() == DIRECCIONES[k].tolist()
+                assert np.linalg.norm(g.centros[j] - g.centros[i]) == pytest.approx(g.paso)
+    # celdas internas: 6 vecinos; aristas = vecinos / 2
+    assert (g.vecinos[0] >= 0).all()
+    assert len(g.aristas()) == (g.vecinos >= 0).sum() // 2
+
+
+def test_recortes_caben_en_la_huella():
+    domo = grilla_circular(0.5, 6.0)
+    assert len(domo) > 0
+    assert (np.linalg.norm(domo.vertices(), axis=2) <= 3.0 + 1e-9).all()
+    cilindro = grilla_cilindro(0.5, 8.0, 3.0)
+    assert len(cilindro) > 0
+    assert (np.abs(cilindro.vertices()) <= np.array([4.0, 1.5]) + 1e-9).all()
+
+
+@pytest.mark.parametrize("radio", [1, 0.5, 2.75])
+def test_prismas_igual_a_la_construccion_original(radio):
+    centros = np.random.default_rng(0).uniform(-10, 10, (25, 3))
+    prismas = prismas_hexagonales(centros, radio)
+    for (x, y, z), o in zip(centros.tolist(), prismas):
+        base = np.array(_hexagono_base(x, y, z, radio))
+        assert o.coordenadas == pytest.approx(base, abs=1e-12)
+        assert [o.largo, o.ancho, o.alto] == pytest.approx(np.ptp(base, axis=0).tolist())
+    assert hexagono(Punto(1, 2, 3), radio).coordenadas == pytest.approx(
+        np.array(_hexagono_base(1, 2, 3, radio)), abs=1e-12)
+
+    # con 'alto' la tapa ignora la z de los centros
+    for (x, y, _), o in zip(centros.tolist(), prismas_hexagonales(centros, radio, alto=0.4)):
+        assert o.coordenadas == pytest.approx(np.array(_hexagono_base(x, y, 0.4, radio)), abs=1e-12)
+
+
+def test_plantilla_compartida_es_de_solo_lectura():
+    p = plantilla_hexagono(1.5)
+    assert plantilla_hexagono(1.5) is p
+    assert not p.flags.writeable
+    with pytest.raises(ValueError):
+        p[0, 0] = 99
+    copia = p.copy()
+
+    # transformar o editar un prisma no toca la plantilla ni a los demás prismas
+    a, b = prismas_hexagonales([[0, 0, 1], [5, 5, 1]], 1.5)
+    antes_b = b.coordenadas.copy()
+    a.trasladar(1, 1, 1).escalar(2, 2, 2)
+    a.vertices[0].x = 123
+    assert np.array_equal(plantilla_hexagono(1.5), copia)
+    assert np.array_equal(b.coordenadas, antes_b)
+    assert np.array_equal(prismas_hexagonales([[0, 0, 1]], 1.5)[0].coordenadas[:, :2], copia[:, :2])
+
+
+def test_piso():
+    celdas = piso(1.0, 0.0, 2)
+    assert len(celdas) == 19
+    assert celdas[0].largo == pytest.approx(2.0) and celdas[0].ancho == pytest.approx(math.sqrt(3))
+
+
+def test_endpoint_piso(cliente):
+    r = cliente.get("/formas/piso", params={"radio": 1, "espesor": 0, "anillos": 2})
+    assert r.status_code == 200 and len(r.json()) == 19
+
+
+@pytest.mark.parametrize("params", [
+    {"radio": 0, "espesor": 0},
+    {"radio": -1, "espesor": 0},
+    {"radio": 1, "espesor": -1},
+    {"radio": 1, "espesor": 0, "anillos": -1},
+    {"radio": 1, "espesor": 0, "anillos": 10_000},
+])
+def test_endpoint_piso_invalido(cliente, params):
+    assert cliente.get("/formas/piso", params=params).status_code == 422
+
+
+@pytest.mark.parametrize("formato, tipo", [("glb", "model/gltf-binary"), ("stl", "model/stl"),
+                                           ("obj", "text/plain"), ("gltf", "model/gltf+json")])
+def test_endpoint_malla(cliente, formato, tipo):
+    r = cliente.get("/formas/piso/malla", params={"radio": 1, "alto": 0.5, "anillos": 1, "formato": formato})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith(tipo)
+
+
+@pytest.mark.parametrize("params", [
+    {"radio": 1, "alto": 0},
+    {"radio": 1, "alto": 1, "separacion": -0.1},
+    {"radio": 1, "alto": 1, "anillos": 10_000},
+    {"radio": 1, "alto": 1, "formato": "fbx"},
+])
+def test_endpoint_malla_invalido(cliente, params):
+    assert cliente.get("/formas/piso/malla", params=params).status_code == 422
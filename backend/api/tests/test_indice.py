@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from logica.objetos.escena import Escena
+from logica.objetos.hexagono import grilla_anillos
+from logica.objetos.indice import MAX_CELDAS_OBJETO, IndiceEspacial, caja
+from logica.objetos.objeto import Objeto, traslacion
+from routers.rooms import Cilindro, Domo
+
+ESQUINAS = np.array(np.meshgrid([0, 1], [0, 1], [0, 1], indexing="ij")).reshape(3, -1).T
+
+
+def cubo(origen, lado):
+    return Objeto.desde_arreglo(np.asarray(origen, dtype=np.float64) + ESQUINAS * lado)
+
+
+def _fuerza_bruta(objetos):
+    """Pares superpuestos comparando todas las cajas contra todas."""
+    cajas = [caja(o) for o in objetos]
+    mn = np.array([c[0] for c in cajas])
+    mx = np.array([c[1] for c in cajas])
+    si = IndiceEspacial()._se_superponen(mn[:, None], mx[:, None], mn[None], mx[None])
+    i, j = np.nonzero(np.triu(si, 1))
+    return np.column_stack([i, j])
+
+
+def _vecinos(pares, k):
+    return sorted(set(pares[pares[:, 0] == k, 1].tolist()) | set(pares[pares[:, 1] == k, 0].tolist()))
+
+
+def _revisar(indice, objetos):
+    esperado = _fuerza_bruta(objetos)
+    assert np.array_equal(indice.pares(), esperado)
+    for k in range(0, len(objetos), 5):
+        obtenidos = sorted(indice.indice(o) for o in indice.superpuestos(objetos[k]))
+        assert obtenidos == _vecinos(esperado, k)
+
+
+@pytest.mark.parametrize("celda", [None, 0.5, 3.0])
+def test_igual_a_fuerza_bruta(celda):
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        n = int(rng.integers(2, 150))
+        objetos = [cubo(rng.uniform(-20, 20, 3), rng.uniform(0.1, 4, 3)) for _ in range(n)]
+        indice = IndiceEspacial(celda)
+        indice.insertar_lote(objetos[:n // 2])
+        for o in objetos[n // 2:]:
+            indice.insertar(o)
+        _revisar(indice, objetos)
+
+        for o in objetos[::4]:
+            indice.transformar(o, traslacion(*rng.uniform(-5, 5, 3)))
+        _revisar(indice, objetos)
+
+        indice.quitar(objetos[1])
+        assert len(indice) == n - 1
+        assert not (indice.pares() == 1).any()
+        with pytest.raises(KeyError):
+            indice.indice(objetos[1])
+
+
+def test_tocarse_no_es_superponerse():
+    indice = IndiceEspacial()
+    indice.insertar_lote([cubo([0, 0, 0], 1), cubo([1, 0, 0], 1), cubo([0.5, 0.5, 0.5], 1)])
+    assert indice.pares().tolist() == [[0, 2], [1, 2]]
+
+
+def test_indice_vacio():
+    indice = IndiceEspacial()
+    assert indice.consultar([0, 0, 0], [1, 1, 1]).tolist() == []
+    assert indice.pares().shape == (0, 2)
+    assert indice.superpuestos(cubo([0, 0, 0], 1)) == []
+    assert len(indice) == 0
+
+
+def test_objetos_sin_caja():
+    vacio = Objeto()
+    indice = IndiceEspacial()
+    with pytest.raises(ValueError):
+        indice.insertar(vacio)
+    with pytest.raises(ValueError):
+        indice.insertar(Objeto.desde_arreglo([[0.0, np.nan, 0.0], [1.0, 1.0, 1.0]]))
+    with pytest.raises(ValueError):
+        IndiceEspacial.desde_escena(Escena([cubo([0, 0, 0], 1), vacio]))
+    # nada quedó a medio insertar
+    assert len(indice) == 0 and indice.celda is None
+
+
+def test_cajas_enormes_fuera_de_la_grilla():
+    rng = np.random.default_rng(1)
+    chicos = [cubo(rng.uniform(-10, 10, 3), rng.uniform(0.2, 1, 3)) for _ in range(60)]
+    cascara = cubo([-50, -50, -50], 100)
+    tubo = cubo([-1000, -0.5, -0.5], [2000, 1, 1])
+    objetos = chicos + [cascara, tubo]
+    indice = IndiceEspacial(celda=0.5)
+    indice.insertar_lote(objetos)
+
+    assert indice._grandes == {60, 61}
+    assert max(len(m) for m in indice._celdas.values()) <= len(chicos)
+    assert sum(len(m) for m in indice._celdas.values()) <= len(chicos) * MAX_CELDAS_OBJETO
+    _revisar(indice, objetos)
+    assert 60 in indice.consultar([1.0, 1.0, 1.0], [1.1, 1.1, 1.1]).tolist()
+
+    # achicada vuelve a la grilla; quitada deja de aparecer
+    indice.transformar(cascara, np.diag([0.01, 0.01, 0.01, 1.0]))
+    indice.quitar(tubo)
+    assert indice._grandes == set()
+    _revisar(indice, objetos[:-1])
+
+
+def test_desde_escena():
+    escena = Escena(grilla_anillos(1.0, 2).celdas(0.4))
+    indice = IndiceEspacial.desde_escena(escena)
+    assert len(indice) == len(escena) == 19
+    # las cajas de hexágonos vecinos se superponen aunque los hexágonos no
+    assert len(indice.pares()) > 0
+    assert np.array_equal(indice.pares(), _fuerza_bruta(escena.objetos))
+
+
+def test_contencion():
+    objetos = [cubo([-1, -1, 0], 1), cubo([0, 0, 0], 2), cubo([4.5, 0, 0], 1), cubo([0, 0, -0.5], 0.2)]
+    indice = IndiceEspacial()
+    indice.insertar_lote(objetos)
+    assert indice.dentro_de(Domo(diametro=6)).tolist() == [True, False, False, False]
+    assert indice.dentro_de(Cilindro(longitud=10, diametro=4)).tolist() == [True, False, False, True]
+    assert indice.fuera_de(Domo(diametro=6)) == objetos[1:]
+    indice.quitar(objetos[0])
+    assert not indice.dentro_de(Domo(diametro=6))[0]
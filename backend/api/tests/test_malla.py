@@ -0,0 +1,134 @@
+import base64
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from logica.libreria.algebra_vectorial import normales
+from logica.libreria.malla import Malla, extruir, malla_objetos
+from logica.objetos.hexagono import grilla_anillos
+
+
+def _mallas():
+    cuadrados = [[(0, 0), (1, 0), (1, 1), (0, 1)], [(1, 0), (2, 0), (2, 1), (1, 1)]]
+    return {
+        "cubos": extruir(cuadrados, 1.0),
+        "cubos-fusionados": extruir(cuadrados, [1.0, 1.0], fusionar_internas=True),
+        "alturas-distintas": extruir(cuadrados, [1.0, 2.5], fusionar_internas=True),
+        "hexagonos": malla_objetos(grilla_anillos(1.0, 2).celdas(alto=0.7), fusionar_internas=True),
+        "vacia": Malla(np.empty((0, 3))),
+    }
+
+
+MALLAS = _mallas()
+
+
+@pytest.fixture(params=sorted(MALLAS))
+def malla(request):
+    return MALLAS[request.param]
+
+
+def _desde_gltf(documento, binario):
+    """(índices, posiciones) leídos del buffer según los bufferViews/accessors."""
+    vistas, accesos = documento["bufferViews"], documento["accessors"]
+    vi, vp = vistas[accesos[0]["bufferView"]], vistas[accesos[1]["bufferView"]]
+    indices = np.frombuffer(binario, "<u4", vi["byteLength"] // 4, vi["byteOffset"])
+    posiciones = np.frombuffer(binario, "<f4", vp["byteLength"] // 4, vp["byteOffset"]).reshape(-1, 3)
+    assert accesos[0]["count"] == len(indices) and accesos[1]["count"] == len(posiciones)
+    assert vp["byteOffset"] % 4 == 0
+    return indices, posiciones
+
+
+def _comparar_gltf(malla, documento, binario):
+    assert documento["asset"]["version"] == "2.0"
+    assert documento["buffers"][0]["byteLength"] == len(binario)
+    indices, posiciones = _desde_gltf(documento, binario)
+    assert indices.tolist() == malla.triangulos().ravel().tolist()
+    # +y hacia arriba: (x, y, z) -> (x, z, -y)
+    esperado = malla.vertices[:, [0, 2, 1]] * [1, 1, -1]
+    assert np.array_equal(posiciones, esperado.astype("<f4"))
+    if len(posiciones):
+        acceso = documento["accessors"][1]
+        assert acceso["min"] == posiciones.min(axis=0).tolist()
+        assert acceso["max"] == posiciones.max(axis=0).tolist()
+
+
+def test_stl(malla):
+    datos = malla.a_stl()
+    t = malla.triangulos()
+    assert len(datos[:80]) == 80 and datos.startswith(b"malla")
+    (cantidad,) = struct.unpack_from("<I", datos, 80)
+    assert cantidad == len(t) and len(datos) == 84 + 50 * len(t)
+
+    registro = np.dtype([("normal", "<f4", 3), ("v", "<f4", (3, 3)), ("attr", "<u2")])
+    assert registro.itemsize == 50
+    filas = np.frombuffer(datos, registro, offset=84)
+    assert np.array_equal(filas["v"], malla.vertices[t].astype("<f4"))
+    assert np.array_equal(filas["normal"], normales(malla.vertices, t).astype("<f4"))
+    assert not filas["attr"].any()
+
+
+def test_glb(malla):
+    datos = malla.a_glb()
+    magia, version, largo = struct.unpack_from("<4sII", datos, 0)
+    assert (magia, version, largo) == (b"glTF", 2, len(datos))
+
+    largo_json, tipo_json = struct.unpack_from("<I4s", datos, 12)
+    assert tipo_json == b"JSON" and largo_json % 4 == 0
+    texto = datos[20:20 + largo_json]
+    documento = json.loads(texto)
+
+    inicio_bin = 20 + largo_json
+    largo_bin, tipo_bin = struct.unpack_from("<I4s", datos, inicio_bin)
+    assert tipo_bin == b"BIN\0" and largo_bin % 4 == 0
+    assert inicio_bin + 8 + largo_bin == len(datos)
+    binario = datos[inicio_bin + 8:]
+    # el bloque BIN puede traer relleno al final, nunca menos que el buffer
+    assert documento["buffers"][0]["byteLength"] <= largo_bin < documento["buffers"][0]["byteLength"] + 4
+    _comparar_gltf(malla, documento, binario[:documento["buffers"][0]["byteLength"]])
+
+
+def test_gltf(malla):
+    documento = json.loads(malla.a_gltf())
+    prefijo, datos = documento["buffers"][0]["uri"].split(",", 1)
+    assert prefijo == "data:application/octet-stream;base64"
+    _comparar_gltf(malla, documento, base64.b64decode(datos))
+
+
+def test_obj():
+    malla = MALLAS["cubos"]
+    lineas = malla.a_obj().splitlines()
+    vertices = [list(map(float, l.split()[1:])) for l in lineas if l.startswith("v ")]
+    caras = [[int(i) - 1 for i in l.split()[1:]] for l in lineas if l.startswith("f ")]
+    assert np.array_equal(vertices, malla.vertices)
+    assert caras == [c for g in malla.caras for c in g.tolist()]
+
+
+def test_fusion_de_paredes_internas():
+    cubos, fusionados = MALLAS["cubos"], MALLAS["cubos-fusionados"]
+    # dos cubos pegados: 12 vértices, 2x6 caras; sin la pared común quedan 10
+    assert len(cubos.vertices) == 12 and cubos.n_caras == 12
+    assert fusionados.n_caras == 10
+    # con alturas distintas las paredes no coinciden y no se quita ninguna
+    assert MALLAS["alturas-distintas"].n_caras == 12
+    assert len(cubos.triangulos()) == 2 * cubos.n_caras
+
+
+@pytest.mark.parametrize("sufijo", [".stl", ".obj", ".gltf", ".glb", ".GLB"])
+def test_exportar(tmp_path, sufijo):
+    malla = MALLAS["hexagonos"]
+    ruta = malla.exportar(tmp_path / f"piso{sufijo}")
+    assert ruta.exists()
+    esperado = {".stl": malla.a_stl, ".obj": malla.a_obj,
+                ".gltf": malla.a_gltf, ".glb": malla.a_glb}[sufijo.lower()]()
+    if isinstance(esperado, str):
+        assert ruta.read_text(encoding="utf-8") == esperado
+    else:
+        assert ruta.read_bytes() == esperado
+
+
+def test_exportar_formato_desconocido(tmp_path):
+    with pytest.raises(ValueError, match="no soportado"):
+        MALLAS["cubos"].exportar(tmp_path / "piso.fbx")
+    assert not (tmp_path / "piso.fbx").exists()
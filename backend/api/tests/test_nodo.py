@@ -0,0 +1,75 @@
+import random
+
+import numpy as np
+import pytest
+
+from logica.objetos.nodo import MatrizCSR, matriz_adyacencia, matriz_adyacencia_csr
+
+
+def instancia(n, semilla, aisladas=0):
+    """Pares al azar (con repetidos y algún a == b); las últimas 'aisladas' salas quedan sin pares."""
+    rng = random.Random(semilla)
+    rooms = [f"R{i}" for i in range(n)]
+    usables = rooms[:n - aisladas]
+    zero_pairs = [tuple(rng.sample(usables, 2)) for _ in range(n)]
+    prefs = [{"pair": [rng.choice(usables), rng.choice(usables)], "weight": rng.randint(2, 9)}
+             for _ in range(n)]
+    return rooms, zero_pairs, prefs
+
+
+def referencia(rooms, zero_pairs, prefs, default_weight=1):
+    """Construcción celda a celda: ceros primero, luego prefs, manda el último."""
+    idx = {r: i for i, r in enumerate(rooms)}
+    A = [[default_weight*(i != j) for j in range(len(rooms))] for i in range(len(rooms))]
+    for a, b in zero_pairs:
+        if a != b:
+            A[idx[a]][idx[b]] = A[idx[b]][idx[a]] = 0
+    for p in prefs:
+        a, b = p["pair"]
+        if a != b:
+            A[idx[a]][idx[b]] = A[idx[b]][idx[a]] = p["weight"]
+    return np.array(A, dtype=np.int32)
+
+
+@pytest.mark.parametrize("semilla", range(10))
+@pytest.mark.parametrize("aisladas", [0, 3])
+def test_csr_igual_a_densa(semilla, aisladas):
+    rooms, zero_pairs, prefs = instancia(12, semilla, aisladas)
+    densa, idx = matriz_adyacencia(rooms, zero_pairs, prefs, default_weight=3)
+    csr, idx_csr = matriz_adyacencia_csr(rooms, zero_pairs, prefs, default_weight=3)
+
+    assert idx == idx_csr
+    assert np.array_equal(densa, referencia(rooms, zero_pairs, prefs, 3))
+    assert isinstance(csr, MatrizCSR) and csr.shape == densa.shape and len(csr) == 12
+    assert csr.toarray().dtype == np.int32
+    assert np.array_equal(csr.toarray(), densa)
+    assert np.array_equal(np.asarray(csr), densa)
+    for i in range(12):
+        assert np.array_equal(csr[i], densa[i])
+        assert [csr[i, j] for j in range(12)] == densa[i].tolist()
+    # una entrada por par explícito, en ambos sentidos y sin repetidos
+    assert csr.nnz == len({(min(idx[a], idx[b]), max(idx[a], idx[b]))
+                           for a, b in zero_pairs + [tuple(p["pair"]) for p in prefs]
+                           if a != b}) * 2
+
+
+def test_salas_aisladas_usan_el_default():
+    rooms, zero_pairs, prefs = instancia(8, 0, aisladas=8 - 3)
+    csr, _ = matriz_adyacencia_csr(rooms, zero_pairs, prefs, default_weight=7)
+    for i in range(3, 8):
+        assert csr.indptr[i] == csr.indptr[i + 1]
+        assert csr[i].tolist() == [7*(j != i) for j in range(8)]
+
+
+def test_sin_pares():
+    rooms = ["a", "b", "c"]
+    csr, _ = matriz_adyacencia_csr(rooms, [], {})
+    assert csr.nnz == 0
+    assert np.array_equal(csr.toarray(), matriz_adyacencia(rooms, [], {})[0])
+
+
+def test_prefs_como_dict():
+    rooms = ["a", "b", "c", "d"]
+    lista = [{"pair": ["a", "c"], "weight": 4}]
+    assert np.array_equal(matriz_adyacencia_csr(rooms, [("a", "c"), ("b", "d")], {("a", "c"): 4})[0].toarray(),
+                          matriz_adyacencia(rooms, [("a", "c"), ("b", "d")], lista)[0])
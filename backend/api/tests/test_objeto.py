@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from logica.objetos.objeto import Objeto, rotacion_z, traslacion
+from logica.objetos.punto import Punto
+
+
+def _cubo():
+    esquinas = np.array(np.meshgrid([0, 1], [0, 1], [0, 1], indexing="ij")).reshape(3, -1).T
+    return Objeto.desde_arreglo(esquinas * (2.0, 3.0, 4.0))
+
+
+def test_objeto_vacio_es_verdadero():
+    vacio = Objeto()
+    assert len(vacio) == 0
+    assert vacio
+    assert (vacio.largo, vacio.ancho, vacio.alto) == (None, None, None)
+    vacio.add_vertice(Punto(1, 2, 3))
+    assert len(vacio) == 1 and vacio.coordenadas.tolist() == [[1, 2, 3]]
+
+
+def test_dimensiones_y_transformaciones():
+    cubo = _cubo()
+    assert (cubo.largo, cubo.ancho, cubo.alto) == (2.0, 3.0, 4.0)
+    cubo.trasladar(1, 1, 1).rotar_z(90)
+    assert cubo.largo == pytest.approx(3.0) and cubo.ancho == pytest.approx(2.0)
+    assert cubo.coordenadas.min(axis=0) == pytest.approx([-4.0, 1.0, 1.0])
+
+
+def test_vertices_son_vistas():
+    cubo = _cubo()
+    cubo.vertices[0].x = 7.0
+    assert cubo.coordenadas[0, 0] == 7.0
+    assert cubo.puntos[0].x == 7.0
+
+
+def test_set_vertices_acepta_puntos_y_arreglos():
+    o = Objeto().set_vertices([Punto(0, 0, 0), Punto(1, 2, 3)])
+    assert (o.largo, o.ancho, o.alto) == (1.0, 2.0, 3.0)
+    assert Objeto().set_vertices(o.coordenadas).coordenadas.tolist() == o.coordenadas.tolist()
@@ -0,0 +1,25 @@
+import pytest
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.paralelo import solve_backtracking_paralelo
+from logica.algoritmo.genetico.solver import matriz_aleatoria
+
+
+@pytest.mark.parametrize("profundidad", [1, 2])
+@pytest.mark.parametrize("n", [2, 3, 6, 8])
+def test_igual_al_serial(n, profundidad):
+    rooms = [f"R{i}" for i in range(n)]
+    for semilla in range(4):
+        A = matriz_aleatoria(n, semilla)
+        serial = solve_backtracking(rooms, A)
+        perm, score, stats = solve_backtracking_paralelo(rooms, A, workers=2, profundidad=profundidad)
+        assert (perm, score) == serial[:2]
+        assert stats.proven_optimal
+
+
+def test_anchor():
+    rooms = [f"R{i}" for i in range(7)]
+    A = matriz_aleatoria(7, 5, p_cero=0.1)
+    perm, score, _ = solve_backtracking_paralelo(rooms, A, "R3", workers=2)
+    assert perm[0] == 3
+    assert score == solve_backtracking(rooms, A, "R3")[1]
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from logica.libreria import plotting
+from logica.objetos.objeto import Objeto
+
+
+def _figura(perezoso):
+    rng = np.random.default_rng(0)
+    return Objeto.desde_arreglo(rng.normal(size=(20, 3)), perezoso=perezoso)
+
+
+def test_perezoso_igual_a_inmediato():
+    inmediato, perezoso = _figura(False), _figura(True)
+    for o in (inmediato, perezoso):
+        o.rotar_z(30).trasladar(1, -2, 0.5).rotar_x(-45).escalar(2, 1, 0.5)
+    np.testing.assert_allclose(perezoso.coordenadas, inmediato.coordenadas, atol=1e-12)
+    assert (perezoso.largo, perezoso.ancho, perezoso.alto) == pytest.approx(
+        (inmediato.largo, inmediato.ancho, inmediato.alto))
+
+
+def test_perezoso_no_acumula_error():
+    o = _figura(True)
+    base = o.coordenadas.copy()
+    for _ in range(360):
+        o.rotar_z(1)
+    np.testing.assert_allclose(o.coordenadas, base, atol=1e-9)
+    assert not o.coordenadas.flags.writeable
+
+
+def _girar(objeto):
+    objeto.rotar_z(90)
+
+
+def _fallar(objeto):
+    objeto.rotar_z(90)
+    raise RuntimeError("ventana cerrada")
+
+
+@pytest.mark.parametrize("perezoso", [False, True])
+def test_dibujar_interactivo_restaura_modo(monkeypatch, perezoso):
+    o = _figura(perezoso)
+    esperado = _figura(False).rotar_z(90).coordenadas
+
+    monkeypatch.setattr(plotting, "_dibujar_interactivo", _girar)
+    plotting.dibujar_interactivo(o)
+    assert o.perezoso is perezoso
+    np.testing.assert_allclose(o.coordenadas, esperado, atol=1e-12)
+    if not perezoso:
+        # la rotación quedó aplicada a los vértices: se pueden volver a editar
+        o.vertices[0].x = 5.0
+
+    monkeypatch.setattr(plotting, "_dibujar_interactivo", _fallar)
+    with pytest.raises(RuntimeError):
+        plotting.dibujar_interactivo(o)
+    assert o.perezoso is perezoso
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.paralelo import _prefijos
+from logica.algoritmo.genetico.preproceso import preprocesar
+from logica.algoritmo.genetico.solver import EXACTOS, matriz_aleatoria, solve, solve_por_componentes
+
+
+def matriz_gemelos(n, t, semilla):
+    """A con las salas 1..t intercambiables entre sí (mismas filas)."""
+    rng = random.Random(semilla)
+    A = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            A[i][j] = A[j][i] = rng.randint(1, 4)
+    for g in range(2, t + 1):
+        for j in range(t + 1, n):
+            A[g][j] = A[j][g] = A[1][j]
+        A[g][0] = A[0][g] = A[1][0]
+    for a in range(1, t + 1):
+        for b in range(1, t + 1):
+            if a != b:
+                A[a][b] = 3
+    return A
+
+
+@pytest.mark.parametrize("metodo", EXACTOS)
+@pytest.mark.parametrize("semilla", range(3))
+def test_gemelos_mismo_optimo(metodo, semilla):
+    rooms = [f"R{i}" for i in range(9)]
+    A = matriz_gemelos(9, 4, semilla)
+    assert preprocesar(A, 0).gemelos
+    _, esperado, _ = solve(rooms, A, metodo="held_karp")
+    opciones = {"profundidad": 2} if metodo == "backtracking_paralelo" else {}
+    perm, score, _ = solve(rooms, A, metodo=metodo, preprocesar=True, **opciones)
+    assert score == esperado
+    assert all(A[perm[i]][perm[(i + 1) % 9]] for i in range(9))
+
+
+@pytest.mark.parametrize("profundidad", [1, 2])
+def test_prefijos_respetan_orden_de_gemelos(profundidad):
+    n = 9
+    A = matriz_gemelos(n, 4, 0)
+    red = preprocesar(A, 0)
+    todos, canonicos = [], []
+    args = ([0] + [-1] * (n - 1), 1, list(range(1, n)), 0, A, n, [0] * n, profundidad)
+    _prefijos(Stats(), *args, todos)
+    _prefijos(Stats(), *args, canonicos, red.simetria)
+    assert 0 < len(canonicos) < len(todos)
+    for prefijo, _ in canonicos:
+        # ningún gemelo aparece antes que uno que debe precederlo
+        colocadas = 0
+        for r in prefijo[1:]:
+            assert red.simetria[r] & ~colocadas == 0, prefijo
+            colocadas |= 1 << r
+
+
+def test_por_componentes():
+    # dos bloques sin aristas entre sí: un anillo por bloque
+    A = [[0] * 6 for _ in range(6)]
+    for bloque in ((0, 1, 2), (3, 4, 5)):
+        for i in bloque:
+            for j in bloque:
+                if i != j:
+                    A[i][j] = 2
+    rooms = [f"R{i}" for i in range(6)]
+    layouts, total, _ = solve_por_componentes(rooms, A)
+    assert sorted(map(sorted, layouts)) == [["R0", "R1", "R2"], ["R3", "R4", "R5"]]
+    assert total == 12
+    assert solve(rooms, A)[0] is None
+    B = matriz_aleatoria(6, 0)
+    assert solve(rooms, B, preprocesar=True)[1] == solve(rooms, B)[1]
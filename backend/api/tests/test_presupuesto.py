@@ -0,0 +1,73 @@
+import pytest
+
+from logica.algoritmo.genetico import Cancelacion, Presupuesto
+from logica.algoritmo.genetico.evaluacion import puntaje_factible
+from logica.algoritmo.genetico.solver import matriz_aleatoria, solve
+
+N = 13
+ROOMS = [f"R{i}" for i in range(N)]
+A = matriz_aleatoria(N, 4, p_cero=0.1)
+
+CASOS = [
+    ("backtracking", {"modo": "pila"}),
+    ("backtracking", {"modo": "recursivo"}),
+    # sin cota el árbol es enorme: el padre siempre alcanza a ver el token
+    ("backtracking_paralelo", {"workers": 2, "acotar": False}),
+    ("held_karp", {}),
+    ("genetico", {"generaciones": 10**6, "poblacion": 40}),
+    ("busqueda_local", {"tiempo_max": 60.0, "reinicios": 10**6}),
+]
+IDS = [f"{m}-{o.get('modo', '')}".rstrip("-") for m, o in CASOS]
+
+
+def _cancelado():
+    token = Cancelacion()
+    token.cancelar()
+    return token
+
+
+def _valido_o_none(perm, score, stats):
+    assert not stats.proven_optimal
+    if perm is None:
+        return
+    assert sorted(perm) == list(range(N)) and perm[0] == 0
+    assert puntaje_factible(perm, A) == score
+
+
+@pytest.mark.parametrize("metodo, opciones", CASOS, ids=IDS)
+def test_corte_por_nodos(metodo, opciones):
+    presupuesto = Presupuesto(nodos_max=200)
+    perm, score, stats = solve(ROOMS, A, metodo=metodo, presupuesto=presupuesto, **opciones)
+    assert stats.stopped_by == "nodos"
+    _valido_o_none(perm, score, stats)
+
+
+@pytest.mark.parametrize("metodo, opciones", CASOS, ids=IDS)
+def test_corte_por_tiempo(metodo, opciones):
+    presupuesto = Presupuesto(tiempo_max=0.0)
+    perm, score, stats = solve(ROOMS, A, metodo=metodo, presupuesto=presupuesto, **opciones)
+    assert stats.stopped_by == "tiempo"
+    _valido_o_none(perm, score, stats)
+
+
+@pytest.mark.parametrize("metodo, opciones", CASOS, ids=IDS)
+def test_corte_por_cancelacion(metodo, opciones):
+    presupuesto = Presupuesto(cancelacion=_cancelado())
+    perm, score, stats = solve(ROOMS, A, metodo=metodo, presupuesto=presupuesto, **opciones)
+    assert stats.stopped_by == "cancelado"
+    _valido_o_none(perm, score, stats)
+
+
+def test_held_karp_cortado_no_devuelve_parcial():
+    perm, score, stats = solve(ROOMS, A, metodo="held_karp",
+                               presupuesto=Presupuesto(nodos_max=1))
+    assert stats.stopped_by == "nodos"
+    assert perm is None and score == -10**9
+
+
+def test_sin_corte_es_optimo():
+    presupuesto = Presupuesto(tiempo_max=60.0, nodos_max=10**9, cancelacion=Cancelacion())
+    _, score, stats = solve(ROOMS[:9], [fila[:9] for fila in A[:9]],
+                            presupuesto=presupuesto)
+    assert stats.stopped_by is None and stats.proven_optimal
+    assert score == solve(ROOMS[:9], [fila[:9] for fila in A[:9]], metodo="held_karp")[1]
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from logica.objetos.punto import Punto, PuntoArray, PuntoVista
+
+
+def test_constructores():
+    assert Punto(1, 2, 3).get_tuple() == (1, 2, 3)
+    assert Punto([[1], [2], [3]]).get_tuple() == (1, 2, 3)
+    assert Punto(np.array([[1.0], [2.0], [3.0]])).get_tuple() == (1.0, 2.0, 3.0)
+    assert Punto.desde_tupla((4, 5, 6)).vector() == [4, 5, 6]
+    with pytest.raises(AttributeError):
+        Punto(1, 2, 3).w = 0
+
+
+@pytest.mark.parametrize("args", [
+    (1, 2),
+    (1, None, 3),
+    (5,),
+    ([1, 2, 3],),
+    ([[1], [2]],),
+    ([[1, 2], [3], [4]],),
+    ("a", 2, 3),
+    ([[1], [2], ["z"]],),
+])
+def test_argumentos_invalidos(args):
+    with pytest.raises(TypeError):
+        Punto(*args)
+
+
+def test_hex_con_centro_invalido(cliente):
+    assert cliente.post("/formas/hex", json={"centro": [[0], [0], [1]], "radio": 1}).status_code == 200
+    assert cliente.post("/formas/hex", json={"centro": [[0], [0]], "radio": 1}).status_code == 422
+
+
+def test_punto_array():
+    puntos = PuntoArray.desde_xyz([0.0, 1.0, 2.0], 5.0, [7.0, 8.0, 9.0])
+    assert len(puntos) == 3 and puntos.y.tolist() == [5.0, 5.0, 5.0]
+
+    vista = puntos[-1]
+    assert isinstance(vista, PuntoVista) and vista.get_tuple() == (2.0, 5.0, 9.0)
+    vista.z = 0.0
+    assert puntos.datos[2, 2] == 0.0
+    with pytest.raises(IndexError):
+        puntos[3]
+
+    movidos = puntos + Punto(1, 1, 1)
+    assert movidos.datos.tolist() == (puntos.datos + 1).tolist()
+    puntos *= 2
+    assert np.asarray(puntos) is puntos.datos and puntos.x.tolist() == [0.0, 2.0, 4.0]
+    assert [p.get_tuple() for p in puntos.tolist()] == [tuple(f) for f in puntos.datos.tolist()]
+    assert PuntoArray(puntos.tolist()).datos.tolist() == puntos.datos.tolist()
+    assert puntos[1:].transformar(np.eye(3) * 2).datos.tolist() == (puntos.datos[1:] * 2).tolist()
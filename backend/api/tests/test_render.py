@@ -0,0 +1,94 @@
+import pytest
+
+from logica.render import MAX_ANILLOS, Diseno, PoolRender
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+def test_preview_png_y_etag(cliente):
+    params = {"anillos": 2, "pixeles": 64}
+    r = cliente.get("/formas/preview", params=params)
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "image/png" and r.content.startswith(PNG)
+    etag = r.headers["etag"]
+
+    # misma imagen: 304 con el ETag, y del cache del renderizador
+    antes = cliente.get("/formas/preview/cache").json()["hits"]
+    assert cliente.get("/formas/preview", params=params, headers={"If-None-Match": etag}).status_code == 304
+    r = cliente.get("/formas/preview", params=params)
+    assert r.headers["etag"] == etag
+    assert cliente.get("/formas/preview/cache").json()["hits"] == antes + 1
+
+    # los campos que la vista no usa no cambian la clave
+    r = cliente.get("/formas/preview", params=dict(params, diametro=5, alto=9, elev=1))
+    assert r.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("params", [
+    {"huella": "domo", "diametro": 6, "vista": "3d", "pixeles": 64},
+    {"huella": "cilindro", "diametro": 3, "longitud": 8, "formato": "svg", "pixeles": 64},
+])
+def test_preview_huellas(cliente, params):
+    r = cliente.get("/formas/preview", params=params)
+    assert r.status_code == 200 and len(r.content) > 0
+
+
+@pytest.mark.parametrize("params", [
+    {"radio": 0},
+    {"alto": -1},
+    {"separacion": -0.5},
+    {"pixeles": 100_000},
+    {"pixeles": 1},
+    {"anillos": -1},
+    {"anillos": MAX_ANILLOS + 1},
+    {"huella": "piramide"},
+    {"vista": "lateral"},
+    {"formato": "jpg"},
+    {"huella": "domo"},
+    {"huella": "domo", "diametro": 0},
+    {"huella": "cilindro", "diametro": 4},
+    {"huella": "domo", "diametro": 1e6},
+])
+def test_preview_invalido(cliente, params):
+    assert cliente.get("/formas/preview", params=params).status_code == 422
+
+
+@pytest.mark.parametrize("opciones", [
+    {"radio": 0},
+    {"alto": float("nan")},
+    {"separacion": -1},
+    {"pixeles": 8},
+    {"anillos": MAX_ANILLOS + 1},
+    {"huella": "domo"},
+    {"huella": "cilindro", "diametro": 3},
+    {"huella": "domo", "diametro": 1e6},
+    {"formato": "gif"},
+])
+def test_diseno_invalido(opciones):
+    with pytest.raises(ValueError):
+        Diseno(**opciones)
+
+
+def test_clave():
+    assert Diseno(radio=1).clave() == Diseno(radio=1.0).clave()
+    assert Diseno(anillos=2).clave() != Diseno(anillos=3).clave()
+    # planta no usa alto ni cámara; 3d sí
+    assert Diseno(alto=1).clave() == Diseno(alto=2, elev=0).clave()
+    assert Diseno(vista="3d", alto=1).clave() != Diseno(vista="3d", alto=2).clave()
+    # domo no usa anillos ni longitud
+    domo = dict(huella="domo", diametro=6)
+    assert Diseno(**domo, anillos=1).clave() == Diseno(**domo, anillos=4, longitud=9).clave()
+
+
+def test_pool_lote():
+    pool = PoolRender(max_workers=2, max_entradas=2)
+    try:
+        disenos = [Diseno(anillos=a, pixeles=32) for a in (0, 1, 2, 1)]
+        imagenes = pool.lote(disenos)
+        assert all(img.startswith(PNG) for img in imagenes)
+        assert imagenes[1] == imagenes[3]
+        assert pool.estadisticas()["entradas"] == 2
+        assert pool.previsualizar(disenos[2])[1] == imagenes[2]
+        assert pool.hits >= 1
+    finally:
+        pool.cerrar()
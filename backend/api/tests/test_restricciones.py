@@ -0,0 +1,134 @@
+import json
+import random
+
+import numpy as np
+import pytest
+
+from logica.libreria.restricciones import GrafoRestricciones
+from logica.objetos.nodo import matriz_adyacencia
+
+SALAS = [f"R{i}" for i in range(10)]
+
+
+def reconstruir(g, rooms=None):
+    """A desde cero con matriz_adyacencia a partir de los pares vigentes del grafo."""
+    rooms = rooms or g.nombres
+    dentro = {g.idx[r] for r in rooms}
+    ceros = [(g.nombres[i], g.nombres[j]) for i, j in g.ceros if {i, j} <= dentro]
+    prefs = {(g.nombres[i], g.nombres[j]): w for (i, j), w in g.prefs.items() if {i, j} <= dentro}
+    return matriz_adyacencia(rooms, ceros, prefs, default_weight=g.default_weight)[0]
+
+
+def test_internado():
+    g = GrafoRestricciones(["c", "a", "b"])
+    assert g.idx == {"c": 0, "a": 1, "b": 2} and len(g) == 3
+    g.agregar_cero("a", "b")
+    g.agregar_preferencia("b", "a", 4)
+    assert g.n == 3 and g.nombres == ["c", "a", "b"]
+    assert [n.id for n in g.nodos] == g.nombres
+
+    abierto = GrafoRestricciones()
+    abierto.agregar_cero("x", "y")
+    abierto.agregar_preferencia("y", "z", 2)
+    abierto.agregar_cero("z", "x")
+    assert abierto.idx == {"x": 0, "y": 1, "z": 2}
+    # la reserva interna crece de más, pero matriz() trae solo las salas internadas
+    assert abierto.matriz()[0].shape == (3, 3)
+
+
+def test_duplicados():
+    g = GrafoRestricciones(SALAS)
+    assert g.agregar_cero("R1", "R2")
+    assert not g.agregar_cero("R2", "R1")
+    assert g.agregar_preferencia("R3", "R4", 2)
+    assert g.agregar_preferencia("R4", "R3", 5)    # reemplaza
+    assert g.ceros == {(1, 2)} and g.prefs == {(3, 4): 5}
+    assert g.duplicados == 2
+    assert g.peso("R3", "R4") == g.peso("R4", "R3") == 5
+
+
+def test_invalidos_estricto():
+    g = GrafoRestricciones(SALAS)
+    with pytest.raises(ValueError, match="consigo misma"):
+        g.agregar_cero("R1", "R1")
+    with pytest.raises(ValueError, match="catálogo"):
+        g.agregar_preferencia("R1", "X", 3)
+    with pytest.raises(ValueError, match="catálogo"):
+        g.matriz(["R1", "X"])
+    assert g.n == len(SALAS) and not g.ceros and not g.prefs
+
+
+def test_invalidos_no_estricto():
+    g = GrafoRestricciones(SALAS, estricto=False)
+    assert not g.agregar_cero("R1", "R1")
+    assert not g.agregar_preferencia("X", "R2", 3)
+    assert g.invalidos == [("R1", "R1", "par consigo misma"),
+                           ("X", "R2", "sala fuera del catálogo")]
+    assert "X" not in g.idx and not g.ceros and not g.prefs
+    # sin catálogo solo el par consigo misma es inválido
+    abierto = GrafoRestricciones(estricto=False)
+    assert abierto.agregar_cero("X", "Y") and not abierto.agregar_cero("Y", "Y")
+
+
+def test_preferencia_pisa_al_cero():
+    g = GrafoRestricciones(SALAS)
+    g.agregar_cero("R1", "R2")
+    g.agregar_preferencia("R1", "R2", 3)
+    assert g.peso("R1", "R2") == 3
+    g.quitar_preferencia("R2", "R1")
+    assert g.peso("R1", "R2") == 0
+    g.quitar_cero("R1", "R2")
+    assert g.peso("R1", "R2") == 1
+    assert not g.quitar_cero("R1", "R2") and not g.quitar_preferencia("R1", "X")
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_edicion_incremental_igual_a_reconstruir(semilla):
+    rng = random.Random(semilla)
+    g = GrafoRestricciones(SALAS, default_weight=2)
+    for _ in range(200):
+        a, b = rng.sample(SALAS, 2)
+        accion = rng.randrange(4)
+        if accion == 0:
+            g.agregar_cero(a, b)
+        elif accion == 1:
+            g.agregar_preferencia(a, b, rng.randint(0, 9))
+        elif accion == 2:
+            g.quitar_cero(a, b)
+        else:
+            g.quitar_preferencia(a, b)
+
+        A, idx = g.matriz()
+        assert np.array_equal(A, reconstruir(g))
+        assert idx == {r: k for k, r in enumerate(SALAS)}
+        # los Nodo siguen a los conjuntos
+        ia, ib = g.idx[a], g.idx[b]
+        par = (min(ia, ib), max(ia, ib))
+        assert g.nodos[ia].prohibido(g.nodos[ib]) == (par in g.ceros)
+        assert g.nodos[ib].preferencia.get(g.nodos[ia]) == g.prefs.get(par)
+
+    sub = rng.sample(SALAS, 6)
+    A, idx = g.matriz(sub)
+    assert np.array_equal(A, reconstruir(g, sub))
+    assert list(idx) == sub
+    assert np.array_equal(g.grafo(sub).toarray(), A)
+
+
+def test_matriz_es_copia():
+    g = GrafoRestricciones(SALAS)
+    A, _ = g.matriz()
+    A[0, 1] = 99
+    assert g.peso("R0", "R1") == 1
+
+
+def test_desde_json(tmp_path):
+    data = {"zero_pairs": [["R1", "R2"], ["R2", "R1"]],
+            "preferences": [{"pair": ["R3", "R4"], "weight": 5}]}
+    ruta, ruta_rooms = tmp_path / "restricciones.json", tmp_path / "rooms.json"
+    ruta.write_text(json.dumps(data), encoding="utf-8")
+    ruta_rooms.write_text(json.dumps(SALAS), encoding="utf-8")
+
+    g = GrafoRestricciones.desde_json(str(ruta), str(ruta_rooms))
+    assert g.nombres == SALAS and g.duplicados == 1
+    assert np.array_equal(g.matriz()[0],
+                          matriz_adyacencia(SALAS, data["zero_pairs"], data["preferences"])[0])
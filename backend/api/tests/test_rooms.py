@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from logica.libreria.restricciones import GrafoRestricciones
+from routers.rooms import DATOS
+
+
+@pytest.fixture(scope="module")
+def formulario():
+    grafo = GrafoRestricciones.desde_json(DATOS / "restricciones.json", DATOS / "rooms.json")
+    return {
+        "nombre": "prueba",
+        "habitat": "luna",
+        "tripulantes": 4,
+        "tipo_geometria": "domo",
+        "geometria": {"cilindro": None, "domo": {"diametro": 8.0}},
+        "prioridad": grafo.nombres[:6],
+        "mantenimiento": False,
+        "soporte_vital": True,
+        "notas": "",
+    }
+
+
+def _esperar(cliente, job_id, limite=60.0):
+    fin = time.monotonic() + limite
+    while True:
+        r = cliente.get(f"/rooms/jobs/{job_id}")
+        assert r.status_code == 200
+        datos = r.json()
+        if datos["estado"] not in ("pendiente", "ejecutando") or time.monotonic() > fin:
+            return datos
+        time.sleep(0.05)
+
+
+def test_trabajo_completo_y_cache(cliente, formulario):
+    r = cliente.post("/rooms/", json=formulario)
+    assert r.status_code == 200
+    job_id = r.json()["id"]
+
+    datos = _esperar(cliente, job_id)
+    assert datos["estado"] == "terminado", datos
+    assert datos["rooms"] == formulario["prioridad"]
+    resultado = datos["resultado"]
+    if resultado["perm"] is not None:
+        assert sorted(resultado["layout"]) == sorted(formulario["prioridad"])
+
+    # la misma instancia se responde del cache, ya terminada
+    r = cliente.post("/rooms/", json=formulario)
+    assert r.json()["estado"] == "terminado"
+    repetido = cliente.get(f"/rooms/jobs/{r.json()['id']}").json()["resultado"]
+    assert repetido["cache"] is True
+    assert repetido["score"] == resultado["score"]
+    assert cliente.get("/rooms/cache").json()["hits"] >= 1
+
+
+def test_cancelar(cliente, formulario):
+    formulario = dict(formulario, prioridad=formulario["prioridad"][::-1][:5])
+    job_id = cliente.post("/rooms/", json=formulario).json()["id"]
+    r = cliente.delete(f"/rooms/jobs/{job_id}")
+    assert r.status_code == 200 and r.json() == {"id": job_id, "cancelado": True}
+    assert _esperar(cliente, job_id)["estado"] in ("cancelado", "terminado")
+
+
+def test_trabajo_inexistente(cliente):
+    assert cliente.get("/rooms/jobs/no-existe").status_code == 404
+    assert cliente.delete("/rooms/jobs/no-existe").status_code == 404
+
+
+def test_formulario_invalido(cliente, formulario):
+    r = cliente.post("/rooms/", json=dict(formulario, habitat="venus"))
+    assert r.status_code == 422
@@ -0,0 +1,22 @@
+import pytest
+
+from logica.algoritmo.genetico.solver import EXACTOS, matriz_aleatoria, solve, verificar_solvers
+
+
+def test_verificar_solvers_exactos():
+    assert verificar_solvers(n_max=8, instancias=20) == 8 * 20
+
+
+@pytest.mark.parametrize("metodo", EXACTOS)
+def test_anillo_imposible(metodo):
+    # R0 no puede tener vecinos: no hay anillo
+    A = matriz_aleatoria(5, 0, p_cero=0.0)
+    for j in range(5):
+        A[0][j] = A[j][0] = 0
+    perm, score, _ = solve([f"R{i}" for i in range(5)], A, metodo=metodo)
+    assert perm is None
+
+
+def test_solver_desconocido():
+    with pytest.raises(ValueError):
+        solve(["R0", "R1"], [[0, 1], [1, 0]], metodo="no_existe")
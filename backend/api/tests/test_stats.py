@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from logica.algoritmo.genetico import Observador, Stats
+from logica.algoritmo.genetico.solver import SOLVERS, matriz_aleatoria, solve
+
+
+def test_stats_ida_y_vuelta(tmp_path):
+    rooms = [f"R{i}" for i in range(7)]
+    _, score, stats = solve(rooms, matriz_aleatoria(7, 2, p_cero=0.1), preprocesar=True)
+    assert stats.depth_expansions and stats.reduccion is not None
+    assert Stats.from_dict(stats.to_dict()) == stats
+
+    ruta = tmp_path / "stats.json"
+    texto = stats.exportar_json(str(ruta), score=score)
+    assert ruta.read_text(encoding="utf-8") == texto
+    datos = json.loads(texto)
+    assert datos.pop("score") == score
+    # las claves de profundidad vuelven a int desde el JSON
+    assert Stats.from_dict(datos) == stats
+
+
+@pytest.mark.parametrize("metodo", sorted(SOLVERS))
+def test_observador(metodo):
+    avisos = []
+    rooms = [f"R{i}" for i in range(8)]
+    A = matriz_aleatoria(8, 1, p_cero=0.1)
+    opciones = {"generaciones": 30, "poblacion": 30} if metodo == "genetico" else {}
+    perm, score, _ = solve(rooms, A, metodo=metodo, observador=Observador(avisos.append, cada_nodos=1),
+                           **opciones)
+    assert avisos and avisos[-1].final
+    assert not any(p.final for p in avisos[:-1])
+    ultimo = avisos[-1]
+    assert ultimo.best_perm == perm and ultimo.best_score == (score if perm is not None else None)
+    assert [p.elapsed for p in avisos] == sorted(p.elapsed for p in avisos)
+    assert 0.0 <= ultimo.prune_rate_zero <= 1.0 and 0.0 <= ultimo.prune_rate_bound <= 1.0
+
+
+def test_observador_cada_nodos():
+    avisos = []
+    observador = Observador(avisos.append, cada_nodos=10)
+    stats = Stats()
+    for k in range(35):
+        stats.nodes_expanded += 1
+        observador.nodo(stats, k, [0])
+    assert [p.nodes_expanded for p in avisos] == [10, 20, 30]
+    assert observador.finalizar(stats, 99, [0]).best_score == 99
+    assert observador.ultimo.final
@@ -0,0 +1,33 @@
+import threading
+
+import pytest
+
+from logica.algoritmo.genetico.programacion_dinamica import solve_held_karp
+from logica.algoritmo.genetico.solver import matriz_aleatoria
+from logica.trabajos import _ejecutar
+
+
+@pytest.mark.parametrize("simetrica", [True, False])
+def test_resultado_es_el_exacto(simetrica):
+    rooms = [f"R{i}" for i in range(7)]
+    for semilla in range(10):
+        A = matriz_aleatoria(7, semilla, p_cero=0.2, simetrica=simetrica)
+        progreso = {}
+        resultado = _ejecutar("t", rooms, A, None, "held_karp", None, progreso, threading.Event())
+        perm, score, _ = solve_held_karp(rooms, A)
+        assert resultado["perm"] == perm
+        assert resultado["score"] == (score if perm is not None else None)
+        assert progreso["t"]["fase"] in ("heuristica", "held_karp")
+
+
+def test_sin_exacto_queda_la_heuristica_verificada():
+    # cancelado antes de empezar: held_karp no da anillo y queda la heurística
+    rooms = [f"R{i}" for i in range(8)]
+    A = matriz_aleatoria(8, 3, p_cero=0.1, simetrica=False)
+    evento = threading.Event()
+    evento.set()
+    resultado = _ejecutar("t", rooms, A, None, "held_karp", None, {}, evento)
+    perm = resultado["perm"]
+    assert perm is not None and perm[0] == 0
+    assert all(A[perm[i]][perm[(i + 1) % 8]] for i in range(8))
+    assert resultado["score"] == sum(A[perm[i]][perm[(i + 1) % 8]] for i in range(8))